@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 
 from app.core.pipeline_service import DoctrineViolationError, run_pipeline
 from app.api.dossier_vote_intent import is_senate_vote_query, extract_bill_id, extract_senator_name
 from app.core.senate_context import SenateContext
+from app.render.encoding import get_encoding
 from app.datasources.senate.errors import SenateDataUnavailableError
 
 router = APIRouter()
@@ -17,6 +18,11 @@ class PipelineRequest(BaseModel):
     story_text: str | None = None
     target: str | None = None
     url: str | None = None
+    # Seconds to wait for the integrity ledger layers; late layers are reported as skipped.
+    ledger_deadline_seconds: float | None = Field(default=None, gt=0)
+    # Drafts encode the receipt for speed; receipt_encoding picks a preset explicitly.
+    draft: bool = False
+    receipt_encoding: str | None = None
 
     @field_validator("mode")
     @classmethod
@@ -26,6 +32,13 @@ class PipelineRequest(BaseModel):
             raise ValueError("mode must not be empty")
         return v
 
+    @field_validator("receipt_encoding")
+    @classmethod
+    def _known_encoding(cls, v: str | None) -> str | None:
+        if v is not None:
+            get_encoding(v)
+        return v
+
 
 
 @router.post("/pipeline")
@@ -113,6 +126,9 @@ def pipeline(req: PipelineRequest, request: Request):
             target=req.target,
             word_count=word_count,
             duration_seconds=duration_seconds,
+            ledger_deadline=req.ledger_deadline_seconds,
+            draft=req.draft,
+            receipt_encoding=req.receipt_encoding,
         )
     except DoctrineViolationError as exc:
         raise HTTPException(
@@ -127,3 +143,23 @@ def pipeline(req: PipelineRequest, request: Request):
         ) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.get("/metrics/llm")
+def llm_metrics():
+    """Per-call-site LLM latency percentiles, token counts and cache hits for this process."""
+    from app.core.llm_telemetry import get_metrics_registry
+
+    return {"ok": True, "calls": get_metrics_registry().snapshot()}
+
+
+@router.get("/ledger/stats/{outlet}")
+def ledger_outlet_stats(outlet: str):
+    """Running per-layer score statistics for *outlet* across all ledger runs."""
+    from app.core import pipeline_service
+    from app.ledger.outlet_stats import get_outlet_stats
+
+    stats = get_outlet_stats(pipeline_service._DIST).get(outlet)
+    if not stats:
+        raise HTTPException(status_code=404, detail=f"No ledger runs recorded for {outlet!r}.")
+    return {"ok": True, "outlet": outlet, "layers": {k: v.to_dict() for k, v in stats.items()}}
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from app.core.token_budget import budget_for, fit_to_budget
+
 AUDIT_SYSTEM_PROMPT = """\
 You are a forensic content auditor. Your role is to analyze media content for factual \
 distortions and intentional manipulation. You are precise, clinical, and direct. \
@@ -25,35 +27,9 @@ backing.",
 }
 
 
-def build_audit_user_prompt(
-    story_text: str,
-    governance_payload: str | None,
-    duration_seconds: float | None,
-    time_pressure_note: str,
-) -> str:
-    governance_section = f"\n\n---\n{governance_payload}\n---" if governance_payload else ""
-
-    duration_context = ""
-    if duration_seconds is not None:
-        minutes = duration_seconds / 60
-        duration_context = (
-            f"\nSource duration: {minutes:.1f} minutes ({int(duration_seconds)} seconds)."
-        )
-
-    metrics_block = "\n".join(
-        f"- {name}: {definition}" for name, definition in _METRIC_DEFINITIONS.items()
-    )
-
-    return f"""\
-Audit the following content.{duration_context}
-Time-pressure instruction: {time_pressure_note}
-{governance_section}
-
-## CONTENT TO AUDIT
-{story_text}
-
-## YOUR TASK
-Score the content on each of the 7 distortion metrics below (1 = minimal, 5 = severe):
+_AUDIT_INSTRUCTIONS = """\
+## DISTORTION METRICS
+Score content on each of the 7 distortion metrics below (1 = minimal, 5 = severe):
 {metrics_block}
 
 For each metric produce:
@@ -65,7 +41,7 @@ Then identify the top 3 distortions (highest scores), produce a clinical_recomme
 in The Valet's voice (one sentence, clinical, slightly weary), and write the episode script.
 
 The episode must fit 30 seconds of vertical video. Adjust language energy per the \
-time-pressure instruction above.
+time-pressure instruction given with the content.
 
 Respond with this exact JSON schema (no other text):
 {{
@@ -92,3 +68,49 @@ Respond with this exact JSON schema (no other text):
     ]
   }}
 }}"""
+
+
+def build_audit_system_prompt(governance_payload: str | None) -> str:
+    """
+    Return the audit system prompt: role, metric definitions, output schema and
+    the voice governance payload.
+
+    Everything here is constant for a given character, so the system prompt is
+    a byte-stable prefix that providers can cache across runs.  Anything that
+    varies per run (content, duration, time pressure) belongs in
+    :func:`build_audit_user_prompt`.
+    """
+    metrics_block = "\n".join(
+        f"- {name}: {definition}" for name, definition in _METRIC_DEFINITIONS.items()
+    )
+    prompt = AUDIT_SYSTEM_PROMPT + "\n" + _AUDIT_INSTRUCTIONS.format(metrics_block=metrics_block)
+    if governance_payload:
+        # The governance budget is the same at every time-pressure level.
+        governance_payload = fit_to_budget(
+            governance_payload, budget_for("FOCUSED").governance_tokens
+        )
+        prompt += f"\n\n---\n{governance_payload}\n---"
+    return prompt
+
+
+def build_audit_user_prompt(
+    story_text: str,
+    duration_seconds: float | None,
+    time_pressure_note: str,
+    time_pressure_level: str = "FOCUSED",
+) -> str:
+    story_text = fit_to_budget(story_text, budget_for(time_pressure_level).story_tokens)
+
+    duration_context = ""
+    if duration_seconds is not None:
+        minutes = duration_seconds / 60
+        duration_context = (
+            f"\nSource duration: {minutes:.1f} minutes ({int(duration_seconds)} seconds)."
+        )
+
+    return f"""\
+Audit the following content against the 7 distortion metrics defined above.{duration_context}
+Time-pressure instruction: {time_pressure_note}
+
+## CONTENT TO AUDIT
+{story_text}"""
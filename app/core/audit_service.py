@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import re
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import Any
 
 from app.core.time_pressure import compute_time_pressure
 
@@ -115,10 +116,24 @@ def _run_llm_audit(
     target: str | None,
     word_count: int,
     duration_seconds: float | None,
+    on_field: Callable[[str, Any], None] | None = None,
 ) -> dict:
-    """LLM-backed audit. Raises NotImplementedError if no LLM provider is configured."""
-    from app.core.audit_prompts import AUDIT_SYSTEM_PROMPT, build_audit_user_prompt
-    from app.core.llm_client import call_llm
+    """
+    LLM-backed audit. Raises NotImplementedError if no LLM provider is configured.
+
+    When *on_field* is given the completion is streamed and ``on_field(key,
+    value)`` is called for each top-level field of the model's JSON (``scores``,
+    ``chosen_core_distortions``, ``clinical_recommendation``, ``episode``) as
+    soon as it has been received in full.
+    """
+    from app.core.audit_prompts import build_audit_system_prompt, build_audit_user_prompt
+    from app.core.json_stream import IncrementalJSONParser, parse_llm_json
+    from app.core.llm_client import (
+        call_llm,
+        call_llm_stream,
+        llm_call_site,
+        llm_time_pressure,
+    )
 
     time_pressure = compute_time_pressure(word_count=word_count, duration_seconds=duration_seconds)
 
@@ -132,23 +147,25 @@ def _run_llm_audit(
     except FileNotFoundError:
         pass
 
+    system_prompt = build_audit_system_prompt(governance_payload)
     user_prompt = build_audit_user_prompt(
         story_text=story_text,
-        governance_payload=governance_payload,
         duration_seconds=duration_seconds,
         time_pressure_note=time_pressure.note,
+        time_pressure_level=time_pressure.level,
     )
 
-    raw = call_llm(system_prompt=AUDIT_SYSTEM_PROMPT, user_prompt=user_prompt)
-
-    # Strip markdown code fences if present
-    raw = raw.strip()
-    if raw.startswith("```"):
-        raw = re.sub(r"^```[a-z]*\n?", "", raw)
-        raw = re.sub(r"\n?```$", "", raw)
-        raw = raw.strip()
-
-    llm_data: dict = json.loads(raw)
+    llm_data: dict
+    with llm_call_site("audit"), llm_time_pressure(time_pressure.level):
+        if on_field is None:
+            raw = call_llm(system_prompt=system_prompt, user_prompt=user_prompt)
+            llm_data = parse_llm_json(raw)
+        else:
+            parser = IncrementalJSONParser()
+            for chunk in call_llm_stream(system_prompt=system_prompt, user_prompt=user_prompt):
+                for key, value in parser.feed(chunk):
+                    on_field(key, value)
+            llm_data = parser.close()
 
     scores: dict[str, dict] = llm_data["scores"]
     chosen: list[str] = llm_data["chosen_core_distortions"]
@@ -212,12 +229,16 @@ def run_audit(
     target: str | None = None,
     word_count: int = 0,
     duration_seconds: float | None = None,
+    on_field: Callable[[str, Any], None] | None = None,
 ) -> dict:
     """
     Run a content distortion audit.
 
     When LLM_PROVIDER is configured, uses an LLM for real analysis.
     Falls back to deterministic stub behavior when no LLM is available.
+
+    *on_field* streams the LLM completion and reports each audit field as it
+    arrives (see :func:`_run_llm_audit`); it is not called for stub audits.
     """
     effective_word_count = word_count or len(story_text.split())
     try:
@@ -227,6 +248,7 @@ def run_audit(
             target=target,
             word_count=effective_word_count,
             duration_seconds=duration_seconds,
+            on_field=on_field,
         )
     except NotImplementedError:
         return _run_stub_audit(mode=mode, story_text=story_text, target=target)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+_CODE_FENCE_OPEN_RE = re.compile(r"^```[a-z]*\n?")
+_CODE_FENCE_CLOSE_RE = re.compile(r"\n?```$")
+
+
+def parse_llm_json(raw: str) -> Any:
+    """Parse a complete LLM completion, stripping a surrounding markdown code fence."""
+    raw = raw.strip()
+    if raw.startswith("```"):
+        raw = _CODE_FENCE_OPEN_RE.sub("", raw)
+        raw = _CODE_FENCE_CLOSE_RE.sub("", raw)
+        raw = raw.strip()
+    return json.loads(raw)
+
+
+class IncrementalJSONParser:
+    """Parse a streamed JSON object and report each top-level member as it completes.
+
+    Feed completion chunks as they arrive; :meth:`feed` returns the
+    ``(key, value)`` pairs of top-level members that became complete with that
+    chunk.  String, object and array values are reported as soon as their
+    closing character arrives; numbers and literals when the following ``,``
+    or ``}`` arrives.  Text before the opening brace (such as a markdown code
+    fence) is ignored.
+
+    Call :meth:`close` once the stream ends to obtain the whole parsed object.
+    """
+
+    def __init__(self) -> None:
+        # Unconsumed tail of the stream; everything before the member currently
+        # being read is dropped once parsed, so memory stays bounded by one member.
+        self._text = ""
+        self._pos = 0
+        self._started = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._phase = "key"  # "key" | "colon" | "value" | "comma"
+        self._key: str = ""
+        self._token_start: int | None = None
+        self.fields: dict[str, Any] = {}
+
+    @property
+    def done(self) -> bool:
+        """True once the closing brace of the top-level object has been seen."""
+        return self._done
+
+    def _emit(self, raw: str, out: list[tuple[str, Any]]) -> None:
+        value = json.loads(raw)
+        self.fields[self._key] = value
+        out.append((self._key, value))
+        self._token_start = None
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        completed: list[tuple[str, Any]] = []
+        if self.done:
+            return completed
+        self._text += chunk
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._phase == "key":
+                        self._key = json.loads(text[self._token_start : i + 1])
+                        self._phase = "colon"
+                    elif self._depth == 1 and self._phase == "value":
+                        self._emit(text[self._token_start : i + 1], completed)
+                        self._phase = "comma"
+                continue
+
+            if not self._started:
+                if c == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if c == '"':
+                self._in_string = True
+                if self._depth == 1 and self._phase in ("key", "value"):
+                    self._token_start = i
+            elif c in "{[":
+                if self._depth == 1 and self._phase == "value":
+                    self._token_start = i
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._phase == "value":
+                    self._emit(text[self._token_start : i + 1], completed)
+                    self._phase = "comma"
+                elif self._depth == 0:
+                    if self._phase == "value" and self._token_start is not None:
+                        self._emit(text[self._token_start : i].strip(), completed)
+                    self._done = True
+                    self._text = ""
+                    self._pos = 0
+                    return completed
+            elif self._depth == 1:
+                if self._phase == "colon" and c == ":":
+                    self._phase = "value"
+                    self._token_start = None
+                elif c == ",":
+                    if self._phase == "value" and self._token_start is not None:
+                        self._emit(text[self._token_start : i].strip(), completed)
+                    self._phase = "key"
+                elif self._phase == "value" and self._token_start is None and not c.isspace():
+                    self._token_start = i
+
+        keep_from = 0
+        if self._started:
+            keep_from = self._token_start if self._token_start is not None else len(text)
+            if self._token_start is not None:
+                self._token_start = 0
+        self._text = text[keep_from:]
+        self._pos = len(text) - keep_from
+        return completed
+
+    def close(self) -> Any:
+        """Return the complete parsed object.
+
+        Raises :class:`json.JSONDecodeError` if the stream did not contain a
+        complete JSON object.
+        """
+        if self._done:
+            return dict(self.fields)
+        if not self._started:
+            return parse_llm_json(self._text)
+        raise json.JSONDecodeError("Unterminated JSON object", self._text, len(self._text))
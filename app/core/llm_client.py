@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import logging
 import os
-from typing import Protocol, runtime_checkable
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Protocol, runtime_checkable
+
+from app.core.llm_telemetry import LLMCallRecord, record_llm_call
+from app.core.token_budget import TokenUsage, estimate_tokens, record_usage
+
+logger = logging.getLogger(__name__)
 
 
 @runtime_checkable
@@ -9,6 +20,11 @@ class LLMClient(Protocol):
     def generate(self, system: str, user: str) -> str: ...
 
 
+@runtime_checkable
+class StreamingLLMClient(LLMClient, Protocol):
+    def stream(self, system: str, user: str) -> Iterator[str]: ...
+
+
 class NullLLMClient:
     """Placeholder LLM client. Replace with a real implementation when LLM is wired."""
 
@@ -19,45 +35,305 @@ class NullLLMClient:
 
 
 class _OpenAIClient:
-    def __init__(self, api_key: str, model: str = "gpt-4o") -> None:
+    def __init__(self, api_key: str, model: str = "gpt-4o", base_url: str | None = None) -> None:
         import openai  # type: ignore[import-untyped]
 
-        self._client = openai.OpenAI(api_key=api_key)
-        self._model = model
+        # HTTP requests made by this client, including SDK retries.
+        self.attempts = 0
+        self._client = openai.OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=openai.DefaultHttpxClient(event_hooks={"request": [self._count_attempt]}),
+        )
+        self.model = model
+        self.last_usage: tuple[int, int] | None = None
+        self.last_cached_tokens = 0
+
+    def _count_attempt(self, request: Any) -> None:
+        self.attempts += 1
+
+    def _record_usage(self, usage: Any) -> None:
+        # OpenAI caches prompt prefixes automatically; hits are reported per call.
+        self.last_usage = (usage.prompt_tokens, usage.completion_tokens)
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.last_cached_tokens = (getattr(details, "cached_tokens", None) or 0) if details else 0
 
     def generate(self, system: str, user: str) -> str:
         response = self._client.chat.completions.create(
-            model=self._model,
+            model=self.model,
             messages=[
                 {"role": "system", "content": system},
                 {"role": "user", "content": user},
             ],
             temperature=0.3,
         )
+        if response.usage is not None:
+            self._record_usage(response.usage)
         return response.choices[0].message.content or ""
 
+    def stream(self, system: str, user: str) -> Iterator[str]:
+        chunks = self._client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=0.3,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        for chunk in chunks:
+            if chunk.usage is not None:
+                self._record_usage(chunk.usage)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
 
 class _AnthropicClient:
-    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022") -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-3-5-sonnet-20241022",
+        base_url: str | None = None,
+    ) -> None:
         import anthropic  # type: ignore[import-untyped]
 
-        self._client = anthropic.Anthropic(api_key=api_key)
-        self._model = model
+        # HTTP requests made by this client, including SDK retries.
+        self.attempts = 0
+        self._client = anthropic.Anthropic(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=anthropic.DefaultHttpxClient(
+                event_hooks={"request": [self._count_attempt]}
+            ),
+        )
+        self.model = model
+        self.last_usage: tuple[int, int] | None = None
+        self.last_cached_tokens = 0
+
+    def _count_attempt(self, request: Any) -> None:
+        self.attempts += 1
+
+    @staticmethod
+    def _system_blocks(system: str) -> list[dict]:
+        # System prompts hold only per-stage constants, so mark the whole block
+        # as a cacheable prefix.  Prompts below the provider's minimum
+        # cacheable length are simply not cached.
+        return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+    def _record_usage(self, usage: Any) -> None:
+        # input_tokens excludes tokens read from or written to the prompt cache.
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        self.last_usage = (usage.input_tokens + cache_read + cache_write, usage.output_tokens)
+        self.last_cached_tokens = cache_read
 
     def generate(self, system: str, user: str) -> str:
         message = self._client.messages.create(
-            model=self._model,
+            model=self.model,
             max_tokens=4096,
-            system=system,
+            system=self._system_blocks(system),
             messages=[{"role": "user", "content": user}],
         )
+        self._record_usage(message.usage)
         block = message.content[0]
         return block.text if hasattr(block, "text") else str(block)
 
+    def stream(self, system: str, user: str) -> Iterator[str]:
+        with self._client.messages.stream(
+            model=self.model,
+            max_tokens=4096,
+            system=self._system_blocks(system),
+            messages=[{"role": "user", "content": user}],
+        ) as events:
+            yield from events.text_stream
+            message = events.get_final_message()
+        self._record_usage(message.usage)
+
+
+# Output tokens reserved against the tokens-per-minute budget for every call.
+_OUTPUT_TOKEN_RESERVE = 1024
+
+
+_CALL_SITE: ContextVar[str] = ContextVar("llm_call_site", default="unknown")
+
+
+@contextmanager
+def llm_call_site(name: str) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to the pipeline stage *name*."""
+    token = _CALL_SITE.set(name)
+    try:
+        yield
+    finally:
+        _CALL_SITE.reset(token)
+
+
+_TIME_PRESSURE: ContextVar[str | None] = ContextVar("llm_time_pressure", default=None)
+
+
+@contextmanager
+def llm_time_pressure(level: str) -> Iterator[None]:
+    """Route LLM calls made inside the block for the TimePressure *level*."""
+    token = _TIME_PRESSURE.set(level)
+    try:
+        yield
+    finally:
+        _TIME_PRESSURE.reset(token)
+
+
+def configured_provider() -> str:
+    """The ``LLM_PROVIDER`` name, lower-cased; empty when no provider is configured."""
+    return os.environ.get("LLM_PROVIDER", "").strip().lower()
+
+
+# ── Model routing ──────────────────────────────────────────────────────────────
+
+# Models per provider and tier.  Override with {PROVIDER}_MODEL_SMALL / _LARGE.
+_MODEL_TIERS: dict[str, dict[str, str]] = {
+    "openai": {"small": "gpt-4o-mini", "large": "gpt-4o"},
+    "anthropic": {"small": "claude-3-5-haiku-20241022", "large": "claude-3-5-sonnet-20241022"},
+    "standin": {"small": "standin-small", "large": "standin-large"},
+}
+
+# Outlet-only ledger layers: short prompts, no content to read.
+_SMALL_SITES = frozenset({"ledger.ownership", "ledger.revenue"})
+# The But-If script is written in a character voice and always gets the large model.
+_LARGE_SITES = frozenset({"but_if"})
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    call_site: str
+    time_pressure: str | None
+    tier: str
+    model: str
+
+
+def _route_tier(call_site: str, time_pressure: str | None) -> str:
+    if call_site in _SMALL_SITES:
+        return "small"
+    if call_site in _LARGE_SITES:
+        return "large"
+    if call_site.startswith("ledger."):
+        # Content layers: a small model is enough until the input gets long.
+        return "large" if time_pressure in ("PRESSURED", "CRITICAL") else "small"
+    if call_site == "audit":
+        # A short CALM audit is cheap to get right; everything else gets the large model.
+        return "small" if time_pressure == "CALM" else "large"
+    return "large"
+
+
+def _route_overrides() -> dict[str, str]:
+    # LLM_ROUTES="audit=small,ledger.pattern=large" pins the tier of individual call sites.
+    overrides: dict[str, str] = {}
+    for item in os.environ.get("LLM_ROUTES", "").split(","):
+        site, _, tier = item.partition("=")
+        if tier.strip() in ("small", "large"):
+            overrides[site.strip()] = tier.strip()
+    return overrides
+
+
+def route_model(provider: str, call_site: str, time_pressure: str | None) -> RouteDecision | None:
+    """
+    Choose the model for an LLM call from its call site and TimePressure level.
+
+    Returns ``None`` for providers without a routing table, in which case the
+    client's own default model is used.
+    """
+    tiers = _MODEL_TIERS.get(provider)
+    if tiers is None:
+        return None
+    tier = _route_overrides().get(call_site) or _route_tier(call_site, time_pressure)
+    model = os.environ.get(f"{provider.upper()}_MODEL_{tier.upper()}", "").strip() or tiers[tier]
+    return RouteDecision(call_site, time_pressure, tier, model)
+
+
+def routed_model(call_site: str | None = None) -> str:
+    """The model a call from *call_site* (default: the current one) would be routed to now.
+
+    For keying cached LLM results; ``"default"`` when the provider has no routing table.
+    """
+    decision = route_model(
+        configured_provider(), call_site or _CALL_SITE.get(), _TIME_PRESSURE.get()
+    )
+    return decision.model if decision else "default"
+
+
+def _apply_route(client: LLMClient) -> RouteDecision | None:
+    decision = route_model(configured_provider(), _CALL_SITE.get(), _TIME_PRESSURE.get())
+    if decision is not None and hasattr(client, "model"):
+        client.model = decision.model
+    return decision
+
+
+def _log_call(
+    decision: RouteDecision | None, latency_s: float, first_chunk_s: float | None = None
+) -> None:
+    logger.info(
+        "LLM call site=%s time_pressure=%s tier=%s model=%s latency=%.3fs%s",
+        _CALL_SITE.get(),
+        _TIME_PRESSURE.get(),
+        decision.tier if decision else "-",
+        decision.model if decision else "default",
+        latency_s,
+        f" first_chunk={first_chunk_s:.3f}s" if first_chunk_s is not None else "",
+    )
+
+
+def _finish_call(
+    client: LLMClient,
+    decision: RouteDecision | None,
+    started: float,
+    usage: tuple[int, int] | None,
+    estimated_input: int,
+    output_chars: int,
+    streamed: bool,
+    first_chunk_s: float | None = None,
+    error: str | None = None,
+) -> None:
+    """Log, account and record telemetry for one finished (or failed) LLM call."""
+    latency = time.perf_counter() - started
+    _log_call(decision, latency, first_chunk_s)
+
+    cached = getattr(client, "last_cached_tokens", 0) if usage is not None else 0
+    if usage is not None:
+        input_tokens, output_tokens = usage
+    else:
+        input_tokens, output_tokens = estimated_input, (output_chars + 3) // 4
+    if error is None:
+        record_usage(
+            TokenUsage(
+                _CALL_SITE.get(),
+                input_tokens,
+                output_tokens,
+                estimated=usage is None,
+                cached_input_tokens=cached,
+            )
+        )
+
+    record_llm_call(
+        LLMCallRecord(
+            timestamp=time.time(),
+            call_site=_CALL_SITE.get(),
+            provider=configured_provider(),
+            model=decision.model if decision else str(getattr(client, "model", "default")),
+            time_pressure=_TIME_PRESSURE.get(),
+            latency_s=latency,
+            first_chunk_s=first_chunk_s,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cached_input_tokens=cached,
+            cache="unknown" if usage is None else ("hit" if cached else "miss"),
+            retries=max(0, getattr(client, "attempts", 1) - 1),
+            streamed=streamed,
+            error=error,
+        )
+    )
+
 
 def get_llm_client() -> LLMClient:
     """Return a configured LLM client based on environment variables."""
-    provider = os.environ.get("LLM_PROVIDER", "").strip().lower()
+    provider = configured_provider()
     if provider == "openai":
         api_key = os.environ.get("OPENAI_API_KEY", "")
         if not api_key:
@@ -68,8 +344,14 @@ def get_llm_client() -> LLMClient:
         if not api_key:
             raise OSError("ANTHROPIC_API_KEY is not set.")
         return _AnthropicClient(api_key=api_key)
+    if provider == "standin":
+        # Local stand-in server (app.core.llm_standin) for offline load testing.
+        base_url = os.environ.get("LLM_STANDIN_URL", "http://127.0.0.1:8765").rstrip("/")
+        if os.environ.get("LLM_STANDIN_API", "openai").strip().lower() == "anthropic":
+            return _AnthropicClient(api_key="standin", model="standin-large", base_url=base_url)
+        return _OpenAIClient(api_key="standin", model="standin-large", base_url=f"{base_url}/v1")
     raise NotImplementedError(
-        "No LLM provider configured. Set LLM_PROVIDER to 'openai' or 'anthropic'."
+        "No LLM provider configured. Set LLM_PROVIDER to 'openai', 'anthropic' or 'standin'."
     )
 
 
@@ -78,6 +360,91 @@ def call_llm(system_prompt: str, user_prompt: str) -> str:
     Call the configured LLM.
     Reads LLM_PROVIDER, OPENAI_API_KEY, and ANTHROPIC_API_KEY from environment.
     Raises NotImplementedError if no provider is configured.
+
+    Calls are admitted through the provider's shared rate limiter (see
+    :mod:`app.core.rate_limiter`), so concurrent callers queue locally instead
+    of tripping provider rate limits.  Input/output token counts are recorded
+    against the current :func:`llm_call_site` (see
+    :func:`app.core.token_budget.usage_scope`).
+
+    The model is chosen per call site and :func:`llm_time_pressure` level by
+    :func:`route_model`; each decision is logged with the call's latency.  Every
+    call, including failed ones, is recorded in :mod:`app.core.llm_telemetry`.
     """
+    from app.core.rate_limiter import get_rate_limiter
+
     client = get_llm_client()
-    return client.generate(system=system_prompt, user=user_prompt)
+    decision = _apply_route(client)
+    limiter = get_rate_limiter(configured_provider())
+    estimated_input = estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+    reserved = estimated_input + _OUTPUT_TOKEN_RESERVE
+    lease_id = limiter.acquire(reserved)
+    usage: tuple[int, int] | None = None
+    text = ""
+    error: str | None = None
+    started = time.perf_counter()
+    try:
+        text = client.generate(system=system_prompt, user=user_prompt)
+        usage = getattr(client, "last_usage", None)
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        limiter.release(lease_id, reserved, used_tokens=sum(usage) if usage else None)
+        _finish_call(
+            client, decision, started, usage, estimated_input, len(text), False, error=error
+        )
+    return text
+
+
+def call_llm_stream(system_prompt: str, user_prompt: str) -> Iterator[str]:
+    """
+    Stream a completion from the configured LLM as text chunks.
+
+    Same provider selection, rate limiting, routing, token accounting and
+    telemetry as :func:`call_llm`.  Clients without streaming support yield
+    their whole completion as a single chunk.  The limiter slot is held until
+    the generator is exhausted or closed.
+    """
+    from app.core.rate_limiter import get_rate_limiter
+
+    client = get_llm_client()
+    decision = _apply_route(client)
+    limiter = get_rate_limiter(configured_provider())
+    estimated_input = estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+    reserved = estimated_input + _OUTPUT_TOKEN_RESERVE
+    lease_id = limiter.acquire(reserved)
+    usage: tuple[int, int] | None = None
+    output_chars = 0
+    error: str | None = None
+    started = time.perf_counter()
+    first_chunk: float | None = None
+    try:
+        if isinstance(client, StreamingLLMClient):
+            for chunk in client.stream(system=system_prompt, user=user_prompt):
+                if first_chunk is None:
+                    first_chunk = time.perf_counter() - started
+                output_chars += len(chunk)
+                yield chunk
+        else:
+            text = client.generate(system=system_prompt, user=user_prompt)
+            output_chars = len(text)
+            yield text
+        usage = getattr(client, "last_usage", None)
+    except BaseException as exc:
+        # Includes GeneratorExit when the consumer stops reading early.
+        error = type(exc).__name__
+        raise
+    finally:
+        limiter.release(lease_id, reserved, used_tokens=sum(usage) if usage else None)
+        _finish_call(
+            client,
+            decision,
+            started,
+            usage,
+            estimated_input,
+            output_chars,
+            True,
+            first_chunk_s=first_chunk,
+            error=error,
+        )
@@ -0,0 +1,446 @@
+"""
+Local stand-in for the OpenAI and Anthropic chat APIs.
+
+Serves ``POST /v1/chat/completions`` (OpenAI shape) and ``POST /v1/messages``
+(Anthropic shape), both with optional SSE streaming, and answers every prompt
+with schema-valid JSON for the stage that sent it: the content audit, an
+integrity-ledger layer, or the But-If damage estimate.  Response content is
+deterministic for a given prompt and seed; latency, error rate and response
+length are configurable, so the pipeline can be load-tested offline with real
+HTTP, real SDK clients and real retries.
+
+Point the pipeline at it with ``LLM_PROVIDER=standin`` and ``LLM_STANDIN_URL``
+(see :func:`app.core.llm_client.get_llm_client`); run it with
+``python tools/llm_standin.py``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from app.core.audit_prompts import _METRIC_DEFINITIONS
+from app.core.token_budget import estimate_tokens
+
+# Characters per streamed chunk; roughly four tokens.
+_STREAM_CHUNK_CHARS = 16
+# Substrings identifying small-tier model names.
+_SMALL_MODEL_MARKERS = ("small", "mini", "haiku")
+# Leading system-prompt characters that identify the stage for prefix tracking.
+_PREFIX_KEY_CHARS = 64
+
+
+@dataclass(frozen=True)
+class StandinConfig:
+    # Median end-to-end latency per request.
+    latency_ms: float = 800.0
+    # Log-normal sigma of the latency distribution; 0 makes latency fixed.
+    latency_sigma: float = 0.35
+    # Latency multiplier for small-tier models (see app.core.llm_client.route_model).
+    small_model_latency_factor: float = 0.4
+    # Streaming only: share of the latency spent before the first chunk.
+    first_token_share: float = 0.3
+    # Probability that a request fails with *error_status* instead of answering.
+    error_rate: float = 0.0
+    error_status: int = 500
+    # Filler tokens appended to every completion to simulate long generations.
+    extra_output_tokens: int = 0
+    # System prompts shorter than this are never reported as cached, as with the
+    # real providers.
+    min_cacheable_tokens: int = 1024
+    seed: int = 0
+
+
+# ── Response content ───────────────────────────────────────────────────────────
+
+
+def _classify(system: str) -> str:
+    if "forensic content auditor" in system:
+        return "audit"
+    if "Perimeter Walker" in system:
+        return "but_if"
+    return "ledger"
+
+
+def _shots(rng: random.Random, lines: list[str]) -> list[dict]:
+    return [
+        {"index": i, "text": text, "duration_s": rng.choice([3, 4])}
+        for i, text in enumerate(lines, start=1)
+    ]
+
+
+def _audit_body(rng: random.Random) -> dict:
+    scores = {
+        metric: {
+            "score": rng.randint(1, 5),
+            "why": f"Stand-in assessment of {metric.replace('_', ' ')}.",
+            "metaphor": "A receipt printed in disappearing ink.",
+        }
+        for metric in _METRIC_DEFINITIONS
+    }
+    chosen = sorted(scores, key=lambda m: -scores[m]["score"])[:3]
+    return {
+        "scores": scores,
+        "chosen_core_distortions": chosen,
+        "clinical_recommendation": "Observed. Filed. Discharge when ready.",
+        "episode": {
+            "hook": "Your story has been processed.",
+            "final_line": "The lobby never forgets.",
+            "cta": "Type PROCESSED to acknowledge.",
+            "shots": _shots(rng, [f"Distortion: {m}." for m in chosen] + ["Receipt issued."]),
+        },
+    }
+
+
+def _ledger_body(rng: random.Random) -> dict:
+    return {
+        "score": round(rng.uniform(0.05, 0.95), 2),
+        "confidence": round(rng.uniform(0.4, 0.9), 2),
+        "notes": "Stand-in layer analysis; no live data consulted.",
+    }
+
+
+def _but_if_body(rng: random.Random) -> dict:
+    return {
+        "scenario": "If the claim held, the consequences would compound quietly.",
+        "stakes": f"Estimated exposure: {rng.randint(50, 900)}k readers.",
+        "episode": {
+            "hook": "But if it were true — follow the line.",
+            "final_line": "The perimeter holds. For now.",
+            "cta": "Trace the consequence.",
+            "shots": _shots(
+                rng,
+                ["The claim.", "The first consequence.", "The second.", "The perimeter."],
+            ),
+        },
+    }
+
+
+_BODIES = {"audit": _audit_body, "ledger": _ledger_body, "but_if": _but_if_body}
+
+
+def build_completion(system: str, user: str, config: StandinConfig) -> str:
+    """Return the stand-in completion text for a prompt.
+
+    The result depends only on the prompt and ``config.seed``.
+    """
+    digest = hashlib.sha256(f"{config.seed}\0{system}\0{user}".encode()).digest()
+    rng = random.Random(int.from_bytes(digest[:8], "big"))
+    body: dict[str, Any] = _BODIES[_classify(system)](rng)
+    if config.extra_output_tokens:
+        # Unknown top-level keys are ignored by every consumer.
+        body["padding"] = "lorem " * ((config.extra_output_tokens * 4 + 5) // 6)
+    return json.dumps(body)
+
+
+# ── HTTP server ────────────────────────────────────────────────────────────────
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: StandinConfig) -> None:
+        super().__init__(address, _Handler)
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "errors": 0,
+            "streamed": 0,
+            "small_model_requests": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "prefix_changes": 0,
+        }
+        # Opening characters of each system prompt -> hash of the full prompt.
+        self._prefixes: dict[str, str] = {}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def draw(self, model: str) -> tuple[float, bool]:
+        """Sample (latency in seconds, whether to fail) for one request to *model*."""
+        cfg = self.config
+        small = any(marker in model for marker in _SMALL_MODEL_MARKERS)
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["small_model_requests"] += small
+            jitter = self._rng.lognormvariate(0.0, cfg.latency_sigma) if cfg.latency_sigma else 1
+            fail = self._rng.random() < cfg.error_rate
+            if fail:
+                self.stats["errors"] += 1
+        scale = cfg.small_model_latency_factor if small else 1.0
+        return cfg.latency_ms / 1000.0 * jitter * scale, fail
+
+    def cached_tokens(self, system: str) -> int:
+        """Simulate the provider prompt cache for *system*; return the cached token count.
+
+        System prompts are keyed by their opening characters, so a stage whose
+        prompt changes between runs (anything that breaks the byte-stable
+        prefix) is counted under ``prefix_changes``.
+        """
+        tokens = estimate_tokens(system)
+        digest = hashlib.sha256(system.encode()).hexdigest()
+        key = system[:_PREFIX_KEY_CHARS]
+        with self._lock:
+            previous = self._prefixes.get(key)
+            self._prefixes[key] = digest
+            if previous is not None and previous != digest:
+                self.stats["prefix_changes"] += 1
+            if tokens < self.config.min_cacheable_tokens:
+                return 0
+            if previous == digest:
+                self.stats["cache_hits"] += 1
+                return tokens
+            self.stats["cache_misses"] += 1
+            return 0
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StandinServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_stream(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def _send_event(self, data: dict | str, event: str | None = None) -> None:
+        frame = f"event: {event}\n" if event else ""
+        frame += f"data: {data if isinstance(data, str) else json.dumps(data)}\n\n"
+        self.wfile.write(frame.encode())
+        self.wfile.flush()
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            with self.server._lock:
+                stats = dict(self.server.stats)
+            self._send_json(200, stats)
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.endswith("/chat/completions"):
+            self._openai(request)
+        elif self.path.endswith("/messages"):
+            self._anthropic(request)
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def _prepare(self, system: str, user: str, model: str) -> tuple[str, float, bool]:
+        latency, fail = self.server.draw(model)
+        return build_completion(system, user, self.server.config), latency, fail
+
+    def _chunks(self, text: str, latency: float) -> list[tuple[str, float]]:
+        """Split *text* into stream chunks, each paired with the delay before it."""
+        pieces = [
+            text[i : i + _STREAM_CHUNK_CHARS] for i in range(0, len(text), _STREAM_CHUNK_CHARS)
+        ]
+        first = latency * self.server.config.first_token_share
+        rest = (latency - first) / max(1, len(pieces) - 1)
+        return [(piece, first if i == 0 else rest) for i, piece in enumerate(pieces)]
+
+    def _error(self, latency: float, payload: dict) -> None:
+        time.sleep(latency * self.server.config.first_token_share)
+        status = self.server.config.error_status
+        self._send_json(status, payload, {"retry-after": "0"} if status == 429 else None)
+
+    # ── OpenAI: POST /v1/chat/completions ──────────────────────────────────────
+
+    def _openai(self, request: dict) -> None:
+        messages = request.get("messages", [])
+        system = "".join(str(m.get("content", "")) for m in messages if m.get("role") == "system")
+        user = "".join(str(m.get("content", "")) for m in messages if m.get("role") == "user")
+        text, latency, fail = self._prepare(system, user, str(request.get("model", "")))
+        if fail:
+            status = self.server.config.error_status
+            kind = "rate_limit_exceeded" if status == 429 else "server_error"
+            self._error(latency, {"error": {"message": "Stand-in failure", "type": kind}})
+            return
+
+        model = request.get("model", "standin")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        usage: dict[str, Any] = {
+            "prompt_tokens": estimate_tokens(system) + estimate_tokens(user),
+            "completion_tokens": estimate_tokens(text),
+            # OpenAI caches prompt prefixes automatically.
+            "prompt_tokens_details": {"cached_tokens": self.server.cached_tokens(system)},
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if not request.get("stream"):
+            time.sleep(latency)
+            self._send_json(
+                200,
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": text},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                },
+            )
+            return
+
+        self.server.count("streamed")
+        self._start_stream()
+
+        def chunk(delta: dict, finish_reason: str | None) -> dict:
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        for i, (piece, delay) in enumerate(self._chunks(text, latency)):
+            time.sleep(delay)
+            delta = {"role": "assistant", "content": piece} if i == 0 else {"content": piece}
+            self._send_event(chunk(delta, None))
+        self._send_event(chunk({}, "stop"))
+        if (request.get("stream_options") or {}).get("include_usage"):
+            final = chunk({}, None)
+            final["choices"] = []
+            final["usage"] = usage
+            self._send_event(final)
+        self._send_event("[DONE]")
+
+    # ── Anthropic: POST /v1/messages ───────────────────────────────────────────
+
+    def _anthropic(self, request: dict) -> None:
+        system_field = request.get("system", "")
+        cache_marked = False
+        if isinstance(system_field, list):
+            system = "".join(block.get("text", "") for block in system_field)
+            cache_marked = any(block.get("cache_control") for block in system_field)
+        else:
+            system = str(system_field)
+        user = ""
+        for message in request.get("messages", []):
+            content = message.get("content", "")
+            if isinstance(content, list):
+                content = "".join(block.get("text", "") for block in content)
+            user += str(content)
+        text, latency, fail = self._prepare(system, user, str(request.get("model", "")))
+        if fail:
+            status = self.server.config.error_status
+            kind = "rate_limit_error" if status == 429 else "api_error"
+            self._error(
+                latency,
+                {"type": "error", "error": {"type": kind, "message": "Stand-in failure"}},
+            )
+            return
+
+        # Anthropic only caches prefixes explicitly marked with cache_control, and
+        # reports cached tokens separately from (not included in) input_tokens.
+        input_tokens = estimate_tokens(system) + estimate_tokens(user)
+        cache_read = cache_write = 0
+        if cache_marked:
+            cache_read = self.server.cached_tokens(system)
+            if (
+                not cache_read
+                and estimate_tokens(system) >= self.server.config.min_cacheable_tokens
+            ):
+                cache_write = estimate_tokens(system)
+        message = {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": request.get("model", "standin"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {
+                "input_tokens": input_tokens - cache_read - cache_write,
+                "cache_read_input_tokens": cache_read,
+                "cache_creation_input_tokens": cache_write,
+                "output_tokens": estimate_tokens(text),
+            },
+        }
+
+        if not request.get("stream"):
+            time.sleep(latency)
+            self._send_json(200, message)
+            return
+
+        self.server.count("streamed")
+        self._start_stream()
+        start = dict(message, content=[], stop_reason=None)
+        start["usage"] = dict(message["usage"], output_tokens=1)
+        self._send_event({"type": "message_start", "message": start}, "message_start")
+        self._send_event(
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+            "content_block_start",
+        )
+        for piece, delay in self._chunks(text, latency):
+            time.sleep(delay)
+            self._send_event(
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": piece},
+                },
+                "content_block_delta",
+            )
+        self._send_event({"type": "content_block_stop", "index": 0}, "content_block_stop")
+        self._send_event(
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": message["usage"]["output_tokens"]},
+            },
+            "message_delta",
+        )
+        self._send_event({"type": "message_stop"}, "message_stop")
+
+
+def make_server(
+    config: StandinConfig | None = None, host: str = "127.0.0.1", port: int = 0
+) -> StandinServer:
+    """Create (but do not start) a stand-in server; ``port=0`` picks a free port."""
+    return StandinServer((host, port), config or StandinConfig())
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Latency samples kept per call site in the in-process registry.
+_MAX_SAMPLES = 10_000
+_PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class LLMCallRecord:
+    timestamp: float
+    call_site: str
+    provider: str
+    model: str
+    time_pressure: str | None
+    latency_s: float
+    # Streaming calls only: time until the first chunk arrived.
+    first_chunk_s: float | None
+    input_tokens: int
+    output_tokens: int
+    cached_input_tokens: int
+    # "hit" / "miss" for the provider prompt-prefix cache, "unknown" without usage data.
+    cache: str
+    retries: int
+    streamed: bool
+    # Exception class name when the call failed, else None.
+    error: str | None = None
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the *pct*-th percentile of *values* with linear interpolation."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_calls(records: Iterable[LLMCallRecord]) -> dict[str, dict]:
+    """Aggregate call records per call site: counts, latency percentiles, tokens, cache hits."""
+    grouped: dict[str, list[LLMCallRecord]] = {}
+    for record in records:
+        grouped.setdefault(record.call_site, []).append(record)
+
+    summary: dict[str, dict] = {}
+    for site in sorted(grouped):
+        calls = grouped[site]
+        latencies = [c.latency_s for c in calls]
+        with_usage = [c for c in calls if c.cache != "unknown"]
+        stage: dict = {
+            "calls": len(calls),
+            "errors": sum(c.error is not None for c in calls),
+            "retries": sum(c.retries for c in calls),
+            "models": sorted({c.model for c in calls}),
+            "mean_s": sum(latencies) / len(latencies),
+        }
+        for pct in _PERCENTILES:
+            stage[f"p{pct}_s"] = percentile(latencies, pct)
+        stage["input_tokens"] = sum(c.input_tokens for c in calls)
+        stage["output_tokens"] = sum(c.output_tokens for c in calls)
+        stage["cached_input_tokens"] = sum(c.cached_input_tokens for c in calls)
+        stage["cache_hit_rate"] = (
+            sum(c.cache == "hit" for c in with_usage) / len(with_usage) if with_usage else None
+        )
+        summary[site] = stage
+    return summary
+
+
+class MetricsRegistry:
+    """Thread-safe in-process store of recent LLM call records."""
+
+    def __init__(self, max_samples: int = _MAX_SAMPLES) -> None:
+        self._lock = threading.Lock()
+        self._max_samples = max_samples
+        self._records: dict[str, deque[LLMCallRecord]] = {}
+
+    def add(self, record: LLMCallRecord) -> None:
+        with self._lock:
+            samples = self._records.get(record.call_site)
+            if samples is None:
+                samples = self._records[record.call_site] = deque(maxlen=self._max_samples)
+            samples.append(record)
+
+    def records(self) -> list[LLMCallRecord]:
+        with self._lock:
+            return [r for samples in self._records.values() for r in samples]
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-call-site summary of the recorded calls (see :func:`summarize_calls`)."""
+        return summarize_calls(self.records())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+_REGISTRY = MetricsRegistry()
+_SINK_LOCK = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide :class:`MetricsRegistry`."""
+    return _REGISTRY
+
+
+def record_llm_call(record: LLMCallRecord) -> None:
+    """Add *record* to the registry and append it to the JSONL sink, if configured.
+
+    ``LLM_TELEMETRY_PATH`` names the JSONL file; several processes may append
+    to the same file.
+    """
+    _REGISTRY.add(record)
+    path = os.environ.get("LLM_TELEMETRY_PATH", "").strip()
+    if not path:
+        return
+    line = json.dumps(asdict(record), ensure_ascii=False) + "\n"
+    sink = Path(path)
+    with _SINK_LOCK:
+        sink.parent.mkdir(parents=True, exist_ok=True)
+        with sink.open("a", encoding="utf-8") as fh:
+            fh.write(line)
+
+
+def load_call_records(path: Path) -> list[LLMCallRecord]:
+    """Read call records from a JSONL sink file, skipping malformed lines."""
+    records: list[LLMCallRecord] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            records.append(LLMCallRecord(**json.loads(line)))
+        except (json.JSONDecodeError, TypeError):
+            continue
+    return records
@@ -3,15 +3,17 @@ from __future__ import annotations
 import dataclasses
 import hashlib
 import json
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from app.core.audit_service import run_audit
+from app.core.audit_service import _slug, run_audit
 from app.core.epistemic import build_epistemic_block, derive_data_completeness
 from app.core.internal_audit import run_internal_audit
 from app.core.language_constraints import enforce_language_constraints
+from app.core.llm_client import llm_time_pressure
 from app.core.state_store import (
     _MAX_SCORE_VALUE,
     build_continuity_preamble,
@@ -22,13 +24,20 @@ from app.core.state_store import (
     save_state,
     update_mood,
 )
+from app.core.time_pressure import compute_time_pressure
+from app.core.token_budget import summarize_usage, usage_scope
 from app.doctrine.contract import build_missing_data_disclosure, validate_report_contract
 from app.doctrine.guard import DoctrineViolation, enforce_language_constraints
+from app.doctrine.patterns import DoctrinePatternSet, current_pattern_set
 from app.epistemic.enforcer import build_epistemic_block
 from app.escrow.signing import sign_receipt
 from app.internal_audit import build_internal_audit_block
+from app.ledger.history import get_ledger_history
+from app.ledger.outlet_stats import get_outlet_stats
+from app.ledger.pattern_engine import PatternEngine, get_pattern_engine
 from app.ledger.scoring import run_integrity_ledger
-from app.render.receipt import render_receipt_from_audit
+from app.render.encoding import DEFAULT_ENCODING, DRAFT_ENCODING, get_encoding
+from app.render.receipt import render_receipt
 from app.render.video import render_video_from_audit
 from app.voice.governance_loader import load_voice_governance
 
@@ -49,6 +58,7 @@ class DoctrineViolationError(ValueError):
 class _ArticleInput:
     outlet: str
     id: str
+    pattern_engine: PatternEngine | None = None
 
 
 def _collect_publish_surfaces(audit: dict[str, Any]) -> dict[str, str]:
@@ -81,8 +91,16 @@ def _collect_publish_surfaces(audit: dict[str, Any]) -> dict[str, str]:
     return surfaces
 
 
-def _enforce_all_surfaces(audit: dict[str, Any]) -> tuple[list[DoctrineViolation], list]:
-    """Run language constraints over every publish surface.
+# Surfaces known before any audit work; run_pipeline checks these up front.
+_INPUT_SURFACES = ("story_text",)
+
+
+def _enforce_all_surfaces(
+    audit: dict[str, Any],
+    skip: tuple[str, ...] = (),
+    patterns: DoctrinePatternSet | None = None,
+) -> tuple[list[DoctrineViolation], list]:
+    """Run language constraints over every publish surface not named in *skip*.
 
     Returns ``(all_violations, all_warnings)`` across all surfaces.
     Raises :class:`DoctrineViolationError` on the first surface with a hard
@@ -92,9 +110,9 @@ def _enforce_all_surfaces(audit: dict[str, Any]) -> tuple[list[DoctrineViolation
     all_warnings: list = []
 
     for surface_name, text in _collect_publish_surfaces(audit).items():
-        if not text:
+        if not text or surface_name in skip:
             continue
-        result = enforce_language_constraints(text)
+        result = enforce_language_constraints(text, patterns)
         if result.violations:
             raise DoctrineViolationError(surface_name, result.violations)
         all_violations.extend(result.violations)
@@ -103,14 +121,56 @@ def _enforce_all_surfaces(audit: dict[str, Any]) -> tuple[list[DoctrineViolation
     return all_violations, all_warnings
 
 
+def _write_aborted(out_dir: Path, exc: DoctrineViolationError) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "ABORTED.json").write_text(
+        json.dumps(
+            {
+                "reason": "doctrine_violation",
+                "detail": str(exc),
+                "surface": exc.surface,
+                "violations": [
+                    {"pattern": v.phrase_pattern, "matched": v.matched_text} for v in exc.violations
+                ],
+            },
+            indent=2,
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+
+
+def _preflight_doctrine(
+    audit_mode: str, story_text: str, patterns: DoctrinePatternSet | None = None
+) -> list:
+    """Check the input surfaces before any LLM or render work.
+
+    Returns their loaded-modifier warnings.  On a hard violation, writes
+    ``ABORTED.json`` to the run's output directory and raises
+    :class:`DoctrineViolationError`.
+    """
+    try:
+        return _enforce_all_surfaces({"story_text": story_text}, patterns=patterns)[1]
+    except DoctrineViolationError as exc:
+        # Same slug the audit would have produced for this input.
+        _write_aborted(_DIST / _slug(audit_mode, story_text), exc)
+        raise
+
+
 def run_pipeline(
     mode: str,
     story_text: str,
     target: str | None = None,
     word_count: int = 0,
     duration_seconds: float | None = None,
+    on_audit_field: Callable[[str, Any], None] | None = None,
+    ledger_deadline: float | None = None,
+    draft: bool = False,
+    receipt_encoding: str | None = None,
 ) -> dict[str, Any]:
     character = target or "valet"
+    # Drafts favour encode speed, published runs keep receipt.png; fail before any work if unknown.
+    encoding = get_encoding(receipt_encoding or (DRAFT_ENCODING if draft else DEFAULT_ENCODING))
 
     # Load persistent state and increment episode counter
     state = load_state(_DIST)
@@ -135,25 +195,42 @@ def run_pipeline(
 
     # "scalpel-ledger" is a pipeline mode; the underlying audit always runs as "scalpel"
     audit_mode = "scalpel" if mode == "scalpel-ledger" else mode
+    # One pattern set for the whole run, even if the doctrine file is reloaded meanwhile.
+    doctrine = current_pattern_set()
+    # Fail fast on the input text before spending LLM and render time.
+    input_warnings = _preflight_doctrine(audit_mode, story_text, doctrine)
     effective_word_count = word_count or len(story_text.split())
-    audit = run_audit(
-        mode=audit_mode,
-        story_text=story_text,
-        target=target,
-        word_count=effective_word_count,
-        duration_seconds=duration_seconds,
+    time_pressure = compute_time_pressure(
+        word_count=effective_word_count, duration_seconds=duration_seconds
     )
-    audit["voice"] = voice_meta
-
-    slug = audit["slug"]
-    out_dir = _DIST / slug
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    # Run Integrity Ledger; damage estimate is enabled only for scalpel-ledger mode
-    include_damage = mode == "scalpel-ledger"
-    article_input = _ArticleInput(outlet=target or "", id=slug)
-    ledger = run_integrity_ledger(article_input, include_damage_estimate=include_damage)
+    # The time-pressure level also routes the ledger's LLM calls to a model tier.
+    with usage_scope() as token_usage, llm_time_pressure(time_pressure.level):
+        audit = run_audit(
+            mode=audit_mode,
+            story_text=story_text,
+            target=target,
+            word_count=effective_word_count,
+            duration_seconds=duration_seconds,
+            on_field=on_audit_field,
+        )
+        audit["voice"] = voice_meta
+
+        slug = audit["slug"]
+        out_dir = _DIST / slug
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # Run Integrity Ledger; damage estimate is enabled only for scalpel-ledger mode
+        include_damage = mode == "scalpel-ledger"
+        pattern_engine = get_pattern_engine(_DIST)
+        article_input = _ArticleInput(outlet=target or "", id=slug, pattern_engine=pattern_engine)
+        # Layers that miss ledger_deadline come back with confidence=None and are
+        # reported below as missing inputs.
+        ledger = run_integrity_ledger(
+            article_input, include_damage_estimate=include_damage, deadline=ledger_deadline
+        )
     ledger_dict = dataclasses.asdict(ledger)
+    # Per-stage LLM token counts; empty when no LLM provider is configured.
+    audit["token_usage"] = summarize_usage(token_usage)
 
     audit["integrity_ledger"] = {
         "total_score": ledger.total_score,
@@ -186,12 +263,17 @@ def run_pipeline(
     audit["internal_audit"] = build_internal_audit_block(
         data_complete=len(inputs_missing) == 0,
     )
+    audit["internal_audit"]["doctrine_version"] = doctrine.version
 
     # ── Language constraint enforcement across all publish surfaces ───────────
     # This must happen BEFORE any artifact is written.  A DoctrineViolationError
     # here aborts the pipeline; ABORTED.json is written and the error re-raised.
     try:
-        _, loaded_warnings = _enforce_all_surfaces(audit)
+        # Input surfaces were checked before the audit; re-check only generated ones.
+        _, generated_warnings = _enforce_all_surfaces(
+            audit, skip=_INPUT_SURFACES, patterns=doctrine
+        )
+        loaded_warnings = input_warnings + generated_warnings
         audit["internal_audit"]["doctrine_status"] = "PASS"
         if loaded_warnings:
             audit["internal_audit"]["loaded_modifier_warnings"] = [
@@ -201,23 +283,7 @@ def run_pipeline(
         # Doctrine failure: update internal_audit, write ABORTED.json, then raise
         audit["internal_audit"]["doctrine_status"] = "FAIL"
         audit["internal_audit"]["actions_required"].append(str(exc))
-        aborted_path = out_dir / "ABORTED.json"
-        aborted_path.write_text(
-            json.dumps(
-                {
-                    "reason": "doctrine_violation",
-                    "detail": str(exc),
-                    "surface": exc.surface,
-                    "violations": [
-                        {"pattern": v.phrase_pattern, "matched": v.matched_text}
-                        for v in exc.violations
-                    ],
-                },
-                indent=2,
-                ensure_ascii=False,
-            ),
-            encoding="utf-8",
-        )
+        _write_aborted(out_dir, exc)
         raise
 
     # ── Validate report contract ───────────────────────────────────────────────
@@ -271,6 +337,9 @@ def run_pipeline(
 
     ledger_json = out_dir / "integrity_ledger.json"
     ledger_json.write_text(json.dumps(ledger_dict, indent=2, ensure_ascii=False), encoding="utf-8")
+    # Columnar history and running outlet statistics; aborted runs never reach here.
+    get_ledger_history(_DIST).append(ledger)
+    get_outlet_stats(_DIST).update(ledger)
 
     audit_yaml = out_dir / "audit.yaml"
     audit_yaml.write_text(
@@ -278,8 +347,10 @@ def run_pipeline(
         encoding="utf-8",
     )
 
-    receipt_json, receipt_png = render_receipt_from_audit(audit, out_dir)
-    video_mp4 = render_video_from_audit(audit, receipt_png, out_dir)
+    # The video stages reuse the receipt image in memory instead of decoding it again.
+    receipt = render_receipt(audit, out_dir, encoding)
+    receipt_json, receipt_png = receipt.json_path, receipt.image_path
+    video_mp4 = render_video_from_audit(audit, receipt_png, out_dir, receipt.frame)
 
     # Write chain.json
     chain_json = out_dir / "chain.json"
@@ -299,6 +370,8 @@ def run_pipeline(
     if target:
         state["last_target"] = target
     save_state(_DIST, state)
+    # Only after the run is published, so aborted audits never feed the pattern layer.
+    pattern_engine.observe(target or "", audit)
 
     result: dict[str, Any] = {
         "slug": slug,
@@ -321,7 +394,9 @@ def run_pipeline(
             but_if_audit["episode"].update(damage.episode)
             but_if_tmp_dir = out_dir / "_butif_tmp"
             but_if_tmp_dir.mkdir(parents=True, exist_ok=True)
-            tmp_video_path = render_video_from_audit(but_if_audit, receipt_png, but_if_tmp_dir)
+            tmp_video_path = render_video_from_audit(
+                but_if_audit, receipt_png, but_if_tmp_dir, receipt.frame
+            )
             but_if_video_mp4 = out_dir / "but_if_video.mp4"
             tmp_video_path.rename(but_if_video_mp4)
             result["but_if_video_mp4"] = str(but_if_video_mp4)
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+# Per-provider defaults.  These sit comfortably below the entry-tier limits of
+# each provider so that a fleet of workers queues locally instead of collecting
+# 429s.  Override with the environment variables read in load_rate_limit_config.
+_PROVIDER_DEFAULTS: dict[str, tuple[float, float, int]] = {
+    "openai": (500.0, 30_000.0, 8),
+    "anthropic": (50.0, 40_000.0, 4),
+    # The local stand-in server; effectively unlimited unless overridden for a benchmark.
+    "standin": (60_000.0, 100_000_000.0, 256),
+}
+_FALLBACK_DEFAULTS: tuple[float, float, int] = (60.0, 30_000.0, 4)
+
+# A lease older than this is assumed to belong to a crashed worker and is reclaimed.
+_LEASE_TTL_S = 600.0
+# Poll interval while waiting for an in-flight slot to free up.
+_SLOT_POLL_S = 0.05
+# Bounds on a single sleep: waiters re-check shared state regularly, and a wait
+# rounded down to almost nothing cannot degrade into a busy loop.
+_MIN_SLEEP_S = 0.01
+_MAX_SLEEP_S = 1.0
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    requests_per_minute: float
+    tokens_per_minute: float
+    max_in_flight: int
+
+
+@dataclass
+class _BucketState:
+    requests: float
+    tokens: float
+    updated: float
+    in_flight: int
+
+
+def load_rate_limit_config(provider: str) -> RateLimitConfig:
+    """Return the rate limit configuration for *provider*.
+
+    Provider-specific variables (``OPENAI_RPM``, ``OPENAI_TPM``,
+    ``OPENAI_MAX_IN_FLIGHT``; same for ``ANTHROPIC_*``) take precedence over the
+    global ``LLM_RPM``, ``LLM_TPM`` and ``LLM_MAX_IN_FLIGHT``, which in turn take
+    precedence over the built-in provider defaults.
+    """
+    rpm, tpm, in_flight = _PROVIDER_DEFAULTS.get(provider, _FALLBACK_DEFAULTS)
+    prefix = provider.upper()
+
+    def _env(name: str, default: float) -> float:
+        raw = os.environ.get(f"{prefix}_{name}") or os.environ.get(f"LLM_{name}")
+        return float(raw) if raw else default
+
+    return RateLimitConfig(
+        requests_per_minute=_env("RPM", rpm),
+        tokens_per_minute=_env("TPM", tpm),
+        max_in_flight=int(_env("MAX_IN_FLIGHT", in_flight)),
+    )
+
+
+def _refill(state: _BucketState, config: RateLimitConfig, now: float) -> None:
+    elapsed = max(0.0, now - state.updated)
+    state.requests = min(
+        config.requests_per_minute,
+        state.requests + elapsed * config.requests_per_minute / 60.0,
+    )
+    state.tokens = min(
+        config.tokens_per_minute,
+        state.tokens + elapsed * config.tokens_per_minute / 60.0,
+    )
+    state.updated = now
+
+
+def _try_take(state: _BucketState, config: RateLimitConfig, cost: float, now: float) -> float:
+    """Refill *state* and take one request plus *cost* tokens from it.
+
+    Returns ``0.0`` when the slot was granted (and *state* debited), otherwise
+    the number of seconds the caller should wait before trying again.
+    """
+    _refill(state, config, now)
+    if state.in_flight >= config.max_in_flight:
+        return _SLOT_POLL_S
+    if state.requests < 1.0:
+        return (1.0 - state.requests) * 60.0 / config.requests_per_minute
+    if state.tokens < cost:
+        return (cost - state.tokens) * 60.0 / config.tokens_per_minute
+    state.requests -= 1.0
+    state.tokens -= cost
+    state.in_flight += 1
+    return 0.0
+
+
+class _MemoryBackend:
+    """Buckets shared by all threads of the current process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: dict[str, _BucketState] = {}
+
+    def _state(self, key: str, config: RateLimitConfig, now: float) -> _BucketState:
+        state = self._states.get(key)
+        if state is None:
+            state = _BucketState(
+                requests=config.requests_per_minute,
+                tokens=config.tokens_per_minute,
+                updated=now,
+                in_flight=0,
+            )
+            self._states[key] = state
+        return state
+
+    def try_acquire(
+        self, key: str, config: RateLimitConfig, cost: float, now: float
+    ) -> tuple[float, str | None]:
+        with self._lock:
+            wait = _try_take(self._state(key, config, now), config, cost, now)
+        return wait, (None if wait else uuid.uuid4().hex)
+
+    def release(
+        self, key: str, config: RateLimitConfig, lease_id: str, token_adjustment: float, now: float
+    ) -> None:
+        with self._lock:
+            state = self._state(key, config, now)
+            state.in_flight = max(0, state.in_flight - 1)
+            state.tokens -= token_adjustment
+
+
+class _SQLiteBackend:
+    """Buckets shared by every process that points at the same database file.
+
+    Each acquire/release runs in a ``BEGIN IMMEDIATE`` transaction, so SQLite's
+    file lock serialises bucket updates across processes.  In-flight calls are
+    tracked as lease rows so that a worker that dies mid-call only holds its
+    slot until ``_LEASE_TTL_S`` expires.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "key TEXT PRIMARY KEY, requests REAL, tokens REAL, updated REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "id TEXT PRIMARY KEY, key TEXT, pid INTEGER, acquired REAL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _load(
+        self, conn: sqlite3.Connection, key: str, config: RateLimitConfig, now: float
+    ) -> _BucketState:
+        conn.execute("DELETE FROM leases WHERE acquired < ?", (now - _LEASE_TTL_S,))
+        (in_flight,) = conn.execute("SELECT COUNT(*) FROM leases WHERE key = ?", (key,)).fetchone()
+        row = conn.execute(
+            "SELECT requests, tokens, updated FROM buckets WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return _BucketState(
+                requests=config.requests_per_minute,
+                tokens=config.tokens_per_minute,
+                updated=now,
+                in_flight=in_flight,
+            )
+        return _BucketState(requests=row[0], tokens=row[1], updated=row[2], in_flight=in_flight)
+
+    def _store(self, conn: sqlite3.Connection, key: str, state: _BucketState) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets (key, requests, tokens, updated) VALUES (?, ?, ?, ?)",
+            (key, state.requests, state.tokens, state.updated),
+        )
+
+    def try_acquire(
+        self, key: str, config: RateLimitConfig, cost: float, now: float
+    ) -> tuple[float, str | None]:
+        with self._connect() as conn:
+            state = self._load(conn, key, config, now)
+            wait = _try_take(state, config, cost, now)
+            self._store(conn, key, state)
+            if wait:
+                return wait, None
+            lease_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO leases (id, key, pid, acquired) VALUES (?, ?, ?, ?)",
+                (lease_id, key, os.getpid(), now),
+            )
+            return 0.0, lease_id
+
+    def release(
+        self, key: str, config: RateLimitConfig, lease_id: str, token_adjustment: float, now: float
+    ) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM leases WHERE id = ?", (lease_id,))
+            if token_adjustment:
+                state = self._load(conn, key, config, now)
+                _refill(state, config, now)
+                state.tokens -= token_adjustment
+                self._store(conn, key, state)
+
+
+class RateLimiter:
+    """Token-bucket limiter for one LLM provider.
+
+    Enforces requests per minute, tokens per minute and a cap on concurrent
+    in-flight calls.  Callers block in :meth:`slot` until capacity is available
+    rather than sending a request the provider would reject with a 429.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        config: RateLimitConfig,
+        backend: _MemoryBackend | _SQLiteBackend,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.provider = provider
+        self.config = config
+        self._backend = backend
+        self._clock = clock
+        self._sleep = sleep
+
+    def acquire(self, tokens: int, timeout: float | None = None) -> str:
+        """Block until a slot for a call costing *tokens* is granted; return its lease id.
+
+        A call larger than the whole per-minute token budget is charged the full
+        budget so that it can still proceed once the bucket is full.
+
+        Raises :class:`TimeoutError` if *timeout* seconds pass without a grant.
+        """
+        cost = min(float(tokens), self.config.tokens_per_minute)
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            now = self._clock()
+            wait, lease_id = self._backend.try_acquire(self.provider, self.config, cost, now)
+            if lease_id is not None:
+                return lease_id
+            if deadline is not None and now + wait > deadline:
+                raise TimeoutError(
+                    f"Timed out waiting for {self.provider!r} LLM rate limit capacity."
+                )
+            self._sleep(min(max(wait, _MIN_SLEEP_S), _MAX_SLEEP_S))
+
+    def release(self, lease_id: str, reserved_tokens: int, used_tokens: int | None = None) -> None:
+        """Free the in-flight slot held by *lease_id*.
+
+        When the actual *used_tokens* is known, the token bucket is corrected by
+        the difference from the *reserved_tokens* estimate charged at acquire time.
+        """
+        adjustment = 0.0
+        if used_tokens is not None:
+            adjustment = float(used_tokens) - min(
+                float(reserved_tokens), self.config.tokens_per_minute
+            )
+        self._backend.release(self.provider, self.config, lease_id, adjustment, self._clock())
+
+    @contextmanager
+    def slot(self, tokens: int, timeout: float | None = None) -> Iterator[str]:
+        lease_id = self.acquire(tokens, timeout=timeout)
+        try:
+            yield lease_id
+        finally:
+            self.release(lease_id, tokens)
+
+
+_MEMORY_BACKEND = _MemoryBackend()
+_LIMITERS: dict[tuple[str, str], RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """Return the process-wide :class:`RateLimiter` for *provider*.
+
+    When ``LLM_RATE_LIMIT_DB`` names a file, buckets live in that SQLite
+    database and are shared by every worker process using the same path.
+    Otherwise they are shared by the threads of the current process only.
+    """
+    db_path = os.environ.get("LLM_RATE_LIMIT_DB", "").strip()
+    key = (provider, db_path)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            backend = _SQLiteBackend(Path(db_path)) if db_path else _MEMORY_BACKEND
+            limiter = RateLimiter(provider, load_rate_limit_config(provider), backend)
+            _LIMITERS[key] = limiter
+        return limiter
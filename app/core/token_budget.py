@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from app.core.time_pressure import compute_time_pressure
+
+
+@dataclass(frozen=True)
+class PromptBudget:
+    story_tokens: int
+    governance_tokens: int
+    ledger_context_tokens: int
+
+
+# Token budgets per time-pressure level.  The more stressed The Valet is, the
+# less of the source we send: a CRITICAL audit is told to "pick one thing", so
+# shipping the whole feature film to the model only buys latency.  The
+# governance budget is level-independent so the governance block stays a
+# byte-stable constant across runs.
+_BUDGETS: dict[str, PromptBudget] = {
+    "CALM": PromptBudget(
+        story_tokens=8000,
+        governance_tokens=6000,
+        ledger_context_tokens=4000,
+    ),
+    "FOCUSED": PromptBudget(
+        story_tokens=6000,
+        governance_tokens=6000,
+        ledger_context_tokens=3000,
+    ),
+    "PRESSURED": PromptBudget(
+        story_tokens=4000,
+        governance_tokens=6000,
+        ledger_context_tokens=2000,
+    ),
+    "CRITICAL": PromptBudget(
+        story_tokens=3000,
+        governance_tokens=6000,
+        ledger_context_tokens=1500,
+    ),
+}
+
+# Share of a trimmed section kept from the start; the remainder comes from the end.
+_HEAD_SHARE = 0.7
+_TRIM_MARKER = "\n\n[… {omitted} characters omitted for length …]\n\n"
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+_SPACES_RE = re.compile(r"[ \t]+")
+_SENTENCE_END_RE = re.compile(r"[.!?][\"'”’)]?\s")
+
+
+def estimate_tokens(text: str) -> int:
+    """Return a fast estimate of the token count of *text*.
+
+    Uses the usual four-characters-per-token approximation for English prose.
+    It is deliberately cheap: it runs on every prompt before submission.
+    """
+    return (len(text) + 3) // 4
+
+
+def budget_for(level: str) -> PromptBudget:
+    """Return the :class:`PromptBudget` for a time-pressure *level*."""
+    return _BUDGETS.get(level, _BUDGETS["FOCUSED"])
+
+
+def _compress(text: str) -> str:
+    text = _SPACES_RE.sub(" ", text)
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def fit_to_budget(text: str, max_tokens: int) -> str:
+    """Return *text* reduced to at most roughly *max_tokens* tokens.
+
+    Text already within budget is returned unchanged.  Otherwise runs of
+    whitespace are collapsed first; if that is not enough, the start and end of
+    the text are kept (cut on sentence boundaries where possible) and the middle
+    is replaced with a marker stating how much was omitted.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    text = _compress(text)
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    keep_chars = max(0, max_tokens * 4 - len(_TRIM_MARKER))
+    head_chars = int(keep_chars * _HEAD_SHARE)
+    tail_chars = keep_chars - head_chars
+
+    head = text[:head_chars]
+    ends = list(_SENTENCE_END_RE.finditer(head))
+    if ends and ends[-1].end() > head_chars // 2:
+        head = head[: ends[-1].end()]
+
+    tail = text[len(text) - tail_chars :] if tail_chars else ""
+    start = _SENTENCE_END_RE.search(tail)
+    if start and start.end() < tail_chars // 2:
+        tail = tail[start.end() :]
+
+    omitted = len(text) - len(head) - len(tail)
+    return head.rstrip() + _TRIM_MARKER.format(omitted=omitted) + tail.lstrip()
+
+
+def fit_ledger_context(text: str) -> str:
+    """Trim ledger-layer context to the budget for its own time-pressure level."""
+    level = compute_time_pressure(word_count=len(text.split())).level
+    return fit_to_budget(text, budget_for(level).ledger_context_tokens)
+
+
+# ── Token accounting ───────────────────────────────────────────────────────────
+
+
+@dataclass
+class TokenUsage:
+    call_site: str
+    input_tokens: int
+    output_tokens: int
+    # True when the provider did not report usage and the counts are estimates.
+    estimated: bool = False
+    # Input tokens served from the provider's prompt-prefix cache (included in input_tokens).
+    cached_input_tokens: int = 0
+
+
+_ACTIVE_USAGE: ContextVar[list[TokenUsage] | None] = ContextVar("llm_token_usage", default=None)
+
+
+@contextmanager
+def usage_scope() -> Iterator[list[TokenUsage]]:
+    """Collect a :class:`TokenUsage` record for every LLM call made inside the block."""
+    records: list[TokenUsage] = []
+    token = _ACTIVE_USAGE.set(records)
+    try:
+        yield records
+    finally:
+        _ACTIVE_USAGE.reset(token)
+
+
+def record_usage(usage: TokenUsage) -> None:
+    """Add *usage* to the innermost active :func:`usage_scope`, if any."""
+    records = _ACTIVE_USAGE.get()
+    if records is not None:
+        records.append(usage)
+
+
+def summarize_usage(records: list[TokenUsage]) -> dict[str, dict]:
+    """Aggregate *records* per call site for inclusion in the audit payload."""
+    summary: dict[str, dict] = {}
+    for usage in records:
+        stage = summary.setdefault(
+            usage.call_site,
+            {
+                "calls": 0,
+                "input_tokens": 0,
+                "cached_input_tokens": 0,
+                "output_tokens": 0,
+                "estimated": False,
+            },
+        )
+        stage["calls"] += 1
+        stage["input_tokens"] += usage.input_tokens
+        stage["cached_input_tokens"] += usage.cached_input_tokens
+        stage["output_tokens"] += usage.output_tokens
+        stage["estimated"] = stage["estimated"] or usage.estimated
+    return summary
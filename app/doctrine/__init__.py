@@ -9,19 +9,31 @@ from .contract import (
 from .guard import (
     BANNED_PHRASES,
     LOADED_MODIFIERS,
+    CorpusCheckStats,
+    CorpusFinding,
     DoctrineViolation,
     LanguageConstraintResult,
+    LanguageConstraintStream,
+    check_corpus,
     check_doctrine,
     enforce_language_constraints,
 )
+from .patterns import DoctrinePatternSet, current_pattern_set, load_pattern_set
 
 __all__ = [
     "BANNED_PHRASES",
     "LOADED_MODIFIERS",
     "check_doctrine",
     "enforce_language_constraints",
+    "check_corpus",
+    "CorpusFinding",
+    "CorpusCheckStats",
     "DoctrineViolation",
     "LanguageConstraintResult",
+    "LanguageConstraintStream",
+    "DoctrinePatternSet",
+    "current_pattern_set",
+    "load_pattern_set",
     "validate_report_contract",
     "ReportContractResult",
     "build_missing_data_disclosure",
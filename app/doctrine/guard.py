@@ -1,48 +1,32 @@
 from __future__ import annotations
 
+import os
 import re
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
+
+from .patterns import (
+    DEFAULT_PATTERNS_PATH,
+    DoctrinePatternSet,
+    current_pattern_set,
+    load_pattern_set,
+)
+from .scanner import PatternMatch, StreamingDoctrineScanner
+
+# The packaged pattern set.  These constants are the shipped defaults; checks use
+# current_pattern_set(), which follows DOCTRINE_PATTERNS_PATH and picks up edits.
+_DEFAULT_SET = load_pattern_set(DEFAULT_PATTERNS_PATH)
 
 # Phrases that must never appear in published output.
-# The system maps structure; it does not infer intent or assign moral scores.
-# Patterns are written as full-word regex so inflections are caught.
-BANNED_PHRASES: list[str] = [
-    r"\bcorrupt\w*\b",  # corrupt, corruption, corruptly, corrupted, corruptible
-    r"\bconflict of interest\b",
-    r"\billegal\w*\b",  # illegal, illegally, illegality
-    r"\bcriminal\w*\b",  # criminal, criminally, criminality
-    r"\bfraud\w*\b",  # fraud, fraudulent, fraudulently, fraudulence
-    r"\bbribe\w*\b",  # bribe, bribery, bribing, bribed
-    r"\bintended? to\b",  # intended to
-    r"\bintent\b",  # intent (standalone)
-    r"\bguilt\w*\b",  # guilt, guilty, guiltily
-    r"\bproof of\b",
-    r"\bmorally\b",
-    r"\bimmoral\w*\b",  # immoral, immorally, immorality
-    r"\bunethical\w*\b",  # unethical, unethically
-]
+BANNED_PHRASES: list[str] = list(_DEFAULT_SET.banned)
 
 # Loaded modifiers that signal hyperbole or accusatory tone.
 # These trigger a soft warning (not a hard block) during publish checks.
-LOADED_MODIFIERS: list[str] = [
-    r"\brigged\b",
-    r"\bshady\b",
-    r"\bscheme\w*\b",
-    r"\bscandalous\b",
-    r"\bdishonest\b",
-    r"\blying\b",
-    r"\bmanipulat\w+\b",
-    r"\bcover.?up\b",
-    r"\bhide\b",
-    r"\bhiding\b",
-    r"\bsecretly\b",
-    r"\bpay.?off\b",
-    r"\bkickback\b",
-    r"\bsell.?out\b",
-    r"\bpuppet\b",
-    r"\bpawn\b",
-    r"\bexploit\w*\b",
-]
+LOADED_MODIFIERS: list[str] = list(_DEFAULT_SET.loaded)
 
 _COMPILED_BANNED = [re.compile(p, re.IGNORECASE) for p in BANNED_PHRASES]
 _COMPILED_LOADED = [re.compile(p, re.IGNORECASE) for p in LOADED_MODIFIERS]
@@ -71,28 +55,31 @@ class LanguageConstraintResult:
         return len(self.violations) == 0
 
 
-def check_doctrine(text: str) -> list[DoctrineViolation]:
+def check_doctrine(
+    text: str, patterns: DoctrinePatternSet | None = None
+) -> list[DoctrineViolation]:
     """Scan *text* for banned phrases.
 
     Returns a list of DoctrineViolation objects.  An empty list means the
-    text passes the non-accusation doctrine.
+    text passes the non-accusation doctrine.  *patterns* defaults to
+    :func:`current_pattern_set`.
 
     This must be called before any audit output is published.
     """
-    violations: list[DoctrineViolation] = []
-    for pattern, compiled in zip(BANNED_PHRASES, _COMPILED_BANNED, strict=True):
-        for match in compiled.finditer(text):
-            violations.append(
-                DoctrineViolation(
-                    phrase_pattern=pattern,
-                    matched_text=match.group(),
-                    position=match.start(),
-                )
-            )
-    return violations
-
-
-def enforce_language_constraints(text: str) -> LanguageConstraintResult:
+    patterns = patterns or current_pattern_set()
+    return [
+        DoctrineViolation(
+            phrase_pattern=patterns.banned[m.pattern_index],
+            matched_text=m.matched_text,
+            position=m.position,
+        )
+        for m in patterns.banned_scanner.scan(text)
+    ]
+
+
+def enforce_language_constraints(
+    text: str, patterns: DoctrinePatternSet | None = None
+) -> LanguageConstraintResult:
     """Run the full language constraint check for a single publish surface.
 
     Hard violations (banned phrases including inflections) are collected in
@@ -101,19 +88,155 @@ def enforce_language_constraints(text: str) -> LanguageConstraintResult:
 
     The caller must treat any non-empty ``violations`` list as a fatal error
     and abort publishing.  Loaded modifier warnings should be surfaced in the
-    audit output for transparency.
+    audit output for transparency.  *patterns* defaults to
+    :func:`current_pattern_set`.
     """
-    violations = check_doctrine(text)
+    patterns = patterns or current_pattern_set()
+    return _to_result(patterns.scanner.scan(text), patterns)
+
 
+def _to_result(
+    matches: list[PatternMatch], patterns: DoctrinePatternSet
+) -> LanguageConstraintResult:
+    violations: list[DoctrineViolation] = []
     warnings: list[DoctrineViolation] = []
-    for pattern, compiled in zip(LOADED_MODIFIERS, _COMPILED_LOADED, strict=True):
-        for match in compiled.finditer(text):
-            warnings.append(
-                DoctrineViolation(
-                    phrase_pattern=pattern,
-                    matched_text=match.group(),
-                    position=match.start(),
-                )
+    for m in matches:
+        pattern = patterns.scanner.patterns[m.pattern_index]
+        target = violations if m.pattern_index < len(patterns.banned) else warnings
+        target.append(
+            DoctrineViolation(
+                phrase_pattern=pattern, matched_text=m.matched_text, position=m.position
             )
-
+        )
     return LanguageConstraintResult(violations=violations, loaded_modifier_warnings=warnings)
+
+
+class LanguageConstraintStream:
+    """Streaming :func:`enforce_language_constraints` for text produced incrementally.
+
+    Feed chunks as they arrive (e.g. transcript segments); each call returns
+    the violations and warnings that became certain with that chunk, with
+    positions relative to the start of the stream and ordered by position.
+    Call :meth:`close` at the end of the text for the remainder.  Taken
+    together the results contain exactly the matches of a single
+    :func:`enforce_language_constraints` call on the concatenated text.
+    The pattern set is fixed for the life of the stream.
+    """
+
+    def __init__(self, patterns: DoctrinePatternSet | None = None) -> None:
+        self.patterns = patterns or current_pattern_set()
+        self._scanner = StreamingDoctrineScanner(self.patterns.scanner)
+
+    def feed(self, chunk: str) -> LanguageConstraintResult:
+        return _to_result(self._scanner.feed(chunk), self.patterns)
+
+    def close(self) -> LanguageConstraintResult:
+        return _to_result(self._scanner.close(), self.patterns)
+
+
+# ── Corpus re-checks ───────────────────────────────────────────────────────────
+
+_CORPUS_BATCH_SIZE = 256
+
+
+@dataclass
+class CorpusFinding:
+    """One doctrine match in an archived publish surface."""
+
+    id: str
+    surface: str
+    severity: str  # "violation" (banned phrase) | "warning" (loaded modifier)
+    pattern: str
+    matched: str
+    position: int
+
+
+@dataclass
+class CorpusCheckStats:
+    """Running totals for :func:`check_corpus`; updated as results are yielded."""
+
+    records: int = 0
+    chars: int = 0
+    violations: int = 0
+    warnings: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.chars / 1e6 / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _check_batch(batch: list[tuple[str, str, str]]) -> tuple[list[CorpusFinding], int]:
+    findings: list[CorpusFinding] = []
+    chars = 0
+    for record_id, surface, text in batch:
+        chars += len(text)
+        result = enforce_language_constraints(text)
+        for severity, matches in (
+            ("violation", result.violations),
+            ("warning", result.loaded_modifier_warnings),
+        ):
+            findings.extend(
+                CorpusFinding(
+                    id=record_id,
+                    surface=surface,
+                    severity=severity,
+                    pattern=v.phrase_pattern,
+                    matched=v.matched_text,
+                    position=v.position,
+                )
+                for v in matches
+            )
+    return findings, chars
+
+
+def check_corpus(
+    records: Iterable[tuple[str, str, str]],
+    workers: int | None = None,
+    batch_size: int = _CORPUS_BATCH_SIZE,
+    stats: CorpusCheckStats | None = None,
+) -> Iterator[CorpusFinding]:
+    """Check ``(id, surface, text)`` records against the doctrine across worker processes.
+
+    Findings are yielded in input order, as each batch of *batch_size*
+    records completes.  *records* is consumed lazily and only a few batches
+    per worker are in flight, so arbitrarily large archives stream through
+    in bounded memory.  ``workers`` defaults to the CPU count; ``workers=1``
+    checks in-process.  Pass *stats* to follow throughput.
+    """
+    stats = stats if stats is not None else CorpusCheckStats()
+    workers = workers or os.cpu_count() or 1
+    source = iter(records)
+    batches = iter(lambda: list(islice(source, batch_size)), [])
+
+    def _account(result: tuple[list[CorpusFinding], int], size: int) -> list[CorpusFinding]:
+        findings, chars = result
+        stats.records += size
+        stats.chars += chars
+        stats.violations += sum(f.severity == "violation" for f in findings)
+        stats.warnings += sum(f.severity == "warning" for f in findings)
+        return findings
+
+    if workers <= 1:
+        for batch in batches:
+            yield from _account(_check_batch(batch), len(batch))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[tuple[Future, int]] = deque()
+        for batch in batches:
+            pending.append((pool.submit(_check_batch, batch), len(batch)))
+            if len(pending) >= 2 * workers:
+                future, size = pending.popleft()
+                yield from _account(future.result(), size)
+        while pending:
+            future, size = pending.popleft()
+            yield from _account(future.result(), size)
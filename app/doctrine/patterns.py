@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from .scanner import DoctrineScanner
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATTERNS_PATH = Path(__file__).with_name("patterns.yaml")
+# Minimum seconds between checks of the pattern file for changes.
+_RELOAD_INTERVAL = 1.0
+
+
+@dataclass(frozen=True)
+class DoctrinePatternSet:
+    """A versioned set of banned phrases and loaded modifiers, compiled for scanning."""
+
+    version: str
+    banned: tuple[str, ...]
+    loaded: tuple[str, ...]
+    # Content hash of the version and patterns (comments and layout excluded).
+    digest: str
+    # Banned phrases only, and banned phrases followed by loaded modifiers.
+    banned_scanner: DoctrineScanner
+    scanner: DoctrineScanner
+
+
+_COMPILED: dict[str, DoctrinePatternSet] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def _pattern_list(data: dict, key: str, source: str) -> tuple[str, ...]:
+    patterns = data.get(key)
+    if not isinstance(patterns, list) or not all(isinstance(p, str) for p in patterns):
+        raise ValueError(f"{source}: '{key}' must be a list of regex strings")
+    for pattern in patterns:
+        try:
+            re.compile(pattern)
+        except re.error as exc:
+            raise ValueError(f"{source}: invalid pattern {pattern!r} in '{key}': {exc}") from exc
+    return tuple(patterns)
+
+
+def parse_pattern_set(text: str, source: str = "<string>") -> DoctrinePatternSet:
+    """Parse and compile a pattern-set YAML document.
+
+    Compiled sets are cached by content hash, so re-reading an unchanged (or
+    only re-commented) file costs no recompilation.  Raises ``ValueError``
+    for a malformed document or an invalid pattern.
+    """
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as exc:
+        raise ValueError(f"{source}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise ValueError(f"{source}: expected a mapping with version, banned and loaded")
+    version = data.get("version")
+    if not isinstance(version, str | int | float) or not str(version).strip():
+        raise ValueError(f"{source}: 'version' is required")
+    version = str(version).strip()
+    banned = _pattern_list(data, "banned", source)
+    loaded = _pattern_list(data, "loaded", source)
+
+    canonical = json.dumps([version, banned, loaded]).encode("utf-8")
+    digest = hashlib.sha256(canonical).hexdigest()
+    with _COMPILED_LOCK:
+        cached = _COMPILED.get(digest)
+    if cached is not None:
+        return cached
+    pattern_set = DoctrinePatternSet(
+        version=version,
+        banned=banned,
+        loaded=loaded,
+        digest=digest,
+        banned_scanner=DoctrineScanner(list(banned)),
+        scanner=DoctrineScanner([*banned, *loaded]),
+    )
+    with _COMPILED_LOCK:
+        return _COMPILED.setdefault(digest, pattern_set)
+
+
+def load_pattern_set(path: Path) -> DoctrinePatternSet:
+    return parse_pattern_set(path.read_text(encoding="utf-8"), source=str(path))
+
+
+class PatternSetWatcher:
+    """The current pattern set of a file, reloaded when the file changes.
+
+    :meth:`current` checks the file's mtime and size at most every
+    *interval* seconds.  A changed file is compiled off to the side and
+    swapped in with a single reference assignment: scans already running
+    keep the set they started with, and no caller waits on a reload.  A
+    file that fails to parse is logged and the previous set stays active.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        interval: float = _RELOAD_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = path
+        self._interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stamp = self._stat()
+        # The first load raises: a missing or broken pattern file is a configuration error.
+        self._current = load_pattern_set(path)
+        self._checked = clock()
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def current(self) -> DoctrinePatternSet:
+        if self._clock() - self._checked >= self._interval and self._lock.acquire(blocking=False):
+            try:
+                self._checked = self._clock()
+                self._reload()
+            finally:
+                self._lock.release()
+        return self._current
+
+    def _reload(self) -> None:
+        stamp = self._stat()
+        if stamp is None or stamp == self._stamp:
+            return
+        self._stamp = stamp
+        try:
+            pattern_set = load_pattern_set(self.path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Keeping doctrine patterns v%s: %s", self._current.version, exc)
+            return
+        if pattern_set is not self._current:
+            logger.info(
+                "Doctrine patterns v%s -> v%s (%s)",
+                self._current.version,
+                pattern_set.version,
+                self.path,
+            )
+            self._current = pattern_set
+
+
+def _patterns_path() -> Path:
+    env = os.environ.get("DOCTRINE_PATTERNS_PATH")
+    return Path(env) if env else DEFAULT_PATTERNS_PATH
+
+
+_WATCHER: PatternSetWatcher | None = None
+_WATCHER_LOCK = threading.Lock()
+
+
+def current_pattern_set() -> DoctrinePatternSet:
+    """The active pattern set: ``DOCTRINE_PATTERNS_PATH`` or the packaged ``patterns.yaml``.
+
+    Callers that run several checks as one unit (a pipeline run) should take
+    the set once and pass it along, so a reload cannot split the unit.
+    """
+    global _WATCHER
+    watcher = _WATCHER
+    path = _patterns_path()
+    if watcher is None or watcher.path != path:
+        with _WATCHER_LOCK:
+            if _WATCHER is None or _WATCHER.path != path:
+                _WATCHER = PatternSetWatcher(path)
+            watcher = _WATCHER
+    return watcher.current()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+# A pattern whose first matched character is a known letter: optional \b, then a
+# letter that is not made optional or repeatable.
+_LEADING_LETTER_RE = re.compile(r"^(?:\\b)?([A-Za-z])(?![?*{])")
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    pattern_index: int
+    matched_text: str
+    position: int
+
+
+class DoctrineScanner:
+    """Find the matches of many doctrine patterns in a single pass over the text.
+
+    The patterns are combined into one zero-width alternation that stops at
+    every position where *any* pattern matches.  Only at those candidate
+    positions is each pattern tried individually, so the result is exactly
+    what ``finditer`` per pattern would return: for each pattern, its
+    leftmost non-overlapping matches, even where different patterns overlap.
+
+    When every pattern starts with a literal letter (as all doctrine patterns
+    do), the scan is additionally guarded by a character class of those
+    letters, which lets the regex engine skip most positions cheaply.
+    """
+
+    def __init__(self, patterns: list[str], flags: int = re.IGNORECASE) -> None:
+        self.patterns = list(patterns)
+        self._compiled = [re.compile(p, flags) for p in self.patterns]
+        alternation = "|".join(f"(?:{p})" for p in self.patterns)
+        leading = [None if "|" in p else _LEADING_LETTER_RE.match(p) for p in self.patterns]
+        if self.patterns and all(leading):
+            letters = sorted({m.group(1) for m in leading if m})
+            guard = "(?=[" + "".join(letters) + "])"
+        else:
+            guard = ""
+        self._combined = re.compile(f"{guard}(?={alternation})", flags) if self.patterns else None
+
+    def scan(self, text: str) -> list[PatternMatch]:
+        """All matches, ordered by pattern index and then by position."""
+        matches, _ = self.scan_span(text, 0, len(text), [0] * len(self._compiled), final=True)
+        return sorted(matches, key=lambda m: m.pattern_index)
+
+    def scan_span(
+        self, text: str, start: int, stop: int, last_end: list[int], final: bool
+    ) -> tuple[list[PatternMatch], int]:
+        """Matches starting in ``text[start:stop]``, in position order.
+
+        *last_end* holds, per pattern, the position its next match may start
+        at (updated in place), which carries ``finditer``'s non-overlap rule
+        across calls.  Unless *final*, *text* is taken to continue past its
+        end: scanning stops at the first match that reaches the end, since
+        more text could change it.  Returns the matches and the position to
+        resume from.
+        """
+        out: list[PatternMatch] = []
+        if self._combined is None:
+            return out, stop
+        for candidate in self._combined.finditer(text, start):
+            pos = candidate.start()
+            if pos >= stop:
+                break
+            for i, compiled in enumerate(self._compiled):
+                if pos < last_end[i]:
+                    continue
+                match = compiled.match(text, pos)
+                if match is None:
+                    continue
+                if not final and match.end() >= len(text):
+                    return out, pos
+                out.append(PatternMatch(i, match.group(), pos))
+                # finditer resumes at the end of a match (one past it for empty matches).
+                last_end[i] = match.end() if match.end() > pos else pos + 1
+        return out, stop
+
+
+# Word tails (\w*, \w+) only extend a match within the current word; the streaming
+# scanner handles those by never cutting inside a word.
+_WORD_TAIL_RE = re.compile(r"\\w[*+]")
+
+
+def _span_hint(pattern: str) -> int:
+    """Upper bound on a match's length outside word tails: the pattern's source length.
+
+    Holds for patterns built from literals, ``.?``-style optionals and word tails,
+    which covers the doctrine lists.
+    """
+    return len(_WORD_TAIL_RE.sub("", pattern))
+
+
+class StreamingDoctrineScanner:
+    """Incremental :class:`DoctrineScanner` over text that arrives in chunks.
+
+    :meth:`feed` returns the matches that are final so far, with absolute
+    positions; :meth:`close` returns the rest.  A match is only reported once
+    no further text could change it, so matches spanning chunk boundaries are
+    found exactly as in a scan of the whole text.  Only a tail of about the
+    longest pattern (extended to the start of the last word) is buffered.
+    """
+
+    def __init__(self, scanner: DoctrineScanner) -> None:
+        self._scanner = scanner
+        self._holdback = max((_span_hint(p) for p in scanner.patterns), default=0) + 1
+        self._buffer = ""
+        # Absolute position of _buffer[0].
+        self._offset = 0
+        # Index in _buffer of the first position not yet scanned.
+        self._resume = 0
+        self._last_end = [0] * len(scanner.patterns)
+
+    @property
+    def position(self) -> int:
+        """Absolute number of characters fed so far."""
+        return self._offset + len(self._buffer)
+
+    def feed(self, chunk: str) -> list[PatternMatch]:
+        self._buffer += chunk
+        return self._drain(final=False)
+
+    def close(self) -> list[PatternMatch]:
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> list[PatternMatch]:
+        buffer = self._buffer
+        if final:
+            cut = len(buffer)
+        else:
+            cut = len(buffer) - self._holdback
+            while cut > self._resume and (buffer[cut - 1].isalnum() or buffer[cut - 1] == "_"):
+                cut -= 1
+            if cut <= self._resume:
+                return []
+
+        offset = self._offset
+        last_end = [max(0, e - offset) for e in self._last_end]
+        found, resume = self._scanner.scan_span(buffer, self._resume, cut, last_end, final)
+        self._last_end = [e + offset for e in last_end]
+
+        # Keep one character before the resume point as context for \b.
+        keep = max(0, resume - 1)
+        self._buffer = buffer[keep:]
+        self._offset = offset + keep
+        self._resume = resume - keep
+        return [PatternMatch(m.pattern_index, m.matched_text, m.position + offset) for m in found]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from app.core.token_budget import fit_ledger_context
+
 from .models import LayerScore
 
 
 def _llm_analyze(prompt_topic: str, context: str) -> LayerScore:
     """Run an LLM-backed analysis. Falls back to stub if no LLM is configured."""
     try:
-        from app.core.llm_client import call_llm
+        from app.core.llm_client import call_llm, llm_call_site
 
         system = (
             "You are a forensic media integrity analyst. Respond with valid JSON only. "
@@ -16,7 +18,8 @@ def _llm_analyze(prompt_topic: str, context: str) -> LayerScore:
         import json
         import re
 
-        raw = call_llm(system_prompt=system, user_prompt=user).strip()
+        with llm_call_site("ledger.article"):
+            raw = call_llm(system_prompt=system, user_prompt=user).strip()
         raw = re.sub(r"^```[a-z]*\n?", "", raw)
         raw = re.sub(r"\n?```$", "", raw).strip()
         data: dict = json.loads(raw)
@@ -34,6 +37,7 @@ def _llm_analyze(prompt_topic: str, context: str) -> LayerScore:
 def analyze_article_content(article_input: object) -> LayerScore:
     text = getattr(article_input, "story_text", "") or getattr(article_input, "text", "") or ""
     outlet = getattr(article_input, "outlet", "") or ""
+    text = fit_ledger_context(text)
     context = f"Outlet: {outlet}\n\n{text}" if outlet else text
     try:
         return _llm_analyze(
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.epistemic.enforcer import LAYER_WEIGHTS
+
+from .models import IntegrityLedgerResult
+from .scoring import _LAYER_WEIGHTS, _RISK_BOUNDS
+
+LEDGER_LAYERS: tuple[str, ...] = tuple(_LAYER_WEIGHTS)
+
+_RISK_EDGES = np.array([bound for bound, _ in _RISK_BOUNDS], dtype=np.float64)
+_RISK_LEVELS = np.array([level for _, level in _RISK_BOUNDS] + ["STRUCTURAL"])
+
+
+@dataclass
+class LedgerBatchResult:
+    total_scores: np.ndarray  # float64, one per article
+    risk_levels: np.ndarray  # str, one of LOW / MODERATE / ELEVATED / STRUCTURAL
+    confidences: np.ndarray  # float64, aggregated layer confidence (epistemic weights)
+
+
+def ledger_columns(
+    results: Iterable[IntegrityLedgerResult],
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Split *results* into per-layer score and confidence columns.
+
+    Skipped layers (``confidence=None``) become ``NaN`` in the confidence column.
+    """
+    rows = list(results)
+    scores: dict[str, np.ndarray] = {}
+    confidences: dict[str, np.ndarray] = {}
+    for name in LEDGER_LAYERS:
+        layers = [getattr(r, name) for r in rows]
+        scores[name] = np.array([layer.score for layer in layers], dtype=np.float64)
+        confidences[name] = np.array(
+            [np.nan if layer.confidence is None else layer.confidence for layer in layers],
+            dtype=np.float64,
+        )
+    return scores, confidences
+
+
+def score_ledger_batch(
+    scores: Mapping[str, np.ndarray],
+    confidences: Mapping[str, np.ndarray],
+    weights: Mapping[str, float] | None = None,
+) -> LedgerBatchResult:
+    """Score many articles at once from columnar layer scores and confidences.
+
+    *scores* and *confidences* map each of the six layer names to an array with
+    one entry per article; a ``NaN`` confidence marks a skipped layer.  Totals,
+    risk levels and aggregated confidences match :func:`run_integrity_ledger`
+    and :func:`aggregate_layer_confidences` exactly, because the layers are
+    accumulated in the same order with the same operations.  *weights*
+    overrides the ledger layer weights, e.g. to re-score stored results after
+    a methodology change.
+    """
+    layer_weights = _LAYER_WEIGHTS if weights is None else weights
+    score_cols = {name: np.asarray(scores[name], dtype=np.float64) for name in LEDGER_LAYERS}
+    conf_cols = {name: np.asarray(confidences[name], dtype=np.float64) for name in LEDGER_LAYERS}
+    n = len(score_cols[LEDGER_LAYERS[0]])
+
+    total = np.zeros(n)
+    partial = np.zeros(n, dtype=bool)
+    used_weight = np.zeros(n)
+    conf_sum = np.zeros(n)
+    conf_weight = np.zeros(n)
+    for name in LEDGER_LAYERS:
+        used = ~np.isnan(conf_cols[name])
+        partial |= ~used
+        w = layer_weights[name]
+        total += np.where(used, score_cols[name] * w, 0.0)
+        used_weight += np.where(used, w, 0.0)
+        cw = LAYER_WEIGHTS[name]
+        conf_sum += np.where(used, conf_cols[name] * cw, 0.0)
+        conf_weight += np.where(used, cw, 0.0)
+
+    # Renormalise only rows with skipped layers, so complete rows keep the plain weighted sum.
+    renormalise = partial & (used_weight != 0.0)
+    np.divide(total, used_weight, out=total, where=renormalise)
+    total[partial & (used_weight == 0.0)] = 0.0
+
+    aggregated = np.zeros(n)
+    np.divide(conf_sum, conf_weight, out=aggregated, where=conf_weight != 0.0)
+
+    risk = _RISK_LEVELS[np.searchsorted(_RISK_EDGES, total, side="right")]
+    return LedgerBatchResult(total_scores=total, risk_levels=risk, confidences=aggregated)
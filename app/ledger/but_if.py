@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
+import os
 import re
+import threading
+from collections import OrderedDict
 
 from .models import DamageEstimate, IntegrityLedgerResult
 
+_LAYERS = ("ownership", "revenue", "editorial", "article", "regulatory", "pattern")
+# Scores are bucketed to this step for the memo key, so near-identical ledgers share
+# an estimate.
+_MEMO_SCORE_QUANTUM = 0.05
+_DEFAULT_MEMO_SIZE = 256
+
 _BUT_IF_SYSTEM_PROMPT = """\
 You are writing the script for The Perimeter Walker — the character who narrates the \
 alternate scenario video: "But If" this claim were actually true, what follows?
@@ -16,15 +27,42 @@ Respond with valid JSON only. No prose before or after the JSON object.
 """
 
 
-def _build_but_if_prompt(
-    ledger: IntegrityLedgerResult,
-    governance_payload: str | None,
-) -> str:
-    governance_section = f"\n\n---\n{governance_payload}\n---" if governance_payload else ""
-    distortions = [
-        f"- {layer}: score={getattr(ledger, layer.replace('-', '_'), None).score if getattr(ledger, layer.replace('-', '_'), None) else 'N/A'}"  # noqa: E501
-        for layer in ["ownership", "revenue", "editorial", "article", "regulatory", "pattern"]
+_BUT_IF_SCHEMA = """\
+Respond with this exact JSON schema (no other text):
+{
+  "scenario": "What would follow if these distortions were real and unchallenged (2-3 sentences).",
+  "stakes": "What is actually at risk (1-2 sentences).",
+  "episode": {
+    "hook": "Opening line for the But-If video.",
+    "final_line": "Closing line.",
+    "cta": "Call to action.",
+    "shots": [
+      {"index": 1, "text": "...", "duration_s": 3},
+      {"index": 2, "text": "...", "duration_s": 3},
+      {"index": 3, "text": "...", "duration_s": 3},
+      {"index": 4, "text": "...", "duration_s": 3}
     ]
+  }
+}"""
+
+
+def _build_but_if_system_prompt(governance_payload: str | None) -> str:
+    # Constant per character so providers can cache it as a prompt prefix.
+    governance_section = f"\n\n---\n{governance_payload}\n---" if governance_payload else ""
+    return f"{_BUT_IF_SYSTEM_PROMPT}\n{_BUT_IF_SCHEMA}{governance_section}"
+
+
+def _build_but_if_prompt(ledger: IntegrityLedgerResult) -> str:
+    distortions = []
+    for layer in ["ownership", "revenue", "editorial", "article", "regulatory", "pattern"]:
+        result = getattr(ledger, layer, None)
+        if result is None:
+            value = "N/A"
+        elif result.confidence is None:
+            value = "skipped"
+        else:
+            value = result.score
+        distortions.append(f"- {layer}: score={value}")
     distortions_text = "\n".join(distortions)
 
     return f"""\
@@ -34,27 +72,9 @@ Total score: {ledger.total_score:.3f}
 
 Layer scores:
 {distortions_text}
-{governance_section}
 
 Generate the But-If scenario: if the distortions identified above were actually true \
-and went unchallenged, what follows?
-
-Respond with this exact JSON schema (no other text):
-{{
-  "scenario": "What would follow if these distortions were real and unchallenged (2-3 sentences).",
-  "stakes": "What is actually at risk (1-2 sentences).",
-  "episode": {{
-    "hook": "Opening line for the But-If video.",
-    "final_line": "Closing line.",
-    "cta": "Call to action.",
-    "shots": [
-      {{"index": 1, "text": "...", "duration_s": 3}},
-      {{"index": 2, "text": "...", "duration_s": 3}},
-      {{"index": 3, "text": "...", "duration_s": 3}},
-      {{"index": 4, "text": "...", "duration_s": 3}}
-    ]
-  }}
-}}"""
+and went unchallenged, what follows?"""
 
 
 def _stub_damage_estimate(ledger: IntegrityLedgerResult) -> DamageEstimate:
@@ -97,36 +117,169 @@ def _stub_damage_estimate(ledger: IntegrityLedgerResult) -> DamageEstimate:
     return DamageEstimate(scenario=scenario, stakes=stakes, episode=episode)
 
 
+class DamageEstimateMemo:
+    """Bounded LRU memo of LLM damage estimates keyed by quantized risk profile.
+
+    Thread-safe; hits return a copy so callers may modify the estimate.
+    """
+
+    def __init__(self, max_size: int = _DEFAULT_MEMO_SIZE) -> None:
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._entries: OrderedDict[tuple, DamageEstimate] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> DamageEstimate | None:
+        with self._lock:
+            estimate = self._entries.get(key)
+            if estimate is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(estimate)
+
+    def put(self, key: tuple, estimate: DamageEstimate) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = copy.deepcopy(estimate)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_MEMO: DamageEstimateMemo | None = None
+_MEMO_LOCK = threading.Lock()
+
+
+def _memo_size() -> int:
+    """``BUT_IF_MEMO_SIZE``, or the default when unset or not an integer; never negative."""
+    try:
+        return max(0, int(os.environ.get("BUT_IF_MEMO_SIZE", "").strip()))
+    except ValueError:
+        return _DEFAULT_MEMO_SIZE
+
+
+def get_damage_estimate_memo() -> DamageEstimateMemo:
+    """Return the process-wide memo (size from ``BUT_IF_MEMO_SIZE``; ``0`` disables it)."""
+    global _MEMO
+    if _MEMO is None:
+        with _MEMO_LOCK:
+            if _MEMO is None:
+                _MEMO = DamageEstimateMemo(_memo_size())
+    return _MEMO
+
+
+def _quantize(score: float) -> int:
+    return round(score / _MEMO_SCORE_QUANTUM)
+
+
+def _memo_key(
+    ledger: IntegrityLedgerResult,
+    provider: str,
+    model: str,
+    governance_payload: str | None,
+    version: str,
+) -> tuple:
+    """Key on everything the But-If prompt depends on, with scores quantized."""
+    layers = tuple(
+        (
+            None
+            if getattr(ledger, layer).confidence is None
+            else _quantize(getattr(ledger, layer).score)
+        )
+        for layer in _LAYERS
+    )
+    governance = (
+        hashlib.sha256(governance_payload.encode("utf-8")).hexdigest()[:16]
+        if governance_payload
+        else ""
+    )
+    return (
+        provider,
+        model,
+        ledger.risk_level,
+        _quantize(ledger.total_score),
+        layers,
+        version,
+        governance,
+    )
+
+
 def generate_damage_estimate(ledger_result: IntegrityLedgerResult) -> DamageEstimate:
     """
     Produce a structured damage estimate based on ledger scores.
 
     Uses The Perimeter Walker's voice to narrate the alternate scenario.
+    Estimates are memoized by routed model, quantized risk profile and
+    governance version, so near-identical ledgers reuse one generation.
     Falls back to stub when no LLM provider is configured.
     """
     try:
-        from app.core.llm_client import call_llm
+        from app.core.llm_client import (
+            call_llm,
+            configured_provider,
+            llm_call_site,
+            routed_model,
+        )
+        from app.core.token_budget import budget_for, fit_to_budget
 
         governance_payload: str | None = None
+        governance_version = ""
         try:
             from app.voice.governance_loader import load_voice_governance
 
             gov = load_voice_governance("perimeter_walker")
-            governance_payload = gov.payload
+            governance_payload = fit_to_budget(gov.payload, budget_for("FOCUSED").governance_tokens)
+            governance_version = gov.version_hint
         except FileNotFoundError:
             pass
 
-        prompt = _build_but_if_prompt(ledger_result, governance_payload)
-        raw = call_llm(system_prompt=_BUT_IF_SYSTEM_PROMPT, user_prompt=prompt).strip()
+        # Only LLM-backed estimates are memoized, as with the outlet layer cache.
+        provider = configured_provider()
+        key = (
+            _memo_key(
+                ledger_result,
+                provider,
+                routed_model("but_if"),
+                governance_payload,
+                governance_version,
+            )
+            if provider
+            else None
+        )
+        memo = get_damage_estimate_memo()
+        if key is not None:
+            cached = memo.get(key)
+            if cached is not None:
+                return cached
+
+        system_prompt = _build_but_if_system_prompt(governance_payload)
+        prompt = _build_but_if_prompt(ledger_result)
+        with llm_call_site("but_if"):
+            raw = call_llm(system_prompt=system_prompt, user_prompt=prompt).strip()
 
         raw = re.sub(r"^```[a-z]*\n?", "", raw)
         raw = re.sub(r"\n?```$", "", raw).strip()
 
         data: dict = json.loads(raw)
-        return DamageEstimate(
+        estimate = DamageEstimate(
             scenario=str(data["scenario"]),
             stakes=str(data["stakes"]),
             episode=data["episode"],
         )
+        if key is not None:
+            memo.put(key, estimate)
+        return estimate
     except NotImplementedError:
         return _stub_damage_estimate(ledger_result)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from .models import IntegrityLedgerResult, outlet_key
+from .scoring import _LAYER_WEIGHTS, _RISK_BOUNDS
+
+_HISTORY_DIR = "_valet/ledger_history"
+_DAY_S = 24 * 3600.0
+
+RISK_LEVELS: tuple[str, ...] = tuple(level for _, level in _RISK_BOUNDS) + ("STRUCTURAL",)
+
+# One raw little-endian file per column.  "risk" is written last for every row,
+# so its length is the number of complete rows.
+_COLUMNS: dict[str, str] = {
+    "timestamp": "<f8",
+    "outlet": "<i4",
+    **{f"{layer}_score": "<f8" for layer in _LAYER_WEIGHTS},
+    **{f"{layer}_confidence": "<f8" for layer in _LAYER_WEIGHTS},
+    "total_score": "<f8",
+    "risk": "u1",
+}
+_INDEX_DTYPE = "<i8"
+
+
+class LedgerHistoryStore:
+    """Append-only columnar history of integrity ledger results.
+
+    Every result becomes one row: timestamp, outlet, the six layer scores and
+    confidences (``NaN`` for a skipped layer), total score and risk level.
+    Columns are flat NumPy files read through ``np.memmap``; a per-outlet file
+    of row numbers serves as the index, so a query touches only that outlet's
+    rows.  Appends from several processes are serialised with a file lock.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._outlets_path = root / "outlets.json"
+        self._index_dir = root / "by_outlet"
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with open(self._root / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _outlets(self) -> dict[str, int]:
+        try:
+            names = json.loads(self._outlets_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        return {name: i for i, name in enumerate(names)}
+
+    def _column_path(self, name: str) -> Path:
+        return self._root / f"{name}.bin"
+
+    def _column(self, name: str, rows: int) -> np.ndarray:
+        dtype = np.dtype(_COLUMNS[name])
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._column_path(name), dtype=dtype, mode="r", shape=(rows,))
+
+    def __len__(self) -> int:
+        path = self._column_path("risk")
+        return path.stat().st_size if path.exists() else 0
+
+    def append(self, result: IntegrityLedgerResult, timestamp: float | None = None) -> int:
+        """Append *result* and return its row number."""
+        values: dict[str, float | int] = {
+            "timestamp": time.time() if timestamp is None else timestamp,
+            "total_score": result.total_score,
+            "risk": RISK_LEVELS.index(result.risk_level),
+        }
+        for layer in _LAYER_WEIGHTS:
+            score = getattr(result, layer)
+            # A skipped layer has no score; NaN keeps it out of means, as in the total.
+            skipped = score.confidence is None
+            values[f"{layer}_score"] = np.nan if skipped else score.score
+            values[f"{layer}_confidence"] = np.nan if skipped else score.confidence
+
+        key = outlet_key(result.outlet)
+        with self._locked():
+            outlets = self._outlets()
+            if key not in outlets:
+                outlets[key] = len(outlets)
+                self._outlets_path.write_text(
+                    json.dumps(list(outlets), ensure_ascii=False), encoding="utf-8"
+                )
+            values["outlet"] = outlets[key]
+            row = len(self)
+            for name, dtype in _COLUMNS.items():
+                with open(self._column_path(name), "ab") as fh:
+                    # Drop any partial row left by an interrupted append.
+                    fh.truncate(row * np.dtype(dtype).itemsize)
+                    fh.write(np.array([values[name]], dtype=dtype).tobytes())
+            with open(self._index_dir / f"{outlets[key]}.bin", "ab") as fh:
+                fh.write(np.array([row], dtype=_INDEX_DTYPE).tobytes())
+        return row
+
+    def rows(
+        self, outlet: str, since: float | None = None, until: float | None = None
+    ) -> np.ndarray:
+        """Row numbers for *outlet* with ``since <= timestamp <= until``."""
+        outlet_id = self._outlets().get(outlet_key(outlet))
+        total = len(self)
+        if outlet_id is None or total == 0:
+            return np.empty(0, dtype=_INDEX_DTYPE)
+        index = np.fromfile(self._index_dir / f"{outlet_id}.bin", dtype=_INDEX_DTYPE)
+        index = index[index < total]
+        if since is None and until is None:
+            return index
+        stamps = self._column("timestamp", total)[index]
+        keep = np.ones(len(index), dtype=bool)
+        if since is not None:
+            keep &= stamps >= since
+        if until is not None:
+            keep &= stamps <= until
+        return index[keep]
+
+    def values(
+        self, outlet: str, column: str, since: float | None = None, until: float | None = None
+    ) -> np.ndarray:
+        """Values of *column* for *outlet*'s rows in the time window, in append order."""
+        if column not in _COLUMNS:
+            raise KeyError(f"Unknown ledger history column: {column!r}")
+        rows = self.rows(outlet, since, until)
+        return np.asarray(self._column(column, len(self))[rows])
+
+    def mean(
+        self, outlet: str, column: str, since: float | None = None, until: float | None = None
+    ) -> float | None:
+        """Mean of *column* over the window, ignoring skipped layers; ``None`` without data."""
+        values = self.values(outlet, column, since, until).astype(np.float64)
+        values = values[~np.isnan(values)]
+        return float(values.mean()) if len(values) else None
+
+    def trailing_mean(
+        self, outlet: str, column: str, days: float = 90.0, now: float | None = None
+    ) -> float | None:
+        """Mean of *column* over the last *days* days, e.g. an outlet's 90-day pattern score."""
+        end = time.time() if now is None else now
+        return self.mean(outlet, column, since=end - days * _DAY_S, until=end)
+
+
+def get_ledger_history(dist_root: Path) -> LedgerHistoryStore:
+    """Return the history store kept in ``dist/_valet/ledger_history``."""
+    return LedgerHistoryStore(dist_root / _HISTORY_DIR)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+
+def outlet_key(outlet: str) -> str:
+    """Normalised outlet name shared by every per-outlet ledger store (whitespace, case)."""
+    return " ".join(outlet.split()).casefold()
 
 
 @dataclass
 class LayerScore:
     score: float
-    confidence: float
+    # None when the layer was skipped (e.g. it missed the ledger deadline).
+    confidence: float | None
     notes: str
 
 
@@ -37,3 +43,5 @@ class IntegrityLedgerResult:
 
     damage_estimate: DamageEstimate | None
     methodology_version: str
+    # Layers that did not finish within the ledger deadline; excluded from total_score.
+    skipped_layers: list[str] = field(default_factory=list)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .models import LayerScore, outlet_key
+
+# Ownership and revenue structure changes on the scale of months; a week keeps
+# results reasonably fresh while removing almost all repeat calls.
+_DEFAULT_TTL_S = 7 * 24 * 3600.0
+_DEFAULT_DB_PATH = Path("dist") / "_valet" / "ledger_outlet_cache.sqlite3"
+
+
+class OutletLayerCache:
+    """Ledger layer results keyed by (provider, model, layer, outlet), persisted in SQLite.
+
+    Only layers whose result depends on nothing but the outlet name
+    (ownership, revenue) belong here.  Entries expire after *ttl_seconds*; the
+    database file may be shared by any number of worker processes.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = _DEFAULT_TTL_S,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = path
+        self._ttl = ttl_seconds
+        self._clock = clock
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(layer_results)")}
+            if columns and "model" not in columns:
+                # Written before results were keyed by model; nothing in it can be attributed.
+                conn.execute("DROP TABLE layer_results")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS layer_results ("
+                "provider TEXT, model TEXT, layer TEXT, outlet TEXT, "
+                "score REAL, confidence REAL, notes TEXT, stored REAL, "
+                "PRIMARY KEY (provider, model, layer, outlet))"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self._path, timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, provider: str, model: str, layer: str, outlet: str) -> LayerScore | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT score, confidence, notes FROM layer_results "
+                "WHERE provider = ? AND model = ? AND layer = ? AND outlet = ? AND stored >= ?",
+                (provider, model, layer, outlet_key(outlet), self._clock() - self._ttl),
+            ).fetchone()
+        if row is None:
+            return None
+        return LayerScore(score=row[0], confidence=row[1], notes=row[2])
+
+    def put(self, provider: str, model: str, layer: str, outlet: str, result: LayerScore) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO layer_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    provider,
+                    model,
+                    layer,
+                    outlet_key(outlet),
+                    result.score,
+                    result.confidence,
+                    result.notes,
+                    self._clock(),
+                ),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns the number removed."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM layer_results WHERE stored < ?", (self._clock() - self._ttl,)
+            )
+        return cursor.rowcount
+
+
+_CACHES: dict[tuple[Path, float], OutletLayerCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def _cache_ttl() -> float:
+    """``LEDGER_OUTLET_CACHE_TTL``, or the default when unset or not a number."""
+    try:
+        return float(os.environ.get("LEDGER_OUTLET_CACHE_TTL", "").strip())
+    except ValueError:
+        return _DEFAULT_TTL_S
+
+
+def get_outlet_cache() -> OutletLayerCache | None:
+    """Return the configured outlet cache, or ``None`` when caching is disabled.
+
+    ``LEDGER_OUTLET_CACHE_DB`` sets the database path and
+    ``LEDGER_OUTLET_CACHE_TTL`` the lifetime in seconds (``0`` disables the
+    cache).  One cache is kept per (path, TTL).
+    """
+    ttl = _cache_ttl()
+    if ttl <= 0:
+        return None
+    env = os.environ.get("LEDGER_OUTLET_CACHE_DB", "").strip()
+    key = (Path(env) if env else _DEFAULT_DB_PATH, ttl)
+    cache = _CACHES.get(key)
+    if cache is None:
+        with _CACHES_LOCK:
+            cache = _CACHES.get(key)
+            if cache is None:
+                cache = _CACHES[key] = OutletLayerCache(key[0], ttl_seconds=ttl)
+    return cache
+
+
+def cached_outlet_layer(
+    layer: str, outlet: str, analyze: Callable[[str], LayerScore]
+) -> LayerScore:
+    """Return *layer*'s score for *outlet*, calling ``analyze(outlet)`` only on a cache miss.
+
+    Caching applies only to LLM-backed results: with no ``LLM_PROVIDER`` the
+    layers return placeholder stubs, which are never stored.  Results for an
+    empty outlet name are not cached either.  Entries are keyed by the model the
+    layer's call site is routed to, so changing a model or ``LLM_ROUTES`` tier
+    starts from an empty cache.
+    """
+    from app.core.llm_client import configured_provider, routed_model
+
+    provider = configured_provider()
+    cache = get_outlet_cache() if provider and outlet.strip() else None
+    if cache is None:
+        return analyze(outlet)
+
+    model = routed_model(f"ledger.{layer}")
+    hit = cache.get(provider, model, layer, outlet)
+    if hit is not None:
+        return hit
+    result = analyze(outlet)
+    cache.put(provider, model, layer, outlet, result)
+    return result
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .models import IntegrityLedgerResult, outlet_key
+from .scoring import _LAYER_WEIGHTS
+
+_STATS_FILE = "_valet/ledger_outlet_stats.sqlite3"
+# Weight of the newest score in the exponentially decayed mean.
+_EWMA_ALPHA = 0.1
+# The six layers plus the weighted total.
+STAT_LAYERS: tuple[str, ...] = (*_LAYER_WEIGHTS, "total")
+
+
+@dataclass
+class LayerStats:
+    count: int = 0
+    mean: float = 0.0
+    # Sum of squared deviations from the mean (Welford).
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    ewma: float = 0.0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.ewma = value if self.count == 1 else self.ewma + _EWMA_ALPHA * (value - self.ewma)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance; 0.0 with fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def zscore(self, value: float) -> float | None:
+        """Standard score of *value* against these statistics, or ``None`` without spread."""
+        std = math.sqrt(self.variance)
+        return (value - self.mean) / std if std > 0 else None
+
+    def to_dict(self) -> dict[str, float | int]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "stddev": math.sqrt(self.variance),
+            "min": self.minimum,
+            "max": self.maximum,
+            "ewma": self.ewma,
+        }
+
+
+class OutletStatsStore:
+    """Running per-outlet, per-layer score statistics persisted in SQLite.
+
+    Each ledger result updates one row per layer in O(1) (Welford mean and
+    variance, min/max, exponentially decayed mean); nothing is rescanned.
+    Skipped layers are not counted.  Updates from several processes are
+    serialised by SQLite.
+    """
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time) -> None:
+        self._path = path
+        self._clock = clock
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS layer_stats ("
+                "outlet TEXT, layer TEXT, count INTEGER, mean REAL, m2 REAL, "
+                "minimum REAL, maximum REAL, ewma REAL, updated REAL, "
+                "PRIMARY KEY (outlet, layer))"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _read(conn: sqlite3.Connection, outlet: str) -> dict[str, LayerStats]:
+        rows = conn.execute(
+            "SELECT layer, count, mean, m2, minimum, maximum, ewma FROM layer_stats "
+            "WHERE outlet = ?",
+            (outlet,),
+        ).fetchall()
+        return {row[0]: LayerStats(*row[1:]) for row in rows}
+
+    def update(self, result: IntegrityLedgerResult) -> None:
+        """Fold *result*'s layer scores and total into its outlet's statistics."""
+        outlet = outlet_key(result.outlet)
+        if not outlet:
+            return
+        values = {
+            layer: getattr(result, layer).score
+            for layer in _LAYER_WEIGHTS
+            if getattr(result, layer).confidence is not None
+        }
+        values["total"] = result.total_score
+        with self._connect() as conn:
+            stats = self._read(conn, outlet)
+            for layer, value in values.items():
+                layer_stats = stats.get(layer, LayerStats())
+                layer_stats.update(value)
+                conn.execute(
+                    "INSERT OR REPLACE INTO layer_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (outlet, layer, *asdict(layer_stats).values(), self._clock()),
+                )
+
+    def get(self, outlet: str) -> dict[str, LayerStats]:
+        """Statistics per layer (and ``"total"``) for *outlet*; empty if never scored."""
+        with self._connect() as conn:
+            stats = self._read(conn, outlet_key(outlet))
+        return {layer: stats[layer] for layer in STAT_LAYERS if layer in stats}
+
+    def outlets(self) -> list[str]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT DISTINCT outlet FROM layer_stats ORDER BY outlet")
+            return [row[0] for row in rows]
+
+
+def get_outlet_stats(dist_root: Path) -> OutletStatsStore:
+    """Return the statistics store kept in ``dist/_valet/ledger_outlet_stats.sqlite3``."""
+    return OutletStatsStore(dist_root / _STATS_FILE)
@@ -8,7 +8,7 @@ def analyze_ownership(outlet: str) -> LayerScore:
         import json
         import re
 
-        from app.core.llm_client import call_llm
+        from app.core.llm_client import call_llm, llm_call_site
 
         system = (
             "You are a media ownership analyst. Respond with valid JSON only. "
@@ -19,7 +19,8 @@ def analyze_ownership(outlet: str) -> LayerScore:
             f"Analyze the ownership structure and known bias of this media outlet: {outlet!r}. "
             "Consider corporate ownership, known political alignment, and editorial independence risk."  # noqa: E501
         )
-        raw = call_llm(system_prompt=system, user_prompt=user).strip()
+        with llm_call_site("ledger.ownership"):
+            raw = call_llm(system_prompt=system, user_prompt=user).strip()
         raw = re.sub(r"^```[a-z]*\n?", "", raw)
         raw = re.sub(r"\n?```$", "", raw).strip()
         data: dict = json.loads(raw)
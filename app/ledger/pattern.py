@@ -1,14 +1,31 @@
 from __future__ import annotations
 
+import os
+
 from .models import LayerScore
 
 
 def analyze_pattern(article_input: object) -> LayerScore:
+    # Prefer the outlet's local audit history (see pattern_engine); the LLM
+    # judgement is the fallback when there is too little history, and can be
+    # switched off with LEDGER_PATTERN_LLM_FALLBACK=0.
+    engine = getattr(article_input, "pattern_engine", None)
+    if engine is not None:
+        local = engine.score(getattr(article_input, "outlet", "") or "")
+        if local is not None:
+            return local
+        if os.environ.get("LEDGER_PATTERN_LLM_FALLBACK", "1").strip() == "0":
+            return LayerScore(
+                score=0.0,
+                confidence=0.2,
+                notes="Too few prior audits of this outlet for pattern analysis.",
+            )
     try:
         import json
         import re
 
-        from app.core.llm_client import call_llm
+        from app.core.llm_client import call_llm, llm_call_site
+        from app.core.token_budget import fit_ledger_context
 
         text = getattr(article_input, "story_text", "") or getattr(article_input, "text", "") or ""
         outlet = getattr(article_input, "outlet", "") or ""
@@ -18,13 +35,15 @@ def analyze_pattern(article_input: object) -> LayerScore:
             'Schema: {"score": <float 0.0-1.0>, "confidence": <float 0.0-1.0>, "notes": <string>}. '
             "Score represents repeated distortion pattern risk (0=low, 1=high)."
         )
+        text = fit_ledger_context(text)
         context = f"Outlet: {outlet}\n\n{text}" if outlet else text
         user = (
             "Analyze the following content for repeated distortion patterns: "
             "recurring misleading frames, systematic omission of context, "
             "and evidence of coordinated narrative pushing:\n\n" + context
         )
-        raw = call_llm(system_prompt=system, user_prompt=user).strip()
+        with llm_call_site("ledger.pattern"):
+            raw = call_llm(system_prompt=system, user_prompt=user).strip()
         raw = re.sub(r"^```[a-z]*\n?", "", raw)
         raw = re.sub(r"\n?```$", "", raw).strip()
         data: dict = json.loads(raw)
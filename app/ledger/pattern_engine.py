@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import re
+import threading
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .models import LayerScore, outlet_key
+
+_PROFILE_DIR = "_valet/pattern_profiles"
+
+# Fewer prior audits than this is not a pattern; the caller falls back to the LLM.
+_MIN_AUDITS = 3
+# Hashed hook/claim trigrams remembered per outlet (oldest dropped first).
+_MAX_SHINGLES = 20_000
+_NGRAM = 3
+# An audit picks 3 of 7 distortion metrics, so any one of them recurs by chance
+# in about 3/7 of audits; only recurrence above that counts.
+_CHANCE_RECURRENCE = 3 / 7
+_MAX_CONFIDENCE = 0.9
+# Observations appended to an outlet's log before it is rewritten as one snapshot.
+_COMPACT_EVERY = 256
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def _shingles(texts: list[str]) -> set[int]:
+    """Hashed word trigrams of *texts*."""
+    out: set[int] = set()
+    for text in texts:
+        words = _WORD_RE.findall(text.lower())
+        for i in range(len(words) - _NGRAM + 1):
+            gram = " ".join(words[i : i + _NGRAM]).encode("utf-8")
+            out.add(int.from_bytes(hashlib.blake2b(gram, digest_size=8).digest(), "big"))
+    return out
+
+
+def _frame_texts(audit: dict[str, Any]) -> list[str]:
+    """Hook and claim texts of an audit: hook, final line, recommendation, score rationales."""
+    episode = audit.get("episode") or {}
+    texts = [
+        episode.get("hook", ""),
+        episode.get("final_line", ""),
+        audit.get("clinical_recommendation", ""),
+    ]
+    texts.extend(str(s.get("why", "")) for s in (audit.get("scores") or {}).values())
+    return [t for t in texts if t]
+
+
+def _observation(audit: dict[str, Any]) -> dict[str, list]:
+    """The parts of *audit* a profile keeps, as one log record."""
+    return {
+        "grams": sorted(_shingles(_frame_texts(audit))),
+        "distortions": sorted(set(audit.get("chosen_core_distortions") or [])),
+    }
+
+
+@dataclass
+class OutletPatternProfile:
+    audits: int = 0
+    distortion_counts: Counter[str] = field(default_factory=Counter)
+    # Sum over audits of the share of each audit's trigrams already seen for the outlet.
+    overlap_sum: float = 0.0
+    # Insertion-ordered so the oldest shingles are evicted first.
+    shingles: dict[int, None] = field(default_factory=dict)
+
+    def observe(self, audit: dict[str, Any]) -> None:
+        self.apply(_observation(audit))
+
+    def apply(self, record: dict[str, list]) -> None:
+        """Fold one :func:`_observation` record into the profile."""
+        grams = record["grams"]
+        if grams:
+            self.overlap_sum += sum(g in self.shingles for g in grams) / len(grams)
+        for gram in grams:
+            self.shingles.pop(gram, None)
+            self.shingles[gram] = None
+        while len(self.shingles) > _MAX_SHINGLES:
+            del self.shingles[next(iter(self.shingles))]
+        self.distortion_counts.update(record["distortions"])
+        self.audits += 1
+
+    def layer_score(self) -> LayerScore | None:
+        """Pattern layer score from the profile, or ``None`` with too little history."""
+        if self.audits < _MIN_AUDITS:
+            return None
+        top, top_count = (
+            self.distortion_counts.most_common(1)[0] if self.distortion_counts else ("", 0)
+        )
+        recurrence = top_count / self.audits
+        excess = max(0.0, (recurrence - _CHANCE_RECURRENCE) / (1 - _CHANCE_RECURRENCE))
+        overlap = self.overlap_sum / self.audits
+        score = min(1.0, 0.5 * excess + 0.5 * overlap)
+        confidence = min(_MAX_CONFIDENCE, self.audits / (self.audits + 4))
+        notes = (
+            f"Local pattern history over {self.audits} prior audits: "
+            f"'{top.replace('_', ' ')}' chosen in {recurrence:.0%} of them; "
+            f"{overlap:.0%} of hook and claim phrasing repeats earlier audits."
+        )
+        return LayerScore(score=score, confidence=confidence, notes=notes)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "audits": self.audits,
+            "distortion_counts": dict(self.distortion_counts),
+            "overlap_sum": self.overlap_sum,
+            "shingles": list(self.shingles),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OutletPatternProfile:
+        return cls(
+            audits=int(data["audits"]),
+            distortion_counts=Counter(data["distortion_counts"]),
+            overlap_sum=float(data["overlap_sum"]),
+            shingles=dict.fromkeys(data["shingles"]),
+        )
+
+
+@dataclass
+class _LoadedProfile:
+    # First line of the log it was read from; a compacted log starts with a new one.
+    header: bytes
+    # Bytes of the log folded in so far, and records appended after its snapshot.
+    offset: int
+    records: int
+    profile: OutletPatternProfile
+    score: LayerScore | None
+
+
+class PatternEngine:
+    """Per-outlet recurring-frame profiles built incrementally from prior audits.
+
+    Each outlet's profile is an append-only log: a header line, a snapshot
+    line, then one line per observed audit.  Profiles and their computed
+    scores are kept in memory, so :meth:`score` reads only what other
+    processes have appended since.  Updates hold a per-outlet file lock so
+    concurrent workers do not lose each other's audits, and append a single
+    line; every ``_COMPACT_EVERY`` audits the log is rewritten as a new
+    snapshot.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._lock = threading.Lock()
+        self._profiles: dict[str, _LoadedProfile] = {}
+
+    def _path(self, key: str) -> Path:
+        return self._root / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.log"
+
+    @contextmanager
+    def _file_locked(self, path: Path) -> Iterator[None]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_suffix(".lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _load(self, key: str) -> _LoadedProfile:
+        """*key*'s profile, folding in whatever was appended to its log since the last load."""
+        cached = self._profiles.get(key)
+        try:
+            log = open(self._path(key), "rb")
+        except FileNotFoundError:
+            if cached is None or cached.header:
+                cached = self._profiles[key] = _LoadedProfile(
+                    b"", 0, 0, OutletPatternProfile(), None
+                )
+            return cached
+        with log:
+            header = log.readline()
+            if cached is None or cached.header != header:
+                cached = _LoadedProfile(header, len(header), 0, OutletPatternProfile(), None)
+            log.seek(cached.offset)
+            data = log.read()
+        # Whole lines only; a line still being appended is read next time.
+        data = data[: data.rfind(b"\n") + 1]
+        if not data and key in self._profiles:
+            return cached
+        for line in data.splitlines():
+            try:
+                record = json.loads(line)
+                if "snapshot" in record:
+                    cached.profile = OutletPatternProfile.from_dict(record["snapshot"])
+                else:
+                    cached.profile.apply(record)
+                    cached.records += 1
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                continue
+        cached.offset += len(data)
+        cached.score = cached.profile.layer_score()
+        self._profiles[key] = cached
+        return cached
+
+    def score(self, outlet: str) -> LayerScore | None:
+        """Pattern layer score for *outlet* from its prior audits, or ``None`` if too few."""
+        with self._lock:
+            return self._load(outlet_key(outlet)).score
+
+    def observe(self, outlet: str, audit: dict[str, Any]) -> None:
+        """Fold a finished audit into *outlet*'s profile."""
+        key = outlet_key(outlet)
+        if not key:
+            return
+        path = self._path(key)
+        record = _observation(audit)
+        with self._lock, self._file_locked(path):
+            # Catch up under the lock: another process may have just appended.
+            loaded = self._load(key)
+            loaded.profile.apply(record)
+            if not loaded.header or loaded.records + 1 >= _COMPACT_EVERY:
+                header = json.dumps({"log": uuid.uuid4().hex}).encode("utf-8") + b"\n"
+                snapshot = json.dumps({"snapshot": loaded.profile.to_dict()}).encode("utf-8")
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(header + snapshot + b"\n")
+                tmp.replace(path)
+                loaded.header, loaded.records = header, 0
+                loaded.offset = len(header) + len(snapshot) + 1
+            else:
+                line = json.dumps(record).encode("utf-8") + b"\n"
+                with open(path, "ab") as log:
+                    log.write(line)
+                loaded.records += 1
+                loaded.offset += len(line)
+            loaded.score = loaded.profile.layer_score()
+
+
+_ENGINES: dict[Path, PatternEngine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_pattern_engine(dist_root: Path) -> PatternEngine:
+    """Return the process-wide engine for profiles kept in ``dist/_valet/pattern_profiles``."""
+    root = dist_root / _PROFILE_DIR
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(root)
+        if engine is None:
+            engine = _ENGINES[root] = PatternEngine(root)
+        return engine
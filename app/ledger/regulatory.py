@@ -8,7 +8,8 @@ def analyze_regulatory(article_input: object) -> LayerScore:
         import json
         import re
 
-        from app.core.llm_client import call_llm
+        from app.core.llm_client import call_llm, llm_call_site
+        from app.core.token_budget import fit_ledger_context
 
         text = getattr(article_input, "story_text", "") or getattr(article_input, "text", "") or ""
         outlet = getattr(article_input, "outlet", "") or ""
@@ -18,12 +19,14 @@ def analyze_regulatory(article_input: object) -> LayerScore:
             'Schema: {"score": <float 0.0-1.0>, "confidence": <float 0.0-1.0>, "notes": <string>}. '
             "Score represents regulatory/legal exposure risk (0=low, 1=high)."
         )
+        text = fit_ledger_context(text)
         context = f"Outlet: {outlet}\n\n{text}" if outlet else text
         user = (
             "Analyze the following content for regulatory violations, legal exposure, "
             "unverified legal claims, and compliance risks:\n\n" + context
         )
-        raw = call_llm(system_prompt=system, user_prompt=user).strip()
+        with llm_call_site("ledger.regulatory"):
+            raw = call_llm(system_prompt=system, user_prompt=user).strip()
         raw = re.sub(r"^```[a-z]*\n?", "", raw)
         raw = re.sub(r"\n?```$", "", raw).strip()
         data: dict = json.loads(raw)
@@ -8,7 +8,7 @@ def analyze_revenue(outlet: str) -> LayerScore:
         import json
         import re
 
-        from app.core.llm_client import call_llm
+        from app.core.llm_client import call_llm, llm_call_site
 
         system = (
             "You are a media revenue and advertiser conflict analyst. Respond with valid JSON only. "  # noqa: E501
@@ -20,7 +20,8 @@ def analyze_revenue(outlet: str) -> LayerScore:
             f"this media outlet: {outlet!r}. "
             "Consider dependence on advertising, known sponsor conflicts, and financial incentives to distort."  # noqa: E501
         )
-        raw = call_llm(system_prompt=system, user_prompt=user).strip()
+        with llm_call_site("ledger.revenue"):
+            raw = call_llm(system_prompt=system, user_prompt=user).strip()
         raw = re.sub(r"^```[a-z]*\n?", "", raw)
         raw = re.sub(r"\n?```$", "", raw).strip()
         data: dict = json.loads(raw)
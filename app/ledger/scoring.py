@@ -1,58 +1,123 @@
 from __future__ import annotations
 
+import contextvars
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+
 from .article import analyze_article_content
 from .editorial import analyze_editorial
-from .models import IntegrityLedgerResult
+from .models import IntegrityLedgerResult, LayerScore
+from .outlet_cache import cached_outlet_layer
 from .ownership import analyze_ownership
 from .pattern import analyze_pattern
 from .regulatory import analyze_regulatory
 from .revenue import analyze_revenue
 
+_LAYER_WEIGHTS: dict[str, float] = {
+    "ownership": 0.15,
+    "revenue": 0.20,
+    "editorial": 0.15,
+    "article": 0.25,
+    "regulatory": 0.10,
+    "pattern": 0.15,
+}
+
+
+# Exclusive upper bound of each risk level; totals at or above the last bound are STRUCTURAL.
+_RISK_BOUNDS: tuple[tuple[float, str], ...] = (
+    (0.25, "LOW"),
+    (0.50, "MODERATE"),
+    (0.75, "ELEVATED"),
+)
+
 
 def _categorize(total: float) -> str:
-    if total < 0.25:
-        return "LOW"
-    if total < 0.50:
-        return "MODERATE"
-    if total < 0.75:
-        return "ELEVATED"
+    for bound, level in _RISK_BOUNDS:
+        if total < bound:
+            return level
     return "STRUCTURAL"
 
 
+def _total_score(layers: dict[str, LayerScore]) -> float:
+    """Weighted total of *layers*; skipped layers are excluded and the weights renormalised."""
+    used = [name for name in _LAYER_WEIGHTS if layers[name].confidence is not None]
+    total = sum(layers[name].score * _LAYER_WEIGHTS[name] for name in used)
+    if len(used) < len(_LAYER_WEIGHTS):
+        used_weight = sum(_LAYER_WEIGHTS[name] for name in used)
+        total = total / used_weight if used_weight else 0.0
+    return total
+
+
+def _skipped_layer(deadline: float) -> LayerScore:
+    return LayerScore(
+        score=0.0,
+        confidence=None,
+        notes=f"Skipped: layer did not finish within the {deadline:g}s ledger deadline.",
+    )
+
+
+def _run_layers(article_input: object, deadline: float | None) -> dict[str, LayerScore]:
+    outlet = getattr(article_input, "outlet", "")
+    layers: dict[str, Callable[[], LayerScore]] = {
+        # Ownership and revenue depend only on the outlet; reuse recent results.
+        "ownership": lambda: cached_outlet_layer("ownership", outlet, analyze_ownership),
+        "revenue": lambda: cached_outlet_layer("revenue", outlet, analyze_revenue),
+        "editorial": lambda: analyze_editorial(article_input),
+        "article": lambda: analyze_article_content(article_input),
+        "regulatory": lambda: analyze_regulatory(article_input),
+        "pattern": lambda: analyze_pattern(article_input),
+    }
+    if deadline is None:
+        return {name: run() for name, run in layers.items()}
+
+    # Run the layers concurrently, each in a copy of the caller's context so LLM
+    # call-site attribution and token accounting still apply.  Layers still
+    # running at the deadline are abandoned; their threads finish in the background.
+    executor = ThreadPoolExecutor(max_workers=len(layers), thread_name_prefix="ledger-layer")
+    futures = {
+        name: executor.submit(contextvars.copy_context().run, run) for name, run in layers.items()
+    }
+    wait(futures.values(), timeout=deadline)
+    executor.shutdown(wait=False, cancel_futures=True)
+    return {
+        name: future.result() if future.done() else _skipped_layer(deadline)
+        for name, future in futures.items()
+    }
+
+
 def run_integrity_ledger(
-    article_input: object, include_damage_estimate: bool = False
+    article_input: object,
+    include_damage_estimate: bool = False,
+    deadline: float | None = None,
 ) -> IntegrityLedgerResult:
-    ownership = analyze_ownership(getattr(article_input, "outlet", ""))
-    revenue = analyze_revenue(getattr(article_input, "outlet", ""))
-    editorial = analyze_editorial(article_input)
-    article = analyze_article_content(article_input)
-    regulatory = analyze_regulatory(article_input)
-    pattern = analyze_pattern(article_input)
-
-    total = (
-        ownership.score * 0.15
-        + revenue.score * 0.20
-        + editorial.score * 0.15
-        + article.score * 0.25
-        + regulatory.score * 0.10
-        + pattern.score * 0.15
-    )
+    """
+    Score *article_input* on all six ledger layers.
 
+    With a *deadline* (seconds), layers run concurrently and any layer still
+    running when it expires is reported with ``confidence=None`` and listed in
+    ``skipped_layers``.  Skipped layers are excluded from ``total_score`` and
+    the remaining weights are renormalised.  The damage estimate is not
+    covered by the deadline.
+    """
+    layers = _run_layers(article_input, deadline)
+    skipped = [name for name, layer in layers.items() if layer.confidence is None]
+    total = _total_score(layers)
     risk = _categorize(total)
 
     result = IntegrityLedgerResult(
         outlet=getattr(article_input, "outlet", ""),
         article_id=getattr(article_input, "id", ""),
-        ownership=ownership,
-        revenue=revenue,
-        editorial=editorial,
-        article=article,
-        regulatory=regulatory,
-        pattern=pattern,
+        ownership=layers["ownership"],
+        revenue=layers["revenue"],
+        editorial=layers["editorial"],
+        article=layers["article"],
+        regulatory=layers["regulatory"],
+        pattern=layers["pattern"],
         total_score=total,
         risk_level=risk,
         damage_estimate=None,
         methodology_version="0.1-alpha",
+        skipped_layers=skipped,
     )
 
     if include_damage_estimate:
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import functools
+import os
+
+from PIL import ImageFont
+
+# Candidate files per (family, weight), in order of preference.
+_CANDIDATES: dict[tuple[str, str], tuple[str, ...]] = {
+    ("sans", "regular"): (
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "C:/Windows/Fonts/Arial.ttf",
+    ),
+    ("sans", "bold"): (
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "C:/Windows/Fonts/Arial.ttf",
+    ),
+}
+
+
+@functools.cache
+def _font_path(family: str, weight: str) -> str | None:
+    """First installed candidate for *family* and *weight*; probed once per process."""
+    for path in _CANDIDATES.get((family, weight), ()):
+        if os.path.exists(path):
+            try:
+                ImageFont.truetype(path, 12)
+            except Exception:
+                continue
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def get_font(
+    family: str, size: int, weight: str = "regular"
+) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Shared font for (*family*, *size*, *weight*), loaded once per process.
+
+    Falls back to Pillow's built-in bitmap font when no candidate file is
+    installed.  Returned fonts are shared; do not mutate them.
+    """
+    path = _font_path(family, weight)
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
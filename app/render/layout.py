@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import functools
+
+from PIL import ImageFont
+
+Font = ImageFont.FreeTypeFont | ImageFont.ImageFont
+
+
+class _Advances(dict[str, float]):
+    """Advance width per character of one font, measured on first use."""
+
+    def __init__(self, font: Font) -> None:
+        super().__init__()
+        self._font = font
+
+    def __missing__(self, char: str) -> float:
+        width = self[char] = self._font.getlength(char)
+        return width
+
+
+# Per font object.  Fonts come from the cached get_font and live for the process
+# (wrap_text's cache holds them too), so entries are never dropped.
+_ADVANCES: dict[Font, _Advances] = {}
+
+
+def _advances(font: Font) -> _Advances:
+    advances = _ADVANCES.get(font)
+    if advances is None:
+        advances = _ADVANCES[font] = _Advances(font)
+    return advances
+
+
+def _right_edge(font: Font, text: str) -> float:
+    """Right edge of *text* drawn at x=0, as ``ImageDraw.textbbox`` reports it."""
+    return font.getbbox(text)[2]
+
+
+@functools.lru_cache(maxsize=1024)
+def wrap_text(text: str, font: Font, width: int) -> tuple[str, ...]:
+    """Break *text* into lines no wider than *width* pixels in *font*.
+
+    Greedy word wrap: each line takes as many whole words as fit, and a word
+    wider than *width* gets a line of its own.  Line ends are estimated from
+    cached glyph advances and then confirmed with the font's bounding box,
+    so the result matches measuring every candidate line, at about two
+    measurements per line instead of one per word.  Layouts are memoized by
+    (text, font, width); fonts from :func:`~app.render.fonts.get_font` are
+    shared, so the receipt and every video frame reuse them.
+    """
+    words = text.split()
+    if not words:
+        return ()
+    advances = _advances(font)
+    space = advances[" "]
+    word_widths = [sum(advances[c] for c in word) for word in words]
+
+    lines: list[str] = []
+    start = 0
+    while start < len(words):
+        # Estimate: the last word whose advance-width sum still fits.
+        end = start + 1
+        estimate = word_widths[start]
+        while end < len(words) and estimate + space + word_widths[end] <= width:
+            estimate += space + word_widths[end]
+            end += 1
+        # Confirm against the real extent, in either direction.
+        while end - 1 > start and _right_edge(font, " ".join(words[start:end])) > width:
+            end -= 1
+        while end < len(words) and _right_edge(font, " ".join(words[start : end + 1])) <= width:
+            end += 1
+        lines.append(" ".join(words[start:end]))
+        start = end
+    return tuple(lines)
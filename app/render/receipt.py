@@ -1,40 +1,71 @@
 from __future__ import annotations
 
+import functools
 import json
-import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .encoding import DEFAULT_ENCODING, ImageEncoding, get_encoding
+from .fonts import get_font
+from .layout import wrap_text
 
 W, H = 720, 1280
 
+_VITALS_Y = 214
+_HONESTY_Y = H - 310
+# Inclusive rectangle corners of the honesty strip background.
+_HONESTY_BOX = ((30, _HONESTY_Y - 8), (W - 30, H - 230))
+
+
+@functools.cache
+def _template() -> Image.Image:
+    """The parts of the receipt that never change, drawn once per process.
+
+    Background, title, the VITALS header and the honesty strip with its
+    header.  Receipts copy this and draw only their own text.
+    """
+    img = Image.new("RGB", (W, H), (8, 8, 18))
+    draw = ImageDraw.Draw(img)
+    section_font = get_font("sans", 28, "bold")
+    draw.text(
+        (40, 40),
+        "VALET STUDIO — LOBBY RECEIPT",
+        font=get_font("sans", 44, "bold"),
+        fill=(180, 140, 255),
+    )
+    draw.text((40, _VITALS_Y), "VITALS", font=section_font, fill=(120, 200, 255))
+    draw.rectangle(_HONESTY_BOX, fill=(20, 20, 35))
+    draw.text((40, _HONESTY_Y), "HONESTY STRIP", font=section_font, fill=(255, 220, 60))
+    return img
+
 
-def _font(size: int, bold: bool = False):
-    candidates = [
-        (
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-            if bold
-            else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-        ),
-        (
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf"
-            if bold
-            else "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
-        ),
-        "/System/Library/Fonts/Helvetica.ttc",
-        "C:/Windows/Fonts/Arial.ttf",
-    ]
-    for p in candidates:
-        if p and os.path.exists(p):
-            try:
-                return ImageFont.truetype(p, size)
-            except Exception:
-                pass
-    return ImageFont.load_default()
+@dataclass(frozen=True)
+class RenderedReceipt:
+    json_path: Path
+    # receipt.png, or receipt.<suffix> for a non-PNG encoding.
+    image_path: Path
+    # The receipt as a W×H RGB array, ready to use as a video frame.
+    frame: np.ndarray
 
 
 def render_receipt_from_audit(audit: dict[str, Any], out_dir: str | Path) -> tuple[Path, Path]:
+    rendered = render_receipt(audit, out_dir)
+    return rendered.json_path, rendered.image_path
+
+
+def render_receipt(
+    audit: dict[str, Any], out_dir: str | Path, encoding: ImageEncoding | None = None
+) -> RenderedReceipt:
+    """Write ``receipt.json`` and the receipt image and keep the image in memory.
+
+    *encoding* defaults to the ``default`` preset (Pillow's PNG defaults).  Pass
+    :attr:`RenderedReceipt.frame` to the video renderer so it does not
+    decode the image again.
+    """
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -42,25 +73,31 @@ def render_receipt_from_audit(audit: dict[str, Any], out_dir: str | Path) -> tup
     json_path = out_dir / "receipt.json"
     json_path.write_text(json.dumps(receipt, indent=2, ensure_ascii=False), encoding="utf-8")
 
-    img = Image.new("RGB", (W, H), (8, 8, 18))
+    img = draw_receipt(audit)
+    encoding = encoding or get_encoding(DEFAULT_ENCODING)
+    image_path = encoding.save(img, out_dir / "receipt")
+    return RenderedReceipt(json_path=json_path, image_path=image_path, frame=np.asarray(img))
+
+
+def draw_receipt(audit: dict[str, Any]) -> Image.Image:
+    """The receipt image for *audit*, without writing anything."""
+    receipt = audit["receipt"]
+    template = _template()
+    img = template.copy()
     draw = ImageDraw.Draw(img)
 
-    title = _font(44, bold=True)
-    body = _font(26, bold=False)
-    mono = _font(22, bold=False)
-    discharge_font = _font(32, bold=True)
-    section_font = _font(28, bold=True)
+    body = get_font("sans", 26)
+    mono = get_font("sans", 22)
+    discharge_font = get_font("sans", 32, "bold")
+    section_font = get_font("sans", 28, "bold")
 
-    draw.text((40, 40), "VALET STUDIO — LOBBY RECEIPT", font=title, fill=(180, 140, 255))
     y = 130
     draw.text((40, y), f"SLUG: {receipt['slug']}", font=mono, fill=(180, 180, 195))
     y += 34
     draw.text((40, y), f"MODE: {receipt['mode']}", font=mono, fill=(180, 180, 195))
-    y += 50
 
-    # Vitals: all distortion scores
-    draw.text((40, y), "VITALS", font=section_font, fill=(120, 200, 255))
-    y += 36
+    # Vitals: all distortion scores (the header is part of the template)
+    y = _VITALS_Y + 36
     for metric_id, metric_data in audit["scores"].items():
         label = f"{metric_id}:  {metric_data['score']}/5"
         draw.text((60, y), label, font=mono, fill=(200, 200, 215))
@@ -85,28 +122,16 @@ def render_receipt_from_audit(audit: dict[str, Any], out_dir: str | Path) -> tup
     y += 10
     draw.text((40, y), "DISCHARGE INSTRUCTIONS", font=section_font, fill=(255, 100, 100))
     y += 40
-    words = receipt["clinical_recommendation"].split()
-    line = ""
-    lines: list[str] = []
-    for w in words:
-        test = (line + " " + w).strip()
-        if draw.textbbox((0, 0), test, font=discharge_font)[2] > W - 80 and line:
-            lines.append(line)
-            line = w
-        else:
-            line = test
-    if line:
-        lines.append(line)
-    for ln in lines:
+    for ln in wrap_text(receipt["clinical_recommendation"], discharge_font, W - 80):
         draw.text((40, y), ln, font=discharge_font, fill=(255, 200, 200))
         y += 44
 
     # ── Honesty Strip ─────────────────────────────────────────────────────────
     # Compact block that must survive screenshot review; rendered before stamps.
-    honesty_y = H - 310
-    draw.rectangle([(30, honesty_y - 8), (W - 30, H - 230)], fill=(20, 20, 35))
-    draw.text((40, honesty_y), "HONESTY STRIP", font=section_font, fill=(255, 220, 60))
-    honesty_y += 32
+    # Restore the template's strip over any text that ran into it.
+    (left, top), (right, bottom) = _HONESTY_BOX
+    img.paste(template.crop((left, top, right + 1, bottom + 1)), (left, top))
+    honesty_y = _HONESTY_Y + 32
 
     epistemic = audit.get("epistemic", {})
     confidence = epistemic.get("confidence_score", "n/a")
@@ -151,10 +176,7 @@ def render_receipt_from_audit(audit: dict[str, Any], out_dir: str | Path) -> tup
     )
     # ── end Honesty Strip ──────────────────────────────────────────────────────
 
-    stamp = _font(64, bold=True)
+    stamp = get_font("sans", 64, "bold")
     draw.text((40, H - 220), receipt["lobby_stamp"], font=stamp, fill=(200, 60, 60))
     draw.text((40, H - 120), receipt["cta"], font=body, fill=(180, 140, 255))
-
-    png_path = out_dir / "receipt.png"
-    img.save(png_path, "PNG")
-    return json_path, png_path
+    return img
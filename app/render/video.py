@@ -5,7 +5,10 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+
+from .fonts import get_font
+from .layout import wrap_text
 
 FRAME_W, FRAME_H = 720, 1280
 FPS = 24
@@ -13,38 +16,18 @@ RECEIPT_DURATION_S = 2
 JITTER_PX = 3
 
 
-def _font(size: int):
-    try:
-        return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
-    except Exception:
-        return ImageFont.load_default()
-
-
 def _draw_frame(text: str, hook: str, seed: str) -> np.ndarray:
     img = Image.new("RGB", (FRAME_W, FRAME_H), (15, 10, 25))
     draw = ImageDraw.Draw(img)
 
-    title = _font(34)
-    body = _font(44)
+    title = get_font("sans", 34, "bold")
+    body = get_font("sans", 44, "bold")
 
     draw.text((40, 40), "THE LOBBY", font=title, fill=(180, 140, 255))
     draw.text((40, 90), hook[:70], font=title, fill=(180, 180, 195))
 
     y = 360
-    words = text.split()
-    line = ""
-    lines: list[str] = []
-    for w in words:
-        test = (line + " " + w).strip()
-        if draw.textbbox((0, 0), test, font=body)[2] > FRAME_W - 80 and line:
-            lines.append(line)
-            line = w
-        else:
-            line = test
-    if line:
-        lines.append(line)
-
-    for ln in lines[:6]:
+    for ln in wrap_text(text, body, FRAME_W - 80)[:6]:
         draw.text((40, y), ln, font=body, fill=(245, 245, 255))
         y += 70
 
@@ -53,8 +36,17 @@ def _draw_frame(text: str, hook: str, seed: str) -> np.ndarray:
 
 
 def render_video_from_audit(
-    audit: dict[str, Any], receipt_png: str | Path, out_dir: str | Path
+    audit: dict[str, Any],
+    receipt_png: str | Path,
+    out_dir: str | Path,
+    receipt_frame: np.ndarray | None = None,
 ) -> Path:
+    """Render ``video.mp4``: one jittered frame per shot, then the receipt.
+
+    *receipt_frame* is the receipt already in memory (see
+    :func:`~app.render.receipt.render_receipt`); without it, *receipt_png*
+    is read from disk.
+    """
     from moviepy.editor import ImageClip, concatenate_videoclips  # type: ignore
 
     out_dir = Path(out_dir)
@@ -85,8 +77,10 @@ def render_video_from_audit(
 
         clips.append(base.fl(lambda gf, t, _mf=make_frame: _mf(t)))
 
-    receipt = Image.open(receipt_png).convert("RGB").resize((FRAME_W, FRAME_H))
-    clips.append(ImageClip(np.array(receipt)).set_duration(RECEIPT_DURATION_S))
+    if receipt_frame is None or receipt_frame.shape != (FRAME_H, FRAME_W, 3):
+        with Image.open(receipt_png) as receipt:
+            receipt_frame = np.array(receipt.convert("RGB").resize((FRAME_W, FRAME_H)))
+    clips.append(ImageClip(receipt_frame).set_duration(RECEIPT_DURATION_S))
 
     final = concatenate_videoclips(clips, method="compose")
     out_path = Path(out_dir) / "video.mp4"
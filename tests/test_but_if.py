@@ -116,3 +116,80 @@ def test_damage_estimate_serialization() -> None:
     assert "stakes" in d
     assert "episode" in d
     assert len(d) == 3  # exactly 3 keys
+
+
+def test_damage_estimate_memoized_by_risk_profile(monkeypatch: pytest.MonkeyPatch) -> None:
+    import app.core.llm_client as llm_mod
+    from app.ledger.but_if import DamageEstimateMemo, generate_damage_estimate
+    from app.ledger.models import LayerScore
+
+    calls: list[str] = []
+
+    def _fake_llm(system_prompt: str, user_prompt: str) -> str:
+        calls.append(user_prompt)
+        return json.dumps(
+            {"scenario": f"s{len(calls)}", "stakes": "k", "episode": {"hook": "h", "shots": []}}
+        )
+
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setattr(llm_mod, "call_llm", _fake_llm)
+    monkeypatch.setattr("app.ledger.but_if._MEMO", DamageEstimateMemo(max_size=2))
+
+    first = generate_damage_estimate(_make_ledger("STRUCTURAL"))
+    first.episode["hook"] = "modified by caller"
+
+    near = _make_ledger("STRUCTURAL")
+    near.ownership = LayerScore(score=0.11, confidence=0.5, notes="test")
+    again = generate_damage_estimate(near)
+    assert again.scenario == "s1"
+    assert again.episode["hook"] == "h"
+    assert len(calls) == 1
+
+    generate_damage_estimate(_make_ledger("LOW"))
+    skipped = _make_ledger("STRUCTURAL")
+    skipped.pattern = LayerScore(score=0.1, confidence=None, notes="skipped")
+    generate_damage_estimate(skipped)
+    assert len(calls) == 3
+
+    # Size 2: the first profile was evicted.
+    generate_damage_estimate(_make_ledger("STRUCTURAL"))
+    assert len(calls) == 4
+
+
+def test_damage_estimate_memo_is_keyed_on_the_routed_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import app.core.llm_client as llm_mod
+    from app.ledger.but_if import DamageEstimateMemo, generate_damage_estimate
+
+    calls: list[str] = []
+
+    def _fake_llm(system_prompt: str, user_prompt: str) -> str:
+        calls.append(user_prompt)
+        return json.dumps(
+            {"scenario": f"s{len(calls)}", "stakes": "k", "episode": {"hook": "h", "shots": []}}
+        )
+
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setattr(llm_mod, "call_llm", _fake_llm)
+    monkeypatch.setattr("app.ledger.but_if._MEMO", DamageEstimateMemo())
+
+    generate_damage_estimate(_make_ledger("STRUCTURAL"))
+    generate_damage_estimate(_make_ledger("STRUCTURAL"))
+    assert len(calls) == 1
+
+    monkeypatch.setenv("LLM_ROUTES", "but_if=small")
+    assert generate_damage_estimate(_make_ledger("STRUCTURAL")).scenario == "s2"
+    monkeypatch.setenv("OPENAI_MODEL_SMALL", "gpt-4.1-mini")
+    assert generate_damage_estimate(_make_ledger("STRUCTURAL")).scenario == "s3"
+
+
+@pytest.mark.parametrize(("value", "size"), [("", 256), ("lots", 256), ("-5", 0), (" 8 ", 8)])
+def test_memo_size_from_env_is_parsed_defensively(
+    monkeypatch: pytest.MonkeyPatch, value: str, size: int
+) -> None:
+    from app.ledger import but_if
+
+    monkeypatch.setenv("BUT_IF_MEMO_SIZE", value)
+    monkeypatch.setattr(but_if, "_MEMO", None)
+    assert but_if.get_damage_estimate_memo()._max_size == size
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+_SET = """\
+version: "{version}"
+banned:
+  - '\\bcorrupt\\w*\\b'
+loaded:
+  - '{loaded}'
+"""
+
+
+def _write(path: Path, version: str, loaded: str = r"\bshady\b", mtime: int = 0) -> None:
+    path.write_text(_SET.format(version=version, loaded=loaded), encoding="utf-8")
+    if mtime:
+        os.utime(path, (mtime, mtime))
+
+
+def test_packaged_pattern_set_matches_guard_constants() -> None:
+    from app.doctrine.guard import BANNED_PHRASES, LOADED_MODIFIERS
+    from app.doctrine.patterns import DEFAULT_PATTERNS_PATH, load_pattern_set
+
+    packaged = load_pattern_set(DEFAULT_PATTERNS_PATH)
+    assert packaged.version == "1"
+    assert list(packaged.banned) == BANNED_PHRASES
+    assert list(packaged.loaded) == LOADED_MODIFIERS
+    assert packaged.scanner.patterns == BANNED_PHRASES + LOADED_MODIFIERS
+
+
+def test_parse_pattern_set_caches_by_content_and_validates() -> None:
+    from app.doctrine.patterns import parse_pattern_set
+
+    text = _SET.format(version="7", loaded=r"\bshady\b")
+    first = parse_pattern_set(text)
+    assert parse_pattern_set("# reviewed\n" + text) is first
+    assert parse_pattern_set(_SET.format(version="8", loaded=r"\bshady\b")) is not first
+
+    with pytest.raises(ValueError, match="invalid pattern"):
+        parse_pattern_set(_SET.format(version="9", loaded="(unclosed"))
+    with pytest.raises(ValueError, match="version"):
+        parse_pattern_set("banned: []\nloaded: []\n")
+
+
+def test_watcher_swaps_in_edited_set_and_keeps_last_good(tmp_path: Path) -> None:
+    from app.doctrine.guard import enforce_language_constraints
+    from app.doctrine.patterns import PatternSetWatcher
+
+    path = tmp_path / "patterns.yaml"
+    _write(path, "1", mtime=1_000)
+    watcher = PatternSetWatcher(path, interval=0)
+    v1 = watcher.current()
+    assert v1.version == "1"
+    assert watcher.current() is v1
+
+    _write(path, "2", loaded=r"\brigged\b", mtime=2_000)
+    v2 = watcher.current()
+    assert v2.version == "2"
+    # A check that started on v1 finishes on v1.
+    assert enforce_language_constraints("a shady deal", v1).loaded_modifier_warnings
+    assert not enforce_language_constraints("a shady deal", v2).loaded_modifier_warnings
+    assert enforce_language_constraints("a rigged vote", v2).loaded_modifier_warnings
+
+    path.write_text("version: '3'\nbanned: ['(']\nloaded: []\n", encoding="utf-8")
+    os.utime(path, (3_000, 3_000))
+    assert watcher.current() is v2
+
+
+def test_checks_follow_doctrine_patterns_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.doctrine.guard import check_doctrine, enforce_language_constraints
+    from app.doctrine.patterns import current_pattern_set
+
+    path = tmp_path / "patterns.yaml"
+    _write(path, "custom", loaded=r"\bkickback\b")
+    monkeypatch.setenv("DOCTRINE_PATTERNS_PATH", str(path))
+
+    assert current_pattern_set().version == "custom"
+    assert check_doctrine("It was criminal.") == []
+    assert [v.matched_text for v in check_doctrine("Corruptly done.")] == ["Corruptly"]
+    result = enforce_language_constraints("A kickback from a shady firm.")
+    assert [w.matched_text for w in result.loaded_modifier_warnings] == ["kickback"]
+
+    monkeypatch.delenv("DOCTRINE_PATTERNS_PATH")
+    assert current_pattern_set().version == "1"
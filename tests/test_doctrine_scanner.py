@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+
+def _legacy(patterns: list[str], text: str) -> list[tuple[int, str, int]]:
+    out = []
+    for i, pattern in enumerate(patterns):
+        for match in re.compile(pattern, re.IGNORECASE).finditer(text):
+            out.append((i, match.group(), match.start()))
+    return out
+
+
+def _scan(patterns: list[str], text: str) -> list[tuple[int, str, int]]:
+    from app.doctrine.scanner import DoctrineScanner
+
+    return [
+        (m.pattern_index, m.matched_text, m.position) for m in DoctrineScanner(patterns).scan(text)
+    ]
+
+
+def test_scanner_matches_per_pattern_finditer_on_doctrine_patterns() -> None:
+    from app.doctrine.guard import BANNED_PHRASES, LOADED_MODIFIERS
+
+    rng = random.Random(3)
+    vocab = [
+        "the",
+        "senator",
+        "Corruptly",
+        "manipulated",
+        "intended to",
+        "intent",
+        "cover-up",
+        "coverup",
+        "payoff",
+        "pay off",
+        "hiding",
+        "guiltily",
+        "proof of",
+        "schemes",
+        "exploitation",
+        "sell out",
+        "immorality,",
+        "FRAUDULENT.",
+    ]
+    text = " ".join(rng.choice(vocab) for _ in range(5000))
+    patterns = BANNED_PHRASES + LOADED_MODIFIERS
+    assert _scan(patterns, text) == _legacy(patterns, text)
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        # Overlapping patterns and a pattern that matches inside another's match.
+        [r"\bcover.?up\b", r"\bup\b", r"over", r"\bcover\b"],
+        # No leading literal: the character-class guard must be skipped.
+        [r"x?y", r"[0-9]+", r"\bfoo|bar"],
+        [],
+    ],
+)
+def test_scanner_matches_per_pattern_finditer_on_overlaps(patterns: list[str]) -> None:
+    text = "cover up, coverup and cover. xy y 123 foobar bar COVER-UP"
+    assert _scan(patterns, text) == _legacy(patterns, text)
+
+
+def test_guard_results_unchanged() -> None:
+    from app.doctrine.guard import check_doctrine, enforce_language_constraints
+
+    text = "Corruption and a cover-up; the intent was shady. Criminally rigged."
+    result = enforce_language_constraints(text)
+    # Ordered by pattern, then by position, as before.
+    assert [(v.matched_text, v.position) for v in result.violations] == [
+        ("Corruption", 0),
+        ("Criminally", 49),
+        ("intent", 31),
+    ]
+    assert [v.matched_text for v in result.loaded_modifier_warnings] == [
+        "rigged",
+        "shady",
+        "cover-up",
+    ]
+    assert check_doctrine(text) == result.violations
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stream_matches_whole_text_across_chunk_boundaries(seed: int) -> None:
+    from app.doctrine.guard import LanguageConstraintStream, enforce_language_constraints
+
+    rng = random.Random(seed)
+    vocab = ["the", "vote", "corruption", "Corruptly", "conflict of interest", "pay-off"]
+    vocab += ["manipulated", "intended to", "cover up", "proof of", "hiding", "intent."]
+    text = " ".join(rng.choice(vocab) for _ in range(3000))
+
+    stream = LanguageConstraintStream()
+    violations, warnings = [], []
+    pos = 0
+    while pos < len(text):
+        # Chunks of 1-40 characters split words and phrases at arbitrary points.
+        size = rng.randint(1, 40)
+        result = stream.feed(text[pos : pos + size])
+        violations += result.violations
+        warnings += result.loaded_modifier_warnings
+        pos += size
+        assert len(stream._scanner._buffer) < 200
+    result = stream.close()
+    violations += result.violations
+    warnings += result.loaded_modifier_warnings
+
+    expected = enforce_language_constraints(text)
+
+    def key(v):
+        return (v.phrase_pattern, v.position)
+
+    assert sorted(violations, key=key) == sorted(expected.violations, key=key)
+    assert sorted(warnings, key=key) == sorted(expected.loaded_modifier_warnings, key=key)
+
+
+def test_stream_holds_back_a_word_that_may_continue() -> None:
+    from app.doctrine.guard import LanguageConstraintStream
+
+    stream = LanguageConstraintStream()
+    # "corrupt" could still become "corruption": not reported until the word ends.
+    assert stream.feed("a long preamble about the budget vote, then corrupt").violations == []
+    assert stream.feed("ion").violations == []
+    result = stream.close()
+    assert [(v.matched_text, v.position) for v in result.violations] == [("corruption", 44)]
+
+
+def test_check_corpus_across_processes_matches_in_process() -> None:
+    from app.doctrine.guard import CorpusCheckStats, check_corpus
+
+    records = [
+        (f"run-{i}", surface, text)
+        for i in range(40)
+        for surface, text in [
+            ("receipt_hook", "A shady payoff." if i % 3 == 0 else "Nothing to see."),
+            ("narration_script", "Proof of corruption." if i % 7 == 0 else "Budget talks."),
+        ]
+    ]
+
+    stats = CorpusCheckStats()
+    pooled = list(check_corpus(iter(records), workers=2, batch_size=7, stats=stats))
+    assert pooled == list(check_corpus(records, workers=1))
+
+    assert stats.records == len(records)
+    assert stats.violations == 2 * 6
+    assert stats.warnings == 2 * 14
+    assert [f.id for f in pooled] == sorted((f.id for f in pooled), key=lambda s: int(s[4:]))
+    first = pooled[0]
+    assert (first.id, first.surface, first.severity, first.matched) == (
+        "run-0",
+        "receipt_hook",
+        "warning",
+        "shady",
+    )
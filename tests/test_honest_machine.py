@@ -295,6 +295,63 @@ def test_pipeline_doctrine_abort_no_video_artifact(
     assert video_files == [], "video.mp4 must not be written after doctrine abort"
 
 
+def test_pipeline_doctrine_preflight_skips_audit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A banned phrase in the input aborts before the audit or ledger runs."""
+    import json
+
+    from app.core import pipeline_service
+
+    def _no_audit(**kwargs):
+        raise AssertionError("audit must not run for a doomed input")
+
+    monkeypatch.setattr(pipeline_service, "_DIST", tmp_path / "dist")
+    monkeypatch.setattr(pipeline_service, "run_audit", _no_audit)
+
+    with pytest.raises(pipeline_service.DoctrineViolationError) as excinfo:
+        pipeline_service.run_pipeline(
+            mode="scalpel-ledger",
+            story_text="Officials acted illegally to conceal information.",
+        )
+    assert excinfo.value.surface == "story_text"
+
+    aborted_files = list((tmp_path / "dist").rglob("ABORTED.json"))
+    assert len(aborted_files) == 1
+    aborted = json.loads(aborted_files[0].read_text(encoding="utf-8"))
+    assert aborted["surface"] == "story_text"
+    assert aborted["violations"] == [{"pattern": r"\billegal\w*\b", "matched": "illegally"}]
+
+
+def test_pipeline_doctrine_checks_generated_surfaces_after_preflight(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Generated surfaces are still checked; input warnings still reach internal_audit."""
+    import yaml
+
+    from app.core import pipeline_service
+
+    run_audit = pipeline_service.run_audit
+
+    def _audit_with_banned_hook(**kwargs):
+        audit = run_audit(**kwargs)
+        audit["episode"]["hook"] = "This is fraud."
+        return audit
+
+    monkeypatch.setattr(pipeline_service, "_DIST", tmp_path / "dist")
+    result = pipeline_service.run_pipeline(
+        mode="scalpel", story_text="A shady deal was struck on the budget."
+    )
+    with open(result["audit_yaml"], encoding="utf-8") as f:
+        internal = yaml.safe_load(f)["audit"]["internal_audit"]
+    assert {"pattern": r"\bshady\b", "matched": "shady"} in internal["loaded_modifier_warnings"]
+
+    monkeypatch.setattr(pipeline_service, "run_audit", _audit_with_banned_hook)
+    with pytest.raises(pipeline_service.DoctrineViolationError) as excinfo:
+        pipeline_service.run_pipeline(mode="scalpel", story_text="A clean story about budgets.")
+    assert excinfo.value.surface == "narration_script"
+
+
 def test_pipeline_includes_epistemic_block(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     from app.core import pipeline_service
 
@@ -339,6 +396,7 @@ def test_pipeline_includes_internal_audit(tmp_path: Path, monkeypatch: pytest.Mo
     assert "doctrine_status" in ia
     assert "actions_required" in ia
     assert ia["doctrine_status"] == "PASS"
+    assert ia["doctrine_version"] == "1"
 
 
 def test_pipeline_includes_missing_data_disclosure(
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+_PAYLOAD = {
+    "scores": {"limbic_lure": {"score": 3, "why": 'a "quoted" {brace}', "metaphor": "m"}},
+    "chosen_core_distortions": ["limbic_lure", "opacity"],
+    "clinical_recommendation": "Discharge when ready.\nEscaped \\ slash.",
+    "confidence": 0.5,
+    "flagged": True,
+    "note": None,
+    "episode": {"hook": "h", "shots": [{"index": 1, "text": "s1"}]},
+}
+
+
+def _chunks(text: str, rng: random.Random) -> list[str]:
+    out, i = [], 0
+    while i < len(text):
+        step = rng.randint(1, 7)
+        out.append(text[i : i + step])
+        i += step
+    return out
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_parser_emits_fields_in_order(seed: int) -> None:
+    from app.core.json_stream import IncrementalJSONParser
+
+    raw = "```json\n" + json.dumps(_PAYLOAD, indent=2) + "\n```"
+    parser = IncrementalJSONParser()
+    seen: list[str] = []
+    for chunk in _chunks(raw, random.Random(seed)):
+        for key, value in parser.feed(chunk):
+            assert value == _PAYLOAD[key]
+            seen.append(key)
+
+    assert parser.done
+    assert seen == list(_PAYLOAD)
+    assert parser.close() == _PAYLOAD
+
+
+def test_incremental_parser_reports_field_before_stream_ends() -> None:
+    from app.core.json_stream import IncrementalJSONParser
+
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"scores": {"a": 1}, "episode": {"hook"') == [("scores", {"a": 1})]
+    assert not parser.done
+    with pytest.raises(json.JSONDecodeError):
+        parser.close()
+
+
+def test_streamed_audit_reports_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    import app.core.llm_client as llm_mod
+    from app.core.audit_service import run_audit
+
+    payload = {
+        "scores": {"limbic_lure": {"score": 2, "why": "w", "metaphor": "m"}},
+        "chosen_core_distortions": ["limbic_lure"],
+        "clinical_recommendation": "Noted.",
+        "episode": {"hook": "h", "final_line": "f", "cta": "c", "shots": []},
+    }
+
+    class _StreamingClient:
+        last_usage = None
+
+        def generate(self, system: str, user: str) -> str:
+            raise AssertionError("streaming audit must not use generate()")
+
+        def stream(self, system: str, user: str):
+            text = json.dumps(payload)
+            for i in range(0, len(text), 5):
+                yield text[i : i + 5]
+            self.last_usage = (100, 40)
+
+    monkeypatch.setattr(llm_mod, "get_llm_client", lambda: _StreamingClient())
+
+    fields: list[str] = []
+    result = run_audit(
+        mode="scalpel",
+        story_text="Test story.",
+        on_field=lambda key, value: fields.append(key),
+    )
+
+    assert fields == ["scores", "chosen_core_distortions", "clinical_recommendation", "episode"]
+    assert result["clinical_recommendation"] == "Noted."
+    assert result["receipt"]["distortions_display"] == [{"id": "limbic_lure", "score": 2}]
@@ -179,3 +179,149 @@ def test_scalpel_ledger_mode_includes_damage_estimate(
         ledger = json.load(f)
 
     assert ledger.get("damage_estimate") is not None
+
+
+def test_outlet_layers_are_cached_across_articles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import app.core.llm_client as llm_mod
+    from app.ledger.scoring import run_integrity_ledger
+
+    calls: list[str] = []
+
+    def _fake_llm(system_prompt: str, user_prompt: str) -> str:
+        calls.append(system_prompt.split(".")[0])
+        return json.dumps({"score": 0.4, "confidence": 0.7, "notes": "n"})
+
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("LEDGER_OUTLET_CACHE_DB", str(tmp_path / "outlets.sqlite3"))
+    monkeypatch.setattr(llm_mod, "call_llm", _fake_llm)
+
+    class _Article:
+        def __init__(self, outlet: str, id: str) -> None:
+            self.outlet = outlet
+            self.id = id
+
+    run_integrity_ledger(_Article("Example Times", "a1"))
+    run_integrity_ledger(_Article("example  times", "a2"))
+    # The second article from the same outlet skips ownership and revenue.
+    assert len(calls) == 10
+    assert sum("ownership" in c for c in calls) == 1
+    assert sum("revenue" in c for c in calls) == 1
+
+    run_integrity_ledger(_Article("Other Herald", "a3"))
+    assert sum("ownership" in c for c in calls) == 2
+
+
+def test_outlet_cache_misses_after_a_model_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.ledger.models import LayerScore
+    from app.ledger.outlet_cache import cached_outlet_layer
+
+    calls: list[str] = []
+
+    def _analyze(outlet: str) -> LayerScore:
+        calls.append(outlet)
+        return LayerScore(0.4, 0.7, "n")
+
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("LEDGER_OUTLET_CACHE_DB", str(tmp_path / "outlets.sqlite3"))
+
+    cached_outlet_layer("ownership", "Example Times", _analyze)
+    cached_outlet_layer("ownership", "Example Times", _analyze)
+    assert len(calls) == 1
+
+    monkeypatch.setenv("OPENAI_MODEL_SMALL", "gpt-4.1-mini")
+    cached_outlet_layer("ownership", "Example Times", _analyze)
+    assert len(calls) == 2
+
+    monkeypatch.setenv("LLM_ROUTES", "ledger.ownership=large")
+    cached_outlet_layer("ownership", "Example Times", _analyze)
+    cached_outlet_layer("ownership", "Example Times", _analyze)
+    assert len(calls) == 3
+
+
+def test_outlet_cache_expires_entries(tmp_path: Path) -> None:
+    from app.ledger.models import LayerScore
+    from app.ledger.outlet_cache import OutletLayerCache
+
+    now = [1_000.0]
+    cache = OutletLayerCache(tmp_path / "c.sqlite3", ttl_seconds=60, clock=lambda: now[0])
+    cache.put("openai", "gpt-4o-mini", "ownership", "Example Times", LayerScore(0.3, 0.8, "n"))
+
+    hit = cache.get("openai", "gpt-4o-mini", "ownership", "EXAMPLE TIMES")
+    assert hit == LayerScore(0.3, 0.8, "n")
+    assert cache.get("anthropic", "gpt-4o-mini", "ownership", "Example Times") is None
+    assert cache.get("openai", "gpt-4o", "ownership", "Example Times") is None
+    now[0] += 61
+    assert cache.get("openai", "gpt-4o-mini", "ownership", "Example Times") is None
+    assert cache.purge_expired() == 1
+
+
+def test_outlet_cache_config_is_parsed_defensively_and_reused(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.ledger import outlet_cache
+
+    monkeypatch.setattr(outlet_cache, "_CACHES", {})
+    monkeypatch.setenv("LEDGER_OUTLET_CACHE_DB", str(tmp_path / "outlets.sqlite3"))
+    monkeypatch.setenv("LEDGER_OUTLET_CACHE_TTL", "a week")
+    cache = outlet_cache.get_outlet_cache()
+    assert cache is not None and cache._ttl == outlet_cache._DEFAULT_TTL_S
+    assert outlet_cache.get_outlet_cache() is cache
+
+    monkeypatch.setenv("LEDGER_OUTLET_CACHE_TTL", "60")
+    assert outlet_cache.get_outlet_cache() is not cache
+    monkeypatch.setenv("LEDGER_OUTLET_CACHE_TTL", "0")
+    assert outlet_cache.get_outlet_cache() is None
+
+
+def test_ledger_deadline_skips_late_layers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    import yaml
+
+    from app.core import pipeline_service
+    from app.ledger import scoring
+    from app.ledger.models import LayerScore
+
+    release = threading.Event()
+
+    def _fast(article_input: object) -> LayerScore:
+        return LayerScore(score=0.5, confidence=0.8, notes="n")
+
+    def _slow(article_input: object) -> LayerScore:
+        release.wait(5.0)
+        return _fast(article_input)
+
+    for name in ("ownership", "revenue", "editorial", "article_content", "regulatory"):
+        monkeypatch.setattr(scoring, f"analyze_{name}", _fast)
+    monkeypatch.setattr(scoring, "analyze_pattern", _slow)
+    monkeypatch.setattr(pipeline_service, "_DIST", tmp_path / "dist")
+
+    @dataclasses.dataclass
+    class _Input:
+        outlet: str = "test-outlet"
+        id: str = "test-id"
+
+    try:
+        result = scoring.run_integrity_ledger(_Input(), deadline=0.2)
+        output = pipeline_service.run_pipeline(
+            mode="scalpel",
+            story_text="You weren't distracted. You were designed.",
+            ledger_deadline=0.2,
+        )
+    finally:
+        release.set()
+
+    assert result.skipped_layers == ["pattern"]
+    assert result.pattern.confidence is None
+    # Weights of the remaining layers are renormalised, so the total stays 0.5.
+    assert result.total_score == pytest.approx(0.5)
+    assert scoring.run_integrity_ledger(_Input(), deadline=1.0).skipped_layers == []
+
+    with open(output["audit_yaml"], encoding="utf-8") as f:
+        audit = yaml.safe_load(f)["audit"]
+    assert audit["missing_data_disclosure"]["missing_sources"] == ["pattern"]
+    assert audit["internal_audit"]["data_completeness_ok"] is False
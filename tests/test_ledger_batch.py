@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import random
+
+
+def _random_results(count: int) -> list:
+    from app.ledger.models import IntegrityLedgerResult, LayerScore
+
+    rng = random.Random(7)
+    layers = ("ownership", "revenue", "editorial", "article", "regulatory", "pattern")
+    results = []
+    for i in range(count):
+        scores = {}
+        for name in layers:
+            if rng.random() < 0.1:
+                scores[name] = LayerScore(0.0, None, "skipped")
+            else:
+                # Include exact risk-boundary values alongside random ones.
+                score = rng.choice([0.25, 0.5, 0.75, rng.random()])
+                scores[name] = LayerScore(score, rng.random(), "n")
+        results.append(
+            IntegrityLedgerResult(
+                outlet="o",
+                article_id=str(i),
+                total_score=0.0,
+                risk_level="",
+                damage_estimate=None,
+                methodology_version="0.1-alpha",
+                **scores,
+            )
+        )
+    return results
+
+
+def test_batch_scoring_matches_scalar_path() -> None:
+    from app.epistemic.enforcer import aggregate_layer_confidences
+    from app.ledger.batch import LEDGER_LAYERS, ledger_columns, score_ledger_batch
+    from app.ledger.scoring import _categorize, _total_score
+
+    results = _random_results(2000)
+    batch = score_ledger_batch(*ledger_columns(results))
+
+    for i, result in enumerate(results):
+        layers = {name: getattr(result, name) for name in LEDGER_LAYERS}
+        total = _total_score(layers)
+        assert batch.total_scores[i] == total
+        assert batch.risk_levels[i] == _categorize(total)
+        confidences = {name: layer.confidence for name, layer in layers.items()}
+        assert batch.confidences[i] == aggregate_layer_confidences(confidences)
+
+
+def test_batch_scoring_all_layers_skipped_and_custom_weights() -> None:
+    import numpy as np
+
+    from app.ledger.batch import LEDGER_LAYERS, score_ledger_batch
+
+    scores = {name: np.array([0.9, 0.9]) for name in LEDGER_LAYERS}
+    confidences = {name: np.array([np.nan, 0.5]) for name in LEDGER_LAYERS}
+    weights = {name: 0.0 for name in LEDGER_LAYERS} | {"pattern": 1.0}
+
+    batch = score_ledger_batch(scores, confidences, weights=weights)
+    assert batch.total_scores.tolist() == [0.0, 0.9]
+    assert batch.risk_levels.tolist() == ["LOW", "STRUCTURAL"]
+    assert batch.confidences.tolist() == [0.0, 0.5]
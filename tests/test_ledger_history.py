@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_DAY = 24 * 3600.0
+
+
+def _result(outlet: str, pattern: float, confidence: float | None = 0.8):
+    from app.ledger.models import IntegrityLedgerResult, LayerScore
+
+    layer = LayerScore(0.2, 0.6, "n")
+    return IntegrityLedgerResult(
+        outlet=outlet,
+        article_id="a",
+        ownership=layer,
+        revenue=layer,
+        editorial=layer,
+        article=layer,
+        regulatory=layer,
+        pattern=LayerScore(pattern, confidence, "n"),
+        total_score=0.3,
+        risk_level="MODERATE",
+        damage_estimate=None,
+        methodology_version="0.1-alpha",
+    )
+
+
+def test_history_trend_queries(tmp_path: Path) -> None:
+    from app.ledger.history import get_ledger_history
+
+    store = get_ledger_history(tmp_path)
+    now = 1_700_000_000.0
+    store.append(_result("Example Times", 0.9), timestamp=now - 120 * _DAY)
+    store.append(_result("Example Times", 0.4), timestamp=now - 30 * _DAY)
+    store.append(_result("Other Herald", 0.1), timestamp=now - 10 * _DAY)
+    store.append(_result("example  times", 0.6), timestamp=now - 1 * _DAY)
+    store.append(_result("Example Times", 0.0, confidence=None), timestamp=now)
+
+    # A fresh instance reads the same files.
+    store = get_ledger_history(tmp_path)
+    assert len(store) == 5
+    assert store.rows("Example Times").tolist() == [0, 1, 3, 4]
+    # Skipped layers are NaN in their score and confidence columns and left out of means.
+    assert store.trailing_mean("Example Times", "pattern_score", days=90, now=now) == (
+        pytest.approx(0.5)
+    )
+    assert np.isnan(store.values("Example Times", "pattern_score")[-1])
+    assert store.trailing_mean("Example Times", "pattern_confidence", now=now) == 0.8
+    assert store.values("Other Herald", "risk").tolist() == [1]
+    assert store.mean("Unknown Gazette", "total_score") is None
+    with pytest.raises(KeyError):
+        store.values("Example Times", "nonexistent")
+
+
+def test_pipeline_appends_ledger_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.core import pipeline_service
+    from app.ledger.history import get_ledger_history
+
+    monkeypatch.setattr(pipeline_service, "_DIST", tmp_path / "dist")
+
+    for _ in range(2):
+        pipeline_service.run_pipeline(
+            mode="scalpel",
+            story_text="You weren't distracted. You were designed.",
+            target="valet",
+        )
+
+    store = get_ledger_history(tmp_path / "dist")
+    assert len(store.rows("valet")) == 2
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("call_site", "level", "tier"),
+    [
+        ("audit", "CALM", "small"),
+        ("audit", "FOCUSED", "large"),
+        ("audit", "CRITICAL", "large"),
+        ("ledger.ownership", "CRITICAL", "small"),
+        ("ledger.pattern", "FOCUSED", "small"),
+        ("ledger.pattern", "CRITICAL", "large"),
+        ("but_if", "CALM", "large"),
+        ("unknown", None, "large"),
+    ],
+)
+def test_route_by_call_site_and_time_pressure(call_site: str, level: str | None, tier: str) -> None:
+    from app.core.llm_client import route_model
+
+    decision = route_model("openai", call_site, level)
+    assert decision is not None
+    assert decision.tier == tier
+    assert decision.model == {"small": "gpt-4o-mini", "large": "gpt-4o"}[tier]
+
+
+def test_route_overrides_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.core.llm_client import route_model
+
+    monkeypatch.setenv("LLM_ROUTES", "audit=small, ledger.ownership=large")
+    monkeypatch.setenv("ANTHROPIC_MODEL_SMALL", "claude-custom-small")
+
+    assert route_model("anthropic", "audit", "CRITICAL").model == "claude-custom-small"
+    assert route_model("anthropic", "ledger.ownership", "CALM").tier == "large"
+    assert route_model("someprovider", "audit", "CALM") is None
+
+
+def test_call_llm_applies_route_and_logs_latency(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    import app.core.llm_client as llm_mod
+
+    class _Client:
+        model = "default"
+        last_usage = (10, 5)
+
+        def generate(self, system: str, user: str) -> str:
+            self.used_model = self.model
+            return "{}"
+
+    client = _Client()
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setattr(llm_mod, "get_llm_client", lambda: client)
+
+    with caplog.at_level(logging.INFO, logger="app.core.llm_client"):
+        with llm_mod.llm_call_site("audit"), llm_mod.llm_time_pressure("CALM"):
+            llm_mod.call_llm(system_prompt="s", user_prompt="u")
+
+    assert client.used_model == "gpt-4o-mini"
+    assert "site=audit time_pressure=CALM tier=small model=gpt-4o-mini" in caplog.text
+    assert "latency=" in caplog.text
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+
+import pytest
+
+
+@pytest.fixture
+def standin(monkeypatch: pytest.MonkeyPatch) -> Iterator[object]:
+    from app.core.llm_standin import StandinConfig, make_server
+
+    # Every system prompt counts as cacheable so prefix reuse is observable.
+    server = make_server(StandinConfig(latency_ms=5, latency_sigma=0, min_cacheable_tokens=0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("LLM_PROVIDER", "standin")
+    monkeypatch.setenv("LLM_STANDIN_URL", server.url)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_completion_is_deterministic_per_prompt() -> None:
+    from app.core.llm_standin import StandinConfig, build_completion
+
+    config = StandinConfig()
+    first = build_completion("You are a media ownership analyst.", "Outlet: A", config)
+    assert build_completion("You are a media ownership analyst.", "Outlet: A", config) == first
+    data = json.loads(first)
+    assert set(data) == {"score", "confidence", "notes"}
+    assert 0.0 <= data["score"] <= 1.0
+
+
+def test_ledger_layer_round_trips_over_openai_api(standin: object) -> None:
+    from app.core.token_budget import summarize_usage, usage_scope
+    from app.ledger.ownership import analyze_ownership
+
+    with usage_scope() as records:
+        score = analyze_ownership("Example Times")
+
+    assert 0.0 <= score.score <= 1.0
+    assert score.notes.startswith("Stand-in")
+    assert summarize_usage(records)["ledger.ownership"]["estimated"] is False
+
+
+def test_streamed_audit_over_anthropic_api(
+    standin: object, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.core.audit_prompts import _METRIC_DEFINITIONS
+    from app.core.audit_service import run_audit
+
+    monkeypatch.setenv("LLM_STANDIN_API", "anthropic")
+    fields: list[str] = []
+    audit = run_audit(
+        mode="scalpel",
+        story_text="A story about a quarterly filing.",
+        on_field=lambda key, value: fields.append(key),
+    )
+
+    assert fields == ["scores", "chosen_core_distortions", "clinical_recommendation", "episode"]
+    assert set(audit["scores"]) == set(_METRIC_DEFINITIONS)
+    assert len(audit["receipt"]["distortions_display"]) == 3
+    assert standin.stats["streamed"] == 1
+
+
+def test_configured_errors_use_provider_error_shape() -> None:
+    from app.core.llm_standin import StandinConfig, make_server
+
+    server = make_server(StandinConfig(latency_ms=1, error_rate=1.0, error_status=429))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        request = urllib.request.Request(
+            f"{server.url}/v1/messages",
+            data=json.dumps(
+                {"system": "s", "messages": [{"role": "user", "content": "u"}]}
+            ).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(request, timeout=5)
+        assert exc_info.value.code == 429
+        assert json.loads(exc_info.value.read())["error"]["type"] == "rate_limit_error"
+        assert server.stats["errors"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("api", ["openai", "anthropic"])
+def test_audit_system_prompt_is_a_stable_cached_prefix(
+    standin: object, monkeypatch: pytest.MonkeyPatch, api: str
+) -> None:
+    from app.core.audit_service import run_audit
+    from app.core.token_budget import summarize_usage, usage_scope
+
+    monkeypatch.setenv("LLM_STANDIN_API", api)
+    with usage_scope() as records:
+        run_audit(mode="scalpel", story_text="A short story about a late filing.")
+        run_audit(
+            mode="scalpel",
+            story_text=" ".join(["A much longer story about the same filing."] * 400),
+            duration_seconds=30.0,
+        )
+
+    # Different content and time pressure, same system prompt.
+    assert standin.stats["prefix_changes"] == 0
+    assert standin.stats["cache_hits"] == 1
+    assert records[0].cached_input_tokens == 0
+    assert records[1].cached_input_tokens > 0
+    assert (
+        summarize_usage(records)["audit"]["cached_input_tokens"] == records[1].cached_input_tokens
+    )
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+def test_percentile_interpolates() -> None:
+    from app.core.llm_telemetry import percentile
+
+    assert percentile([], 50) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 90) == pytest.approx(3.7)
+
+
+def test_call_llm_records_telemetry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import app.core.llm_client as llm_mod
+    from app.core.llm_telemetry import get_metrics_registry, load_call_records, summarize_calls
+
+    class _Client:
+        model = "default"
+        attempts = 2
+        last_usage = (100, 20)
+        last_cached_tokens = 60
+
+        def generate(self, system: str, user: str) -> str:
+            if user == "fail":
+                raise RuntimeError("provider down")
+            return "{}"
+
+    sink = tmp_path / "telemetry.jsonl"
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("LLM_TELEMETRY_PATH", str(sink))
+    monkeypatch.setattr(llm_mod, "get_llm_client", lambda: _Client())
+    get_metrics_registry().reset()
+
+    with llm_mod.llm_call_site("ledger.pattern"):
+        llm_mod.call_llm(system_prompt="s", user_prompt="u")
+        with pytest.raises(RuntimeError):
+            llm_mod.call_llm(system_prompt="s", user_prompt="fail")
+
+    records = load_call_records(sink)
+    assert [r.error for r in records] == [None, "RuntimeError"]
+    first = records[0]
+    assert (first.call_site, first.provider, first.model) == (
+        "ledger.pattern",
+        "openai",
+        "gpt-4o-mini",
+    )
+    assert (first.input_tokens, first.cached_input_tokens, first.cache) == (100, 60, "hit")
+    assert first.retries == 1
+
+    stage = get_metrics_registry().snapshot()["ledger.pattern"]
+    assert stage == summarize_calls(records)["ledger.pattern"]
+    assert stage["calls"] == 2
+    assert stage["errors"] == 1
+    assert stage["p50_s"] <= stage["p99_s"]
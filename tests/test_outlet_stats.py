@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import statistics
+from pathlib import Path
+
+import pytest
+
+
+def _result(outlet: str, score: float, pattern_confidence: float | None = 0.8):
+    from app.ledger.models import IntegrityLedgerResult, LayerScore
+
+    layer = LayerScore(score, 0.6, "n")
+    return IntegrityLedgerResult(
+        outlet=outlet,
+        article_id="a",
+        ownership=layer,
+        revenue=layer,
+        editorial=layer,
+        article=layer,
+        regulatory=layer,
+        pattern=LayerScore(score, pattern_confidence, "n"),
+        total_score=score,
+        risk_level="LOW",
+        damage_estimate=None,
+        methodology_version="0.1-alpha",
+    )
+
+
+def test_running_stats_match_batch_statistics(tmp_path: Path) -> None:
+    from app.ledger.outlet_stats import get_outlet_stats
+
+    store = get_outlet_stats(tmp_path)
+    scores = [0.2, 0.5, 0.4, 0.9, 0.1]
+    for score in scores:
+        store.update(_result("Example Times", score))
+    store.update(_result("example times", 0.7, pattern_confidence=None))
+
+    stats = get_outlet_stats(tmp_path).get("EXAMPLE TIMES")
+    total = stats["total"]
+    assert total.count == 6
+    assert total.mean == pytest.approx(statistics.mean([*scores, 0.7]))
+    assert total.variance == pytest.approx(statistics.variance([*scores, 0.7]))
+    assert (total.minimum, total.maximum) == (0.1, 0.9)
+    ewma = scores[0]
+    for score in [*scores[1:], 0.7]:
+        ewma += 0.1 * (score - ewma)
+    assert total.ewma == pytest.approx(ewma)
+    # The skipped pattern layer is not counted.
+    assert stats["pattern"].count == 5
+    assert total.zscore(total.mean) == 0.0
+    assert store.get("Other Herald") == {}
+    assert store.outlets() == ["example times"]
+
+
+def test_pipeline_updates_outlet_stats_api(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from fastapi.testclient import TestClient
+
+    from app.api.server import app
+    from app.core import pipeline_service
+
+    monkeypatch.setattr(pipeline_service, "_DIST", tmp_path / "dist")
+    pipeline_service.run_pipeline(
+        mode="scalpel",
+        story_text="You weren't distracted. You were designed.",
+        target="valet",
+    )
+
+    client = TestClient(app)
+    response = client.get("/ledger/stats/Valet")
+    assert response.status_code == 200
+    layers = response.json()["layers"]
+    assert set(layers) == {
+        "ownership",
+        "revenue",
+        "editorial",
+        "article",
+        "regulatory",
+        "pattern",
+        "total",
+    }
+    assert layers["total"]["count"] == 1
+    assert client.get("/ledger/stats/unknown").status_code == 404
+
+
+def test_aborted_runs_are_not_counted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.core import pipeline_service
+    from app.ledger.outlet_stats import get_outlet_stats
+
+    run_audit = pipeline_service.run_audit
+
+    def _audit_with_banned_hook(**kwargs):
+        audit = run_audit(**kwargs)
+        audit["episode"]["hook"] = "This is fraud."
+        return audit
+
+    monkeypatch.setattr(pipeline_service, "_DIST", tmp_path / "dist")
+    monkeypatch.setattr(pipeline_service, "run_audit", _audit_with_banned_hook)
+    with pytest.raises(pipeline_service.DoctrineViolationError):
+        pipeline_service.run_pipeline(
+            mode="scalpel", story_text="A clean story about budgets.", target="valet"
+        )
+    assert get_outlet_stats(tmp_path / "dist").get("valet") == {}
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def _audit(hook: str, chosen: list[str]) -> dict:
+    return {
+        "episode": {"hook": hook, "final_line": ""},
+        "clinical_recommendation": "Verify the numbers before sharing.",
+        "scores": {
+            "fear_appeal": {"score": 4, "why": "Frames the change as an existential threat."}
+        },
+        "chosen_core_distortions": chosen,
+    }
+
+
+def test_profile_scores_recurring_frames(tmp_path: Path) -> None:
+    from app.ledger.pattern_engine import PatternEngine
+
+    engine = PatternEngine(tmp_path)
+    hook = "They want you afraid of the border again"
+    for i in range(2):
+        engine.observe("Example Times", _audit(hook, ["fear_appeal", "scale_distortion", f"m{i}"]))
+    assert engine.score("Example Times") is None
+
+    engine.observe("example times", _audit(hook, ["fear_appeal", "omission", "m2"]))
+    score = engine.score("EXAMPLE TIMES")
+    assert score is not None
+    # fear_appeal recurs in every audit; the later audits repeat all earlier phrasing.
+    assert score.score == pytest.approx(0.5 * 1.0 + 0.5 * (2 / 3))
+    assert "'fear appeal' chosen in 100%" in score.notes
+
+    # A second engine (another process) reads the persisted profile.
+    assert PatternEngine(tmp_path).score("Example Times") == score
+    assert engine.score("Other Herald") is None
+
+
+def _observe_many(root: str, worker: int, count: int) -> None:
+    from app.ledger.pattern_engine import PatternEngine
+
+    engine = PatternEngine(Path(root))
+    for i in range(count):
+        engine.observe("Example Times", _audit(f"hook {worker} {i}", ["fear_appeal"]))
+
+
+def test_concurrent_processes_do_not_lose_observations(tmp_path: Path) -> None:
+    import multiprocessing
+
+    from app.ledger.pattern_engine import PatternEngine
+
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_observe_many, args=(str(tmp_path), w, 10)) for w in range(4)]
+    for proc in workers:
+        proc.start()
+    for proc in workers:
+        proc.join()
+        assert proc.exitcode == 0
+
+    profile = PatternEngine(tmp_path)._load("example times").profile
+    assert profile.audits == 40
+    assert profile.distortion_counts["fear_appeal"] == 40
+
+
+def test_profile_log_is_appended_and_compacted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.ledger import pattern_engine
+    from app.ledger.pattern_engine import PatternEngine
+
+    monkeypatch.setattr(pattern_engine, "_COMPACT_EVERY", 4)
+    writer, reader = PatternEngine(tmp_path), PatternEngine(tmp_path)
+    for i in range(3):
+        writer.observe("Example Times", _audit(f"hook number {i} here", ["fear_appeal"]))
+    (log,) = tmp_path.glob("*.log")
+    # Header and snapshot from the first audit, then one appended line per audit.
+    assert len(log.read_bytes().splitlines()) == 4
+    assert reader.score("Example Times") == writer.score("Example Times")
+
+    for i in range(3, 9):
+        writer.observe("Example Times", _audit(f"hook number {i} here", ["fear_appeal"]))
+    assert len(log.read_bytes().splitlines()) == 2
+    # The reader notices the rewritten log and reloads it from the snapshot.
+    assert reader._load("example times").profile.audits == 9
+    assert reader.score("Example Times") == writer.score("Example Times")
+
+
+def test_analyze_pattern_prefers_local_history(monkeypatch: pytest.MonkeyPatch) -> None:
+    import app.core.llm_client as llm_mod
+    from app.ledger.models import LayerScore
+    from app.ledger.pattern import analyze_pattern
+
+    class _Engine:
+        def __init__(self, result: LayerScore | None) -> None:
+            self.result = result
+
+        def score(self, outlet: str) -> LayerScore | None:
+            return self.result
+
+    class _Input:
+        outlet = "Example Times"
+
+        def __init__(self, engine: _Engine) -> None:
+            self.pattern_engine = engine
+
+    llm_calls: list[str] = []
+
+    def _fake_llm(system_prompt: str, user_prompt: str) -> str:
+        llm_calls.append(user_prompt)
+        return json.dumps({"score": 0.4, "confidence": 0.7, "notes": "llm"})
+
+    monkeypatch.setattr(llm_mod, "call_llm", _fake_llm)
+
+    local = LayerScore(0.6, 0.5, "local")
+    assert analyze_pattern(_Input(_Engine(local))) == local
+    assert llm_calls == []
+
+    assert analyze_pattern(_Input(_Engine(None))).notes == "llm"
+    monkeypatch.setenv("LEDGER_PATTERN_LLM_FALLBACK", "0")
+    assert analyze_pattern(_Input(_Engine(None))).confidence == 0.2
+    assert len(llm_calls) == 1
+
+
+def test_pipeline_feeds_pattern_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.core import pipeline_service
+
+    monkeypatch.setattr(pipeline_service, "_DIST", tmp_path / "dist")
+
+    for _ in range(4):
+        result = pipeline_service.run_pipeline(
+            mode="scalpel",
+            story_text="You weren't distracted. You were designed.",
+            target="valet",
+        )
+
+    ledger = json.loads(Path(result["integrity_ledger_json"]).read_text(encoding="utf-8"))
+    assert ledger["pattern"]["notes"].startswith("Local pattern history over 3 prior audits")
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(config, backend=None, clock=None):
+    from app.core.rate_limiter import RateLimiter, _MemoryBackend
+
+    clock = clock or _FakeClock()
+    return (
+        RateLimiter("openai", config, backend or _MemoryBackend(), clock=clock, sleep=clock.sleep),
+        clock,
+    )
+
+
+def test_requests_per_minute_queues_instead_of_failing() -> None:
+    from app.core.rate_limiter import RateLimitConfig
+
+    limiter, clock = _limiter(RateLimitConfig(2, 100_000, 10))
+    for _ in range(2):
+        limiter.release(limiter.acquire(10), 10)
+    assert clock.sleeps == []
+
+    # Third request must wait ~30s for one request token to refill (2/min).
+    limiter.acquire(10)
+    assert sum(clock.sleeps) == pytest.approx(30.0, abs=0.05)
+
+
+def test_tokens_per_minute_budget_is_enforced() -> None:
+    from app.core.rate_limiter import RateLimitConfig
+
+    limiter, clock = _limiter(RateLimitConfig(1_000, 600, 10))
+    limiter.release(limiter.acquire(600), 600)
+    limiter.acquire(300)
+    # 300 tokens at 600 tokens/min take 30 seconds to refill.
+    assert sum(clock.sleeps) == pytest.approx(30.0, abs=0.05)
+
+
+def test_oversized_call_is_charged_full_budget_not_blocked_forever() -> None:
+    from app.core.rate_limiter import RateLimitConfig
+
+    limiter, _ = _limiter(RateLimitConfig(60, 100, 1))
+    lease = limiter.acquire(10_000, timeout=120.0)
+    assert lease
+
+
+def test_max_in_flight_caps_concurrency() -> None:
+    from app.core.rate_limiter import RateLimitConfig, RateLimiter, _MemoryBackend
+
+    limiter = RateLimiter("openai", RateLimitConfig(10_000, 10_000_000, 2), _MemoryBackend())
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    gate = threading.Event()
+
+    def _worker() -> None:
+        nonlocal active, peak
+        with limiter.slot(1):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            gate.wait(0.05)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=_worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak <= 2
+
+
+def test_acquire_times_out_when_slots_are_held() -> None:
+    from app.core.rate_limiter import RateLimitConfig
+
+    limiter, _ = _limiter(RateLimitConfig(60, 1_000, 1))
+    limiter.acquire(1)
+    with pytest.raises(TimeoutError):
+        limiter.acquire(1, timeout=1.0)
+
+
+def test_sqlite_backend_shares_buckets_between_limiters(tmp_path: Path) -> None:
+    from app.core.rate_limiter import RateLimitConfig, _SQLiteBackend
+
+    db = tmp_path / "limits.sqlite3"
+    clock = _FakeClock()
+    config = RateLimitConfig(60, 100_000, 1)
+    # Two backends on one file stand in for two worker processes.
+    first, _ = _limiter(config, _SQLiteBackend(db), clock)
+    second, _ = _limiter(config, _SQLiteBackend(db), clock)
+
+    lease = first.acquire(1)
+    with pytest.raises(TimeoutError):
+        second.acquire(1, timeout=0.5)
+    first.release(lease, 1)
+    assert second.acquire(1, timeout=0.5)
+
+
+def test_release_corrects_bucket_with_actual_usage() -> None:
+    from app.core.rate_limiter import RateLimitConfig, _MemoryBackend
+
+    backend = _MemoryBackend()
+    limiter, clock = _limiter(RateLimitConfig(1_000, 1_000, 4), backend)
+    lease = limiter.acquire(100)
+    limiter.release(lease, reserved_tokens=100, used_tokens=700)
+    # 1000 - 700 = 300 tokens left; a 600-token call waits for 300 tokens (18s).
+    limiter.acquire(600)
+    assert sum(clock.sleeps) == pytest.approx(18.0, abs=0.05)
+
+
+def test_config_env_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.core.rate_limiter import load_rate_limit_config
+
+    monkeypatch.setenv("LLM_RPM", "30")
+    monkeypatch.setenv("ANTHROPIC_MAX_IN_FLIGHT", "7")
+    config = load_rate_limit_config("anthropic")
+    assert config.requests_per_minute == 30.0
+    assert config.max_in_flight == 7
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+
+def test_font_registry_loads_each_font_once() -> None:
+    from app.render.fonts import get_font
+
+    get_font.cache_clear()
+    bold = get_font("sans", 44, "bold")
+    assert get_font("sans", 44, "bold") is bold
+    assert get_font("sans", 44) is not bold
+    assert get_font("sans", 30, "bold") is not bold
+    info = get_font.cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+
+
+def test_font_registry_falls_back_to_default_font() -> None:
+    from PIL import ImageFont
+
+    from app.render.fonts import get_font
+
+    assert isinstance(get_font("no-such-family", 20), ImageFont.ImageFont | ImageFont.FreeTypeFont)
+
+
+def _audit() -> dict:
+    from app.core.audit_service import run_audit
+
+    story = Path(__file__).parent.parent / "fixtures" / "stories" / "01-designed.txt"
+    return run_audit(mode="scalpel", story_text=story.read_text(encoding="utf-8"))
+
+
+def test_receipt_template_is_shared_and_strip_survives_long_text(tmp_path: Path) -> None:
+    from PIL import Image
+
+    from app.render.receipt import _HONESTY_BOX, _HONESTY_Y, _template, render_receipt_from_audit
+
+    audit = _audit()
+    audit["receipt"]["clinical_recommendation"] = "Reassess the disclosure timeline. " * 20
+    before = _template().tobytes()
+    _, png = render_receipt_from_audit(audit, tmp_path)
+
+    assert _template().tobytes() == before
+    # The overflowing discharge text is painted over by the strip, as before the template.
+    (left, top), (right, _) = _HONESTY_BOX
+    header = (left, top, right + 1, _HONESTY_Y + 30)
+    with Image.open(png) as img:
+        assert img.crop(header).tobytes() == _template().crop(header).tobytes()
+
+
+def _legacy_wrap(text: str, font, width: int) -> list[str]:
+    from PIL import Image, ImageDraw
+
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    line = ""
+    lines: list[str] = []
+    for w in text.split():
+        test = (line + " " + w).strip()
+        if draw.textbbox((0, 0), test, font=font)[2] > width and line:
+            lines.append(line)
+            line = w
+        else:
+            line = test
+    if line:
+        lines.append(line)
+    return lines
+
+
+def test_wrap_text_matches_per_word_measurement() -> None:
+    from app.render.fonts import get_font
+    from app.render.layout import wrap_text
+
+    rng = random.Random(5)
+    vocab = "a I we the audit AVAILABLE disclosure W—W “quoted” 1,204 $3.5m mmmmmmmmmmmmmmm".split()
+    for _ in range(200):
+        font = get_font("sans", rng.choice([22, 32, 44]), rng.choice(["regular", "bold"]))
+        width = rng.choice([80, 300, 640])
+        text = " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 40)))
+        assert list(wrap_text(text, font, width)) == _legacy_wrap(text, font, width)
+    assert wrap_text(text, font, width) is wrap_text(text, font, width)
+
+
+def test_video_uses_in_memory_receipt_frame(tmp_path: Path) -> None:
+    import numpy as np
+    from PIL import Image
+
+    from app.render.receipt import render_receipt
+    from app.render.video import render_video_from_audit
+
+    audit = _audit()
+    rendered = render_receipt(audit, tmp_path / "receipt")
+    with Image.open(rendered.image_path) as img:
+        assert np.array_equal(np.array(img), rendered.frame)
+
+    # receipt.png is not read when the frame is handed over.
+    rendered.image_path.unlink()
+    audit["episode"]["shots"] = audit["episode"]["shots"][:1]
+    video = render_video_from_audit(
+        audit, rendered.image_path, tmp_path / "video", receipt_frame=rendered.frame
+    )
+    assert video.stat().st_size > 0
+
+
+def test_receipt_encodings_are_lossless(tmp_path: Path) -> None:
+    import numpy as np
+    from PIL import Image
+
+    from app.render.encoding import get_encoding
+    from app.render.receipt import render_receipt
+
+    audit = _audit()
+    for name, suffix in (("fast", ".png"), ("default", ".png"), ("webp", ".webp")):
+        rendered = render_receipt(audit, tmp_path / name, get_encoding(name))
+        assert rendered.image_path == tmp_path / name / f"receipt{suffix}"
+        with Image.open(rendered.image_path) as img:
+            assert np.array_equal(np.asarray(img.convert("RGB")), rendered.frame)
+
+
+def test_unknown_receipt_encoding_fails_before_the_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.core import pipeline_service
+
+    monkeypatch.setattr(pipeline_service, "_DIST", tmp_path / "dist")
+    with pytest.raises(ValueError, match="Unknown image encoding"):
+        pipeline_service.run_pipeline(
+            mode="scalpel", story_text="A clean story.", receipt_encoding="gif"
+        )
+    assert not (tmp_path / "dist").exists()
+
+
+def test_receipt_from_audit_keeps_pillow_png_defaults(tmp_path: Path) -> None:
+    import io
+
+    from app.render.receipt import draw_receipt, render_receipt_from_audit
+
+    audit = _audit()
+    _, image_path = render_receipt_from_audit(audit, tmp_path)
+    expected = io.BytesIO()
+    draw_receipt(audit).save(expected, "PNG")
+    assert image_path.read_bytes() == expected.getvalue()
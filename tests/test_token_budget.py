@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+
+_LONG_STORY = " ".join(f"Sentence number {i} describes the quarterly filing." for i in range(3000))
+
+
+def test_fit_to_budget_leaves_small_text_unchanged() -> None:
+    from app.core.token_budget import fit_to_budget
+
+    text = "Short text.\n\n\n  With   spacing."
+    assert fit_to_budget(text, 1000) == text
+
+
+def test_fit_to_budget_trims_middle_and_keeps_ends() -> None:
+    from app.core.token_budget import estimate_tokens, fit_to_budget
+
+    trimmed = fit_to_budget(_LONG_STORY, 500)
+    assert estimate_tokens(trimmed) <= 500
+    assert trimmed.startswith("Sentence number 0 ")
+    assert trimmed.endswith("Sentence number 2999 describes the quarterly filing.")
+    assert "characters omitted for length" in trimmed
+
+
+def test_budget_shrinks_with_time_pressure() -> None:
+    from app.core.token_budget import budget_for
+
+    levels = ["CALM", "FOCUSED", "PRESSURED", "CRITICAL"]
+    story_budgets = [budget_for(level).story_tokens for level in levels]
+    assert story_budgets == sorted(story_budgets, reverse=True)
+    # Governance stays constant so the prompt prefix is stable across levels.
+    assert len({budget_for(level).governance_tokens for level in levels}) == 1
+
+
+def test_audit_prompt_respects_critical_budget() -> None:
+    from app.core.audit_prompts import build_audit_user_prompt
+    from app.core.token_budget import budget_for, estimate_tokens
+
+    prompt = build_audit_user_prompt(
+        story_text=_LONG_STORY,
+        duration_seconds=None,
+        time_pressure_note="Pick one thing.",
+        time_pressure_level="CRITICAL",
+    )
+    # Story budget plus the fixed instructions/schema scaffold.
+    assert estimate_tokens(prompt) < budget_for("CRITICAL").story_tokens + 1500
+    assert "distortion metrics" in prompt
+
+
+def test_call_llm_records_usage_per_call_site(monkeypatch: pytest.MonkeyPatch) -> None:
+    import app.core.llm_client as llm_mod
+    from app.core.token_budget import summarize_usage, usage_scope
+
+    class _FakeClient:
+        last_usage = None
+
+        def generate(self, system: str, user: str) -> str:
+            self.last_usage = (120, 30)
+            return '{"ok": true}'
+
+    class _UnmeteredClient:
+        def generate(self, system: str, user: str) -> str:
+            return "x" * 40
+
+    clients = iter([_FakeClient(), _FakeClient(), _UnmeteredClient()])
+    monkeypatch.setattr(llm_mod, "get_llm_client", lambda: next(clients))
+
+    with usage_scope() as records:
+        with llm_mod.llm_call_site("audit"):
+            llm_mod.call_llm(system_prompt="s", user_prompt="u")
+        with llm_mod.llm_call_site("ledger.pattern"):
+            llm_mod.call_llm(system_prompt="s", user_prompt="u")
+            llm_mod.call_llm(system_prompt="s", user_prompt="u")
+
+    summary = summarize_usage(records)
+    assert summary["audit"] == {
+        "calls": 1,
+        "input_tokens": 120,
+        "cached_input_tokens": 0,
+        "output_tokens": 30,
+        "estimated": False,
+    }
+    assert summary["ledger.pattern"]["calls"] == 2
+    assert summary["ledger.pattern"]["output_tokens"] == 30 + 10
+    assert summary["ledger.pattern"]["estimated"] is True
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import random
+import re
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.doctrine.guard import check_doctrine, enforce_language_constraints  # noqa: E402
+from app.doctrine.patterns import DoctrinePatternSet, current_pattern_set  # noqa: E402
+
+_DEFAULT_BASELINE = Path(__file__).resolve().parent / "bench_doctrine_baseline.json"
+
+_FILLER = (
+    "so the committee met again on tuesday and the senator said the budget numbers "
+    "were not final yet and that the report would come out after the vote which "
+    "reporters said could slip into next week depending on the schedule"
+).split()
+# Phrases that match, including the inflections the \w* patterns exist to catch.
+_HITS = [
+    "corrupt",
+    "corruptly",
+    "corruption",
+    "illegally",
+    "criminality",
+    "fraudulent",
+    "bribery",
+    "intended to",
+    "intent",
+    "guiltily",
+    "proof of",
+    "morally",
+    "immorality",
+    "unethically",
+    "conflict of interest",
+    "rigged",
+    "shady",
+    "schemes",
+    "dishonest",
+    "lying",
+    "manipulated",
+    "manipulative",
+    "cover-up",
+    "coverup",
+    "hiding",
+    "secretly",
+    "pay off",
+    "kickback",
+    "sell-out",
+    "puppet",
+    "exploitative",
+]
+# Words that start like a pattern but do not match it; they cost a verification.
+_NEAR_MISSES = [
+    "intention",
+    "interest",
+    "coverage",
+    "covered",
+    "hidden",
+    "exploration",
+    "criminology",
+    "payment",
+    "selling",
+    "pawnshop",
+    "illegible",
+    "guiding",
+    "moral",
+    "scheming",
+]
+
+
+def synthetic_text(size: int, density: float, seed: int = 0) -> str:
+    """A transcript-like text of about *size* characters.
+
+    *density* is the share of words drawn from matching phrases; an equal
+    share are near misses.  Some words are capitalised and punctuated.
+    """
+    rng = random.Random(seed)
+    words: list[str] = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < density:
+            word = rng.choice(_HITS)
+        elif roll < 2 * density:
+            word = rng.choice(_NEAR_MISSES)
+        else:
+            word = rng.choice(_FILLER)
+        if rng.random() < 0.05:
+            word = word.capitalize() + rng.choice([".", ",", "?"])
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def _legacy_scan(text: str, patterns: DoctrinePatternSet) -> tuple[list, list]:
+    """The former per-pattern scan over *patterns*: one finditer pass per pattern."""
+    out: tuple[list, list] = ([], [])
+    for bucket, group in zip(out, (patterns.banned, patterns.loaded), strict=True):
+        for pattern in group:
+            regex = re.compile(pattern, re.IGNORECASE)
+            bucket.extend((pattern, m.group(), m.start()) for m in regex.finditer(text))
+    return out
+
+
+def _current_scan(text: str, patterns: DoctrinePatternSet) -> tuple[list, list]:
+    result = enforce_language_constraints(text, patterns)
+    return (
+        [(v.phrase_pattern, v.matched_text, v.position) for v in result.violations],
+        [(v.phrase_pattern, v.matched_text, v.position) for v in result.loaded_modifier_warnings],
+    )
+
+
+def _best_of(fn: Callable[[str], object], text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_suite(
+    sizes: list[int], densities: list[float], repeat: int, seed: int, verify: bool
+) -> dict:
+    """Time both guard entry points over every size × density; keyed ``function/size/density``."""
+    # One set for the whole run, as the pipeline does; a reload cannot split the suite.
+    patterns = current_pattern_set()
+    cases: dict[str, dict] = {}
+    for size in sizes:
+        for density in densities:
+            text = synthetic_text(size, density, seed)
+            banned, loaded = _current_scan(text, patterns)
+            if verify and (banned, loaded) != _legacy_scan(text, patterns):
+                sys.exit(f"Scanner output differs from per-pattern scan ({size=}, {density=})")
+            for name, fn, matches in (
+                ("check_doctrine", check_doctrine, len(banned)),
+                (
+                    "enforce_language_constraints",
+                    enforce_language_constraints,
+                    len(banned) + len(loaded),
+                ),
+            ):
+                seconds = _best_of(functools.partial(fn, patterns=patterns), text, repeat)
+                cases[f"{name}/{size}/{density:g}"] = {
+                    "chars": len(text),
+                    "matches": matches,
+                    "seconds": seconds,
+                    "mb_per_s": len(text) / seconds / 1e6,
+                    "matches_per_s": matches / seconds,
+                }
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": seed,
+        "repeat": repeat,
+        "patterns_version": patterns.version,
+        "cases": cases,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Record each case's MB/s against *baseline*; return the ones below ``1 - tolerance``."""
+    regressions = []
+    for key, case in results["cases"].items():
+        base = baseline.get("cases", {}).get(key)
+        if base is None:
+            continue
+        ratio = case["mb_per_s"] / base["mb_per_s"]
+        case["vs_baseline"] = ratio
+        if ratio < 1 - tolerance:
+            regressions.append(f"{key}: {ratio:.2f}x baseline MB/s")
+    return regressions
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description=(
+            "Benchmark the doctrine guard on synthetic transcripts of controlled size and "
+            "match density, and compare against a stored baseline."
+        )
+    )
+    p.add_argument(
+        "--sizes",
+        default="10000,1000000",
+        help="Comma-separated transcript sizes in characters.",
+    )
+    p.add_argument(
+        "--densities",
+        default="0,0.002,0.02",
+        help="Comma-separated shares of words that match.",
+    )
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check the scanner output against a per-pattern regex scan.",
+    )
+    p.add_argument("--output", "-o", type=Path, help="Write the results as JSON.")
+    p.add_argument("--baseline", type=Path, default=_DEFAULT_BASELINE)
+    p.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store these results as the baseline instead of comparing.",
+    )
+    p.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed MB/s drop below the baseline before failing (default: 0.25).",
+    )
+    args = p.parse_args()
+
+    results = run_suite(
+        [int(s) for s in args.sizes.split(",")],
+        [float(d) for d in args.densities.split(",")],
+        args.repeat,
+        args.seed,
+        args.verify,
+    )
+    regressions: list[str] = []
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+
+    print(f"{'case':<44}  {'matches':>8}  {'MB/s':>7}  {'matches/s':>10}  vs baseline")
+    for key, case in results["cases"].items():
+        ratio = case.get("vs_baseline")
+        print(
+            f"{key:<44}  {case['matches']:>8}  {case['mb_per_s']:>7.1f}  "
+            f"{case['matches_per_s']:>10,.0f}  {f'{ratio:.2f}x' if ratio else '-'}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if regressions:
+        sys.exit("Slower than baseline:\n  " + "\n  ".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.audit_service import run_audit  # noqa: E402
+from app.render.encoding import ENCODINGS, get_encoding  # noqa: E402
+from app.render.receipt import draw_receipt  # noqa: E402
+
+_STORIES = Path(__file__).resolve().parent.parent / "fixtures" / "stories"
+
+
+def _encode(img: Image.Image, fmt: str, options: dict, repeat: int) -> tuple[float, bytes]:
+    best = float("inf")
+    for _ in range(repeat):
+        buf = io.BytesIO()
+        start = time.perf_counter()
+        img.save(buf, fmt, **options)
+        best = min(best, time.perf_counter() - start)
+    return best, buf.getvalue()
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description="Encode the receipt of every fixture story with each encoding preset."
+    )
+    p.add_argument("--stories", type=Path, default=_STORIES, help="Directory of .txt stories.")
+    p.add_argument(
+        "--encodings",
+        default=",".join(ENCODINGS),
+        help="Comma-separated preset names (default: all).",
+    )
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--output", "-o", type=Path, help="Write the results as JSON.")
+    args = p.parse_args()
+
+    images = [
+        draw_receipt(run_audit(mode="scalpel", story_text=path.read_text(encoding="utf-8")))
+        for path in sorted(args.stories.glob("*.txt"))
+    ]
+    if not images:
+        sys.exit(f"No .txt stories in {args.stories}")
+
+    results: dict[str, dict] = {}
+    for name in args.encodings.split(","):
+        try:
+            encoding = get_encoding(name)
+        except ValueError as exc:
+            print(f"skipping {name}: {exc}", file=sys.stderr)
+            continue
+        seconds = size = 0.0
+        for img in images:
+            elapsed, data = _encode(img, encoding.format, dict(encoding.options), args.repeat)
+            with Image.open(io.BytesIO(data)) as decoded:
+                if not np.array_equal(np.asarray(decoded.convert("RGB")), np.asarray(img)):
+                    sys.exit(f"{name} is not lossless")
+            seconds += elapsed
+            size += len(data)
+        results[name] = {
+            "encode_ms": seconds / len(images) * 1e3,
+            "kib": size / len(images) / 1024,
+        }
+
+    reference = results.get("default")
+    print(f"{len(images)} receipts")
+    print(f"{'encoding':<10}  {'encode ms':>9}  {'KiB':>7}  vs default (time / size)")
+    for name, row in results.items():
+        vs = "-"
+        if reference:
+            time_ratio = row["encode_ms"] / reference["encode_ms"]
+            vs = f"{time_ratio:.2f}x / {row['kib'] / reference['kib']:.2f}x"
+        print(f"{name:<10}  {row['encode_ms']:>9.1f}  {row['kib']:>7.1f}  {vs}")
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.doctrine.guard import CorpusCheckStats, check_corpus  # noqa: E402
+
+
+def _ndjson_records(path: str) -> Iterator[tuple[str, str, str]]:
+    """``{"id", "surface", "text"}`` objects, one per line; ``-`` reads stdin."""
+    fh = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in fh:
+            if line.strip():
+                row = json.loads(line)
+                yield str(row["id"]), str(row.get("surface", "")), str(row["text"])
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+
+
+def _dist_records(dist: Path) -> Iterator[tuple[str, str, str]]:
+    """Every publish surface of every published audit under *dist* (``<slug>/audit.yaml``)."""
+    import yaml
+
+    from app.core.pipeline_service import _collect_publish_surfaces
+
+    for audit_yaml in sorted(dist.glob("*/audit.yaml")):
+        audit = (yaml.safe_load(audit_yaml.read_text(encoding="utf-8")) or {}).get("audit", {})
+        for surface, text in _collect_publish_surfaces(audit).items():
+            if text:
+                yield audit_yaml.parent.name, surface, text
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description=(
+            "Re-check archived publish surfaces against the doctrine patterns. "
+            "Findings are written as NDJSON; throughput goes to stderr."
+        )
+    )
+    src = p.add_mutually_exclusive_group(required=True)
+    src.add_argument("--input", "-i", help="NDJSON file of {id, surface, text} records, or '-'.")
+    src.add_argument("--dist", type=Path, help="Output root holding <slug>/audit.yaml files.")
+    p.add_argument("--output", "-o", default="-", help="NDJSON output file (default: stdout).")
+    p.add_argument("--workers", "-j", type=int, default=None, help="Worker processes.")
+    p.add_argument("--batch-size", type=int, default=256)
+    p.add_argument("--warnings", action="store_true", help="Also emit loaded-modifier warnings.")
+    args = p.parse_args()
+
+    records = _ndjson_records(args.input) if args.input else _dist_records(args.dist)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    stats = CorpusCheckStats()
+    try:
+        for finding in check_corpus(records, args.workers, args.batch_size, stats):
+            if finding.severity == "violation" or args.warnings:
+                out.write(json.dumps(dataclasses.asdict(finding), ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(
+        f"{stats.records} records, {stats.chars / 1e6:.1f} MB in {stats.elapsed:.2f}s "
+        f"({stats.records_per_second:,.0f} records/s, {stats.mb_per_second:.1f} MB/s); "
+        f"{stats.violations} violations, {stats.warnings} warnings",
+        file=sys.stderr,
+    )
+    if stats.violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.llm_standin import StandinConfig, make_server  # noqa: E402
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description="Serve a local OpenAI/Anthropic-compatible LLM stand-in for load testing."
+    )
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency-ms", type=float, default=800.0, help="Median request latency.")
+    p.add_argument(
+        "--latency-sigma",
+        type=float,
+        default=0.35,
+        help="Log-normal sigma of the latency distribution (0 = fixed latency).",
+    )
+    p.add_argument(
+        "--small-model-latency-factor",
+        type=float,
+        default=0.4,
+        help="Latency multiplier for small-tier models (e.g. standin-small).",
+    )
+    p.add_argument(
+        "--first-token-share",
+        type=float,
+        default=0.3,
+        help="Streaming: share of the latency spent before the first chunk.",
+    )
+    p.add_argument("--error-rate", type=float, default=0.0, help="Probability of a failed request.")
+    p.add_argument("--error-status", type=int, default=500, choices=[429, 500, 503, 529])
+    p.add_argument(
+        "--extra-output-tokens",
+        type=int,
+        default=0,
+        help="Filler tokens added to every completion.",
+    )
+    p.add_argument(
+        "--min-cacheable-tokens",
+        type=int,
+        default=1024,
+        help="Shortest system prompt reported as a prompt-cache hit.",
+    )
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    config = StandinConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        small_model_latency_factor=args.small_model_latency_factor,
+        first_token_share=args.first_token_share,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        extra_output_tokens=args.extra_output_tokens,
+        min_cacheable_tokens=args.min_cacheable_tokens,
+        seed=args.seed,
+    )
+    server = make_server(config, host=args.host, port=args.port)
+    print(f"LLM stand-in listening on {server.url} (stats: {server.url}/stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.llm_telemetry import load_call_records, summarize_calls  # noqa: E402
+
+# (summary key, format spec); each column is as wide as its heading.
+_COLUMNS = [
+    ("calls", "d"),
+    ("errors", "d"),
+    ("retries", "d"),
+    ("p50_s", ".2f"),
+    ("p90_s", ".2f"),
+    ("p99_s", ".2f"),
+    ("input_tokens", "d"),
+    ("output_tokens", "d"),
+    ("cached_input_tokens", "d"),
+]
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Summarise LLM call telemetry per call site.")
+    p.add_argument(
+        "path",
+        nargs="?",
+        default=os.environ.get("LLM_TELEMETRY_PATH"),
+        help="JSONL telemetry file (default: $LLM_TELEMETRY_PATH)",
+    )
+    p.add_argument("--since", type=float, default=None, help="Only calls from the last N seconds.")
+    p.add_argument("--provider", default=None)
+    p.add_argument("--json", action="store_true", help="Print the summary as JSON.")
+    args = p.parse_args()
+
+    if not args.path:
+        p.error("no telemetry file given and LLM_TELEMETRY_PATH is not set")
+    records = load_call_records(Path(args.path))
+    if args.since is not None:
+        cutoff = time.time() - args.since
+        records = [r for r in records if r.timestamp >= cutoff]
+    if args.provider:
+        records = [r for r in records if r.provider == args.provider]
+    summary = summarize_calls(records)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    width = max([len("call_site"), *(len(site) for site in summary)])
+    print(f"{'call_site':<{width}}  " + "  ".join(name for name, _ in _COLUMNS) + "  cache_hit")
+    for site, stage in summary.items():
+        cells = "  ".join(f"{stage[name]:>{len(name)}{spec}}" for name, spec in _COLUMNS)
+        hit_rate = stage["cache_hit_rate"]
+        hits = f"{hit_rate:>9.0%}" if hit_rate is not None else f"{'-':>9}"
+        print(f"{site:<{width}}  {cells}  {hits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,16 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from app.core.pipeline_service import run_pipeline  # noqa: E402
+from app.render.encoding import ENCODINGS  # noqa: E402
+
+
+def _print_audit_field(key: str, value: Any) -> None:
+    print(json.dumps({key: value}, ensure_ascii=False), file=sys.stderr, flush=True)
 
 
 def main() -> None:
@@ -27,6 +33,25 @@ def main() -> None:
         ),
     )
     p.add_argument("--target", default=None)
+    p.add_argument(
+        "--draft",
+        action="store_true",
+        help="Encode the receipt for speed (the 'fast' PNG preset).",
+    )
+    p.add_argument(
+        "--receipt-encoding",
+        choices=sorted(ENCODINGS),
+        default=None,
+        help="Receipt image encoding preset; overrides --draft.",
+    )
+    p.add_argument(
+        "--progress",
+        action="store_true",
+        help=(
+            "Stream the LLM audit and print each field to stderr as a JSON line as soon as "
+            "it arrives, before the ledger and renders finish."
+        ),
+    )
     args = p.parse_args()
 
     if args.file:
@@ -34,7 +59,14 @@ def main() -> None:
     else:
         story = args.text.strip()
 
-    result = run_pipeline(mode=args.mode, story_text=story, target=args.target)
+    result = run_pipeline(
+        mode=args.mode,
+        story_text=story,
+        target=args.target,
+        draft=args.draft,
+        receipt_encoding=args.receipt_encoding,
+        on_audit_field=_print_audit_field if args.progress else None,
+    )
     print(json.dumps(result, indent=2))
 
 